@@ -0,0 +1,190 @@
+"""
+Benchmarks of the hot paths of pychord.
+
+Run from the repository root::
+
+    python benchmarks/run.py                          # print timings
+    python benchmarks/run.py --save baseline.json     # store a baseline
+    python benchmarks/run.py --compare baseline.json  # flag regressions
+
+With ``--compare``, the exit status is 1 if any benchmark is slower
+than the baseline by more than ``--tolerance`` (20% by default).
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pychord import Chord, ChordProgression, QualityManager  # noqa: E402
+from pychord.analyzer import find_chords_from_notes  # noqa: E402
+from pychord.parser import (  # noqa: E402
+    DEFAULT_PARSE_CACHE_SIZE,
+    parse,
+    set_parse_cache_size,
+)
+
+QUALITIES = list(QualityManager().get_qualities())
+ROOTS = ["C", "Db", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B"]
+CHORD_NAMES = [f"{root}{q}" for root in ROOTS for q in QUALITIES]
+CHORDS = [Chord(name) for name in CHORD_NAMES]
+PROGRESSION = ["C", "Am7", "Dm7", "G7", "Em7/B", "A7", "Dm9", "G13", "Cmaj7"] * 100
+CHORD_PROGRESSION = ChordProgression(PROGRESSION)
+NOTES = {
+    2: ["C", "G"],
+    3: ["E", "G", "C"],
+    4: ["F#", "A", "C", "E"],
+    5: ["C", "E", "G", "B", "A"],
+    6: ["G", "B", "D", "F", "A", "C"],
+    7: ["A", "C#", "E", "G", "B", "D", "F#"],
+}
+
+
+def bench_parse_uncached() -> None:
+    set_parse_cache_size(0)
+    try:
+        for name in CHORD_NAMES:
+            parse(name)
+    finally:
+        set_parse_cache_size(DEFAULT_PARSE_CACHE_SIZE)
+
+
+def bench_parse_cached() -> None:
+    for name in CHORD_NAMES:
+        parse(name)
+
+
+def bench_chord_init() -> None:
+    for name in CHORD_NAMES:
+        Chord(name)
+
+
+def bench_chord_transpose() -> None:
+    for chord in CHORDS:
+        chord.transpose(5)
+        chord.transpose(-5)
+
+
+def bench_chord_transposed() -> None:
+    for chord in CHORDS:
+        chord.transposed(5)
+
+
+def bench_components() -> None:
+    for chord in CHORDS:
+        chord.components()
+
+
+def bench_components_pitch() -> None:
+    for chord in CHORDS:
+        chord.components(visible=False)
+
+
+def bench_components_with_pitch() -> None:
+    for chord in CHORDS:
+        chord.components_with_pitch(4)
+
+
+def bench_progression_transpose() -> None:
+    for trans in range(1, 12):
+        CHORD_PROGRESSION.transpose(trans)
+
+
+def bench_from_note_index_diatonic() -> None:
+    for scale in ["Cmaj", "Amin", "F#Dor", "EbLyd"]:
+        for note in range(1, 8):
+            Chord.from_note_index(note, "", scale, diatonic=True)
+            Chord.from_note_index(note, "7", scale, diatonic=True)
+
+
+def _find_chords(n: int) -> Callable[[], None]:
+    notes = NOTES[n]
+
+    def bench() -> None:
+        for _ in range(100):
+            find_chords_from_notes(notes)
+
+    bench.__name__ = f"bench_find_chords_{n}_notes"
+    return bench
+
+
+BENCHMARKS: list[Callable[[], None]] = [
+    bench_parse_uncached,
+    bench_parse_cached,
+    bench_chord_init,
+    bench_chord_transpose,
+    bench_chord_transposed,
+    bench_components,
+    bench_components_pitch,
+    bench_components_with_pitch,
+    bench_progression_transpose,
+    bench_from_note_index_diatonic,
+] + [_find_chords(n) for n in sorted(NOTES)]
+
+
+def run(number: int, repeat: int, pattern: str) -> dict[str, float]:
+    """Return the best time in seconds of each benchmark"""
+    results = {}
+    for bench in BENCHMARKS:
+        name = bench.__name__[len("bench_") :]
+        if pattern not in name:
+            continue
+        times = timeit.repeat(bench, number=number, repeat=repeat)
+        results[name] = min(times) / number
+    return results
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], tolerance: float
+) -> list[str]:
+    """Print a comparison with a baseline and return the regressed benchmarks"""
+    regressions = []
+    for name, seconds in results.items():
+        if name not in baseline:
+            print(f"{name:32} {seconds * 1e3:10.3f} ms  (no baseline)")
+            continue
+        ratio = seconds / baseline[name]
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:32} {seconds * 1e3:10.3f} ms  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--number", type=int, default=5, help="calls per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timings")
+    parser.add_argument("-k", default="", help="only run benchmarks matching this")
+    parser.add_argument("--save", metavar="PATH", help="store results as baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = run(args.number, args.repeat, args.k)
+    status = 0
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(
+                f"{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}"
+            )
+            status = 1
+    else:
+        for name, seconds in results.items():
+            print(f"{name:32} {seconds * 1e3:10.3f} ms")
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,13 @@
-from .analyzer import find_chords_from_notes
-from .chord import Chord
-from .progression import ChordProgression
-from .quality import Quality, QualityManager
+import importlib as _importlib
+
+# Avoids importing typing, type checkers treat it as typing.TYPE_CHECKING
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .analyzer import find_chords_from_notes
+    from .chord import Chord
+    from .progression import ChordProgression
+    from .quality import Quality, QualityManager, QualityRegistry, use_registry
+del TYPE_CHECKING
 
 __all__ = [
     "find_chords_from_notes",
@@ -9,4 +15,31 @@ __all__ = [
     "ChordProgression",
     "Quality",
     "QualityManager",
+    "QualityRegistry",
+    "use_registry",
 ]
+
+# Modules defining the public names, imported on first access so that
+# importing pychord stays cheap.
+_LAZY_ATTRIBUTES = {
+    "find_chords_from_notes": "analyzer",
+    "Chord": "chord",
+    "ChordProgression": "progression",
+    "Quality": "quality",
+    "QualityManager": "quality",
+    "QualityRegistry": "quality",
+    "use_registry": "quality",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
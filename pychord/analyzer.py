@@ -1,33 +1,80 @@
+from . import metrics
 from .chord import Chord
-from .quality import QualityManager
-from .utils import note_to_val
+from .quality import Quality, QualityRegistry, get_registry, pitch_classes_to_mask
+from .utils import note_to_code, note_to_val
 
 
-def find_chords_from_notes(notes: list[str]) -> list[Chord]:
+def find_chords_from_notes(
+    notes: list[str], ordered: bool = True, registry: QualityRegistry | None = None
+) -> list[Chord]:
     """
     Find possible chords consisting of the given notes.
 
     :param notes: List of notes arranged from lower note, e.g. ``["C", "Eb", "G"]``.
+    :param ordered: If ``False``, the order of the notes above the lowest one
+        is ignored, and every chord with the same set of pitch classes is returned.
+    :param registry: Qualities to use, defaults to :func:`pychord.quality.get_registry`.
     """
+    if metrics.enabled:
+        return metrics.timed(
+            "find_chords", tuple(notes), _find_chords, notes, ordered, registry
+        )
+    return _find_chords(notes, ordered, registry)
+
+
+def _find_chords(
+    notes: list[str], ordered: bool, registry: QualityRegistry | None
+) -> list[Chord]:
     if not notes:
         raise ValueError("Please specify notes which consist a chord.")
+    # Notes are spelled as note codes only for the chords found, so notes
+    # with more than two accidentals are an error only if a chord uses them.
+    values = [note_to_val(note) for note in notes]
+    if registry is None:
+        registry = get_registry()
+    candidates = registry.find_qualities_from_mask(pitch_classes_to_mask(values))
+    if not ordered:
+        if not candidates:
+            return []
+        codes = [note_to_code(note) for note in notes]
+        return _find_unordered_chords(codes, values, candidates)
     root = notes[0]
-    root_and_positions = []
-    for rotated_notes in get_all_rotated_notes(notes):
-        rotated_root = rotated_notes[0]
-        root_and_positions.append(
-            (rotated_root, notes_to_positions(rotated_notes, rotated_notes[0]))
-        )
+    roots = {r for r, _ in candidates}
     chords = []
-    for temp_root, positions in root_and_positions:
-        quality = QualityManager().find_quality_from_components(positions)
+    skipped = 0
+    for x in range(len(notes)):
+        if values[x] not in roots:
+            skipped += 1
+            continue
+        positions = _values_to_positions(values[x:] + values[:x])
+        quality = registry.find_quality_from_components(positions)
         if quality is None:
             continue
-        if temp_root == root:
-            chord = "{}{}".format(root, quality)
-        else:
-            chord = "{}{}/{}".format(temp_root, quality, root)
-        chords.append(Chord(chord))
+        temp_root = notes[x]
+        chords.append(
+            Chord._from_codes(
+                note_to_code(temp_root),
+                quality,
+                None if temp_root == root else note_to_code(root),
+            )
+        )
+    if metrics.enabled:
+        metrics.increment("find_chords.rotations", len(notes) - skipped)
+        metrics.increment("find_chords.rotations_skipped", skipped)
+    return chords
+
+
+def _find_unordered_chords(
+    codes: list[int], values: list[int], candidates: list[tuple[int, Quality]]
+) -> list[Chord]:
+    """Build chords for candidates of a pitch-class set, spelled with the given notes"""
+    bass = codes[0]
+    chords = []
+    for r, quality in sorted(candidates, key=lambda c: values.index(c[0])):
+        temp_root = codes[values.index(r)]
+        chords.append(
+            Chord._from_codes(temp_root, quality, None if temp_root == bass else bass)
+        )
     return chords
 
 
@@ -41,11 +88,18 @@ def notes_to_positions(notes: list[str], root: str) -> list[int]:
     :param notes: List of notes.
     :param root: Root note.
     """
-    root_pos = note_to_val(root)
+    return _values_to_positions(
+        [note_to_val(note) for note in notes], note_to_val(root)
+    )
+
+
+def _values_to_positions(values: list[int], root_pos: int | None = None) -> list[int]:
+    """Get positions of pitch classes from the root, which defaults to the first one"""
+    if root_pos is None:
+        root_pos = values[0]
     current_pos = root_pos
     positions = []
-    for note in notes:
-        note_pos = note_to_val(note)
+    for note_pos in values:
         if note_pos < current_pos:
             note_pos += 12 * ((current_pos - note_pos) // 12 + 1)
         positions.append(note_pos - root_pos)
@@ -0,0 +1,68 @@
+"""
+Conversion of chords to NumPy arrays of MIDI pitches.
+
+This module requires NumPy, which is an optional dependency of pychord
+(``pip install pychord[numpy]``).
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from .chord import Chord
+
+
+def _midi_pitches(chord: Chord, root_pitch: int) -> list[int]:
+    """
+    Return the MIDI pitches of the notes of
+    :meth:`Chord.components_with_pitch`, without formatting note names.
+    """
+    components = chord.components(visible=False)
+    if components[0] < 0:
+        components = [c + 12 for c in components]
+    base = 12 * (root_pitch + 1)
+    return [base + c for c in components]
+
+
+def chords_to_pitch_offsets(
+    chords: Iterable[Chord], root_pitch: int = 4
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """
+    Convert chords to a ragged array of MIDI pitches.
+
+    The pitches of chord ``i`` are ``values[offsets[i]:offsets[i + 1]]``.
+
+    :param chords: Chords to convert.
+    :param root_pitch: The octave of the root notes, as in :meth:`Chord.components_with_pitch`.
+    :return: (offsets, values)
+    """
+    offsets = [0]
+    values: list[int] = []
+    for chord in chords:
+        values.extend(_midi_pitches(chord, root_pitch))
+        offsets.append(len(values))
+    return np.array(offsets, dtype=np.int64), np.array(values, dtype=np.int64)
+
+
+def chords_to_pitch_array(
+    chords: Iterable[Chord], root_pitch: int = 4, pad: int = -1
+) -> npt.NDArray[np.int64]:
+    """
+    Convert chords to a 2-D array of MIDI pitches, one row per chord.
+
+    >>> chords_to_pitch_array([Chord("C"), Chord("G7")])
+    array([[60, 64, 67, -1],
+           [67, 71, 74, 77]])
+
+    :param chords: Chords to convert.
+    :param root_pitch: The octave of the root notes, as in :meth:`Chord.components_with_pitch`.
+    :param pad: Value filling the rows of chords with fewer notes.
+    """
+    offsets, values = chords_to_pitch_offsets(chords, root_pitch)
+    lengths = np.diff(offsets)
+    width = int(lengths.max()) if len(lengths) else 0
+    array = np.full((len(lengths), width), pad, dtype=np.int64)
+    mask = np.arange(width) < lengths[:, np.newaxis]
+    array[mask] = values
+    return array
@@ -0,0 +1,145 @@
+"""
+Bulk processing on multiple processes.
+
+The functions of this module split their input into chunks, process the
+chunks with :class:`concurrent.futures.ProcessPoolExecutor` and return
+the results in input order.
+
+Worker processes use a registry holding the qualities of the current
+registry of the calling process (see :func:`pychord.quality.get_registry`)
+in the same order, including the ones defined with
+:meth:`QualityRegistry.set_quality`, and no other ones.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import TypeVar
+
+from .analyzer import find_chords_from_notes
+from .chord import Chord
+from .parser import parse_many
+from .progression import ChordProgression
+from .quality import QualityRegistry, get_registry
+
+T = TypeVar("T")
+A = TypeVar("A")
+R = TypeVar("R")
+
+DEFAULT_CHUNKSIZE = 1000
+
+# Registry of a worker process, None in the calling process
+_registry: QualityRegistry | None = None
+
+
+def find_chords_many(
+    note_lists: Iterable[list[str]],
+    ordered: bool = True,
+    max_workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> list[list[Chord]]:
+    """
+    Run :func:`find_chords_from_notes` on many lists of notes.
+
+    :param note_lists: Lists of notes.
+    :param ordered: See :func:`find_chords_from_notes`.
+    :param max_workers: Number of processes, ``0`` to run in the current process.
+    :param chunksize: Number of items sent to a process at once.
+    """
+    return _run(_find_chords_chunk, note_lists, max_workers, chunksize, ordered)
+
+
+def parse_chords(
+    chords: Iterable[str],
+    max_workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> list[Chord | ValueError]:
+    """
+    Create :class:`Chord` instances from many chord names.
+
+    Invalid chord names do not raise, the ``ValueError`` is returned in
+    place of their chord instead.
+
+    :param chords: Names of the chords.
+    :param max_workers: Number of processes, ``0`` to run in the current process.
+    :param chunksize: Number of items sent to a process at once.
+    """
+    return _run(_parse_chords_chunk, chords, max_workers, chunksize, None)
+
+
+def transpose_progressions(
+    progressions: Iterable[ChordProgression],
+    trans: int,
+    max_workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> list[ChordProgression]:
+    """
+    Return transposed copies of many chord progressions.
+
+    :param progressions: Chord progressions.
+    :param trans: The number of semitones.
+    :param max_workers: Number of processes, ``0`` to run in the current process.
+    :param chunksize: Number of items sent to a process at once.
+    """
+    if not isinstance(trans, int):
+        raise TypeError(f"Expected integers, not {type(trans)}")
+    return _run(_transpose_chunk, progressions, max_workers, chunksize, trans)
+
+
+def _run(
+    func: Callable[[list[T], A], list[R]],
+    items: Iterable[T],
+    max_workers: int | None,
+    chunksize: int,
+    arg: A,
+) -> list[R]:
+    """Apply func to chunks of items on worker processes, keeping the order"""
+    if chunksize < 1:
+        raise ValueError(f"Invalid chunksize {chunksize}")
+    chunks = _chunked(items, chunksize)
+    results: list[R] = []
+    if max_workers == 0:
+        for chunk in chunks:
+            results.extend(func(chunk, arg))
+        return results
+    qualities = [
+        (q.quality, tuple(q.intervals)) for q in get_registry().get_qualities().values()
+    ]
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(qualities,),
+    ) as executor:
+        for chunk_results in executor.map(func, chunks, repeat(arg)):
+            results.extend(chunk_results)
+    return results
+
+
+def _chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _init_worker(qualities: list[tuple[str, tuple[str, ...]]]) -> None:
+    """Create the registry of the qualities of the parent process"""
+    global _registry
+    _registry = QualityRegistry(qualities)
+    _registry.find_qualities_from_mask(0)
+
+
+def _find_chords_chunk(chunk: list[list[str]], ordered: bool) -> list[list[Chord]]:
+    return [find_chords_from_notes(notes, ordered, _registry) for notes in chunk]
+
+
+def _parse_chords_chunk(chunk: list[str], _: None) -> list[Chord | ValueError]:
+    return [
+        parsed if isinstance(parsed, ValueError) else Chord._from_parsed(name, *parsed)
+        for name, parsed in zip(chunk, parse_many(chunk, _registry))
+    ]
+
+
+def _transpose_chunk(
+    chunk: list[ChordProgression], trans: int
+) -> list[ChordProgression]:
+    return [progression.transposed(trans) for progression in chunk]
@@ -1,9 +1,18 @@
+import functools
+from collections.abc import Iterable
 from typing import Any, Literal, overload
 
 from .constants.scales import RELATIVE_KEY_DICT
-from .parser import parse, parse_scale
-from .quality import QualityManager, Quality, scale_notes
-from .utils import augment, diminish, transpose_note, note_to_val
+from .parser import inversion_re, parse, parse_many, parse_scale
+from .quality import Quality, QualityRegistry, get_registry, scale_notes
+from .utils import (
+    augment,
+    code_to_note,
+    code_to_val,
+    diminish,
+    note_to_code,
+    transpose_code,
+)
 
 
 class Chord:
@@ -11,42 +20,112 @@ class Chord:
     A chord, made up of two or more notes.
 
     :param chord: Name of the chord, e.g. ``"C"``, ``"Am7"``, ``"F#m7-5/A"``.
+    :param registry: Qualities to use, defaults to :func:`pychord.quality.get_registry`.
     """
 
-    def __init__(self, chord: str) -> None:
-        root, quality, on = parse(chord)
-        self._chord: str = chord
-        self._root: str = root
+    __slots__ = ("_chord", "_root_code", "_quality", "_on_code", "_inversion", "_key")
+
+    def __init__(self, chord: str, registry: QualityRegistry | None = None) -> None:
+        root, quality, on = parse(chord, registry)
+        # The name is built lazily after transposition, see chord.
+        self._chord: str | None = chord
+        # Notes are kept as note codes, see pychord.utils.
+        self._root_code: int = note_to_code(root)
         self._quality: Quality = quality
-        self._on: str = on
+        self._on_code: int | None = note_to_code(on) if on else None
+        # Inversion given in the name, read from it when needed if None
+        self._inversion: int | None = None
+        self._key: tuple[int, tuple[int, ...], int | None] | None = None
+
+    @classmethod
+    def _from_parsed(cls, chord: str, root: str, quality: Quality, on: str) -> "Chord":
+        """Create a :class:`Chord` from already parsed components."""
+        return cls._from_codes(
+            note_to_code(root), quality, note_to_code(on) if on else None, chord
+        )
+
+    @classmethod
+    def _from_codes(
+        cls,
+        root_code: int,
+        quality: Quality,
+        on_code: int | None = None,
+        chord: str | None = None,
+        inversion: int | None = None,
+    ) -> "Chord":
+        """Create a :class:`Chord` from note codes without parsing a name.
+
+        The inversion of an inverted quality is read from the name if not given.
+        """
+        obj = cls.__new__(cls)
+        obj._root_code = root_code
+        obj._quality = quality
+        obj._on_code = on_code
+        obj._inversion = inversion
+        obj._key = None
+        obj._chord = chord
+        return obj
+
+    def __getstate__(
+        self,
+    ) -> tuple[str | None, int, Quality, int | None, int | None]:
+        # Needed by pickle protocols 0 and 1 with __slots__, the key is not kept.
+        return (
+            self._chord,
+            self._root_code,
+            self._quality,
+            self._on_code,
+            self._inversion,
+        )
+
+    def __setstate__(
+        self, state: tuple[str | None, int, Quality, int | None, int | None]
+    ) -> None:
+        (
+            self._chord,
+            self._root_code,
+            self._quality,
+            self._on_code,
+            self._inversion,
+        ) = state
+        self._key = None
 
     def __str__(self) -> str:
-        return self._chord
+        return self.chord
 
     def __repr__(self) -> str:
-        return f"<Chord: {self._chord}>"
+        return f"<Chord: {self.chord}>"
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Chord):
-            raise TypeError(f"Cannot compare Chord object with {type(other)} object")
-        if note_to_val(self._root) != note_to_val(other.root):
-            return False
-        if self._quality != other.quality:
-            return False
-
-        if (
-            # If one chord has an "on" and not the other, they differ.
-            bool(self._on)
-            != bool(other.on)
-        ) or (
-            # If both chords have an "on" and they are not enharmonic, they differ.
-            self._on
-            and other.on
-            and note_to_val(self._on) != note_to_val(other.on)
-        ):
-            return False
-
-        return True
+            return NotImplemented
+        # Enharmonic roots and bass notes and quality aliases are equal, but
+        # a chord with a bass note differs from the same chord without one.
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        # Note that transposing a chord changes its hash.
+        return hash(self.key)
+
+    @classmethod
+    def from_strings(cls, chords: Iterable[str]) -> list["Chord"]:
+        """Create many :class:`Chord` instances at once.
+
+        Identical chord names are parsed only once.
+
+        >>> Chord.from_strings(["C", "G/B", "Am", "C"])
+        [<Chord: C>, <Chord: G/B>, <Chord: Am>, <Chord: C>]
+
+        :param chords: Names of the chords.
+        :raises ValueError: If any of the names is not a valid chord.
+        """
+        names = list(chords)
+        result = []
+        for chord, parsed in zip(names, parse_many(names)):
+            if isinstance(parsed, ValueError):
+                raise parsed
+            result.append(cls._from_parsed(chord, *parsed))
+        return result
 
     @classmethod
     def from_note_index(
@@ -75,61 +154,73 @@ class Chord:
         """
         if not 1 <= note <= 7:
             raise ValueError(f"Invalid note {note}")
-        scale_root, scale_mode = parse_scale(scale)
-        root = scale_notes(scale_root, scale_mode)[note - 1]
+        scale_mode, notes = _scale_notes(scale)
+        root = notes[note - 1]
         if chromatic != 0:
             alter = augment if chromatic > 0 else diminish
             for i in range(abs(chromatic)):
                 root = alter(root)
 
         if diatonic:
-            scale_degrees = RELATIVE_KEY_DICT[scale_mode]
-
-            # construct the chord based on scale degrees, within 1 octave
-            first = scale_degrees[note - 1]
-            third = scale_degrees[(note + 1) % 7]
-            fifth = scale_degrees[(note + 3) % 7]
-            seventh = scale_degrees[(note + 5) % 7]
-
-            # adjust the chord to its root position (as a stack of thirds),
-            # then set the root to 0
-            # e.g. (9, 0, 4) -> [0, 3, 7]
-            def get_diatonic_chord(chord: tuple[int, ...]) -> list[int]:
-                uninverted: list[int] = []
-                for note in chord:
-                    if not uninverted:
-                        uninverted.append(note)
-                    elif note > uninverted[-1]:
-                        uninverted.append(note)
-                    else:
-                        uninverted.append(note + 12)
-                uninverted = [x - uninverted[0] for x in uninverted]
-                return uninverted
-
             if quality in ["", "-", "maj", "m", "min"]:
-                triad = (first, third, fifth)
-                q = get_diatonic_chord(triad)
+                sevenths = False
             elif quality in ["7", "M7", "maj7", "m7"]:
-                seventh_chord = (first, third, fifth, seventh)
-                q = get_diatonic_chord(seventh_chord)
+                sevenths = True
             else:
                 raise NotImplementedError(
                     "Only generic chords (triads, sevenths) are supported"
                 )
-
-            # look up QualityManager to determine chord quality
-            quality_manager = QualityManager()
-            quality_instance = quality_manager.find_quality_from_components(q)
-            assert quality_instance is not None
-            quality = quality_instance.quality
+            components = _DIATONIC_COMPONENTS[scale_mode][sevenths][note - 1]
+            return cls._from_codes(note_to_code(root), _diatonic_quality(components))
 
         return cls(f"{root}{quality}")
 
+    @classmethod
+    def harmonize(cls, scale: str, sevenths: bool = False) -> list["Chord"]:
+        """Return the diatonic chords on each degree of a scale.
+
+        - ``Chord.harmonize("Cmaj")`` returns C, Dm, Em, F, G, Am, Bdim
+        - ``Chord.harmonize("Amin", sevenths=True)`` returns Am7, Bm7-5, CM7, Dm7, Em7, FM7, G7
+
+        :param scale: Base scale, e.g. ``"Cmaj"``, ``"Amin"``, ``"F#maj"``, ``"Ebmin"``.
+        :param sevenths: If True, return seventh chords instead of triads.
+        """
+        scale_mode, notes = _scale_notes(scale)
+        return [
+            cls._from_codes(note_to_code(root), _diatonic_quality(components))
+            for root, components in zip(
+                notes, _DIATONIC_COMPONENTS[scale_mode][sevenths]
+            )
+        ]
+
+    @property
+    def key(self) -> tuple[int, tuple[int, ...], int | None]:
+        """
+        A canonical key of the chord: the pitch class of the root, the
+        components of the quality and the pitch class of the bass note
+        (``None`` if there is none). Equal chords have equal keys.
+        """
+        if self._key is None:
+            self._key = (
+                code_to_val(self._root_code),
+                self._quality.components,
+                None if self._on_code is None else code_to_val(self._on_code),
+            )
+        return self._key
+
     @property
     def chord(self) -> str:
         """
         The name of the chord, e.g. ``"C"``, ``"Am7"``, ``"F#m7-5/A"``.
         """
+        if self._chord is None:
+            inversion = self._get_inversion()
+            self._chord = "{}{}{}{}".format(
+                code_to_note(self._root_code),
+                self._quality.quality,
+                f"/{inversion}" if inversion else "",
+                f"/{code_to_note(self._on_code)}" if self._on_code is not None else "",
+            )
         return self._chord
 
     @property
@@ -137,7 +228,7 @@ class Chord:
         """
         The root note of the chord, e.g. ``"C"``, ``"A"``, ``"F#"``.
         """
-        return self._root
+        return code_to_note(self._root_code)
 
     @property
     def quality(self) -> Quality:
@@ -151,16 +242,18 @@ class Chord:
         """
         The bass note of a slash chord.
         """
-        return self._on
+        if self._on_code is None:
+            return ""
+        return code_to_note(self._on_code)
 
     def info(self) -> str:
         """
         Return information of chord to display.
         """
-        return f"""{self._chord}
-root={self._root}
+        return f"""{self.chord}
+root={self.root}
 quality={self._quality}
-on={self._on}"""
+on={self.on}"""
 
     def transpose(self, trans: int, scale: str = "C") -> None:
         """
@@ -171,10 +264,39 @@ on={self._on}"""
         """
         if not isinstance(trans, int):
             raise TypeError(f"Expected integers, not {type(trans)}")
-        self._root = transpose_note(self._root, trans, scale)
-        if self._on:
-            self._on = transpose_note(self._on, trans, scale)
-        self._reconfigure_chord()
+        self._root_code = transpose_code(self._root_code, trans, scale)
+        if self._on_code is not None:
+            self._on_code = transpose_code(self._on_code, trans, scale)
+        self._inversion = self._get_inversion()
+        self._key = None
+        self._chord = None
+
+    def transposed(self, trans: int, scale: str = "C") -> "Chord":
+        """
+        Return a transposed copy of the chord, sharing its quality.
+
+        :param trans: The number of semitones.
+        :param scale: Key scale.
+        """
+        if not isinstance(trans, int):
+            raise TypeError(f"Expected integers, not {type(trans)}")
+        return type(self)._from_codes(
+            transpose_code(self._root_code, trans, scale),
+            self._quality,
+            (
+                None
+                if self._on_code is None
+                else transpose_code(self._on_code, trans, scale)
+            ),
+            inversion=self._get_inversion(),
+        )
+
+    def _get_inversion(self) -> int:
+        """Return the inversion of the quality, ``0`` if it is not inverted"""
+        if self._inversion is None:
+            m = None if self._chord is None else inversion_re.search(self._chord)
+            self._inversion = int(m.group(1)) if m else 0
+        return self._inversion
 
     @overload
     def components(self, visible: Literal[True]) -> list[str]: ...
@@ -189,15 +311,16 @@ on={self._on}"""
         :param visible: Returns the note names if ``True``, the note pitches otherwise.
         """
         if visible:
-            notes = self._quality.get_components(root=self._root, visible=True)
-            if self._on:
-                notes = [n for n in notes if n != self._on]
-                notes.insert(0, self._on)
-            return notes
+            codes = self._quality._get_component_codes(self._root_code)
+            if self._on_code is not None:
+                codes = [c for c in codes if c != self._on_code]
+                codes.insert(0, self._on_code)
+            return [code_to_note(c) for c in codes]
         else:
-            components = self._quality.get_components(root=self._root, visible=False)
-            if self._on:
-                on_value = note_to_val(self._on)
+            root_val = code_to_val(self._root_code)
+            components = [v + root_val for v in self._quality.components]
+            if self._on_code is not None:
+                on_value = code_to_val(self._on_code)
                 components = [c for c in components if c % 12 != on_value % 12]
                 if on_value > components[0]:
                     on_value -= 12
@@ -216,9 +339,33 @@ on={self._on}"""
             components = [c + 12 for c in components]
         return [f"{n}{root_pitch + c // 12}" for (n, c) in zip(notes, components)]
 
-    def _reconfigure_chord(self) -> None:
-        self._chord = "{}{}{}".format(
-            self._root,
-            self._quality.quality,
-            f"/{self._on}" if self._on else "",
-        )
+
+def _diatonic_components(mode: str, seventh: bool) -> tuple[tuple[int, ...], ...]:
+    """Return the components of the chords stacking thirds on each degree"""
+    degrees = RELATIVE_KEY_DICT[mode][:7]
+    size = 4 if seventh else 3
+    return tuple(
+        tuple((degrees[(i + 2 * k) % 7] - degrees[i]) % 12 for k in range(size))
+        for i in range(7)
+    )
+
+
+# Components of the diatonic triads and seventh chords of each mode
+_DIATONIC_COMPONENTS = {
+    mode: (_diatonic_components(mode, False), _diatonic_components(mode, True))
+    for mode in RELATIVE_KEY_DICT
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _scale_notes(scale: str) -> tuple[str, tuple[str, ...]]:
+    """Return the mode and the note names of a scale"""
+    scale_root, scale_mode = parse_scale(scale)
+    return scale_mode, tuple(scale_notes(scale_root, scale_mode))
+
+
+def _diatonic_quality(components: tuple[int, ...]) -> Quality:
+    """Return the quality of a diatonic chord from the current registry"""
+    quality = get_registry().find_quality_from_components(list(components))
+    assert quality is not None
+    return quality
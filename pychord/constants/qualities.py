@@ -1,5 +1,7 @@
 # Do not import DEFAULT_QUALITIES directly
 # Use QualityManager instead
+# Run tools/generate_quality_table.py after changing them, which also
+# gives new qualities an id in pychord/constants/quality_ids.py
 DEFAULT_QUALITIES = [
     # chords consist of 2 notes
     ("5", ("1", "5")),
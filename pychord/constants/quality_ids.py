@@ -0,0 +1,113 @@
+# Ids of the qualities in the binary format of pychord.serialize, which
+# are their positions in SERIALIZED_QUALITIES. Encoded chords refer to
+# them, so entries must never be moved, changed or removed: new default
+# qualities are appended by tools/generate_quality_table.py.
+# fmt: off
+
+# (name, intervals)
+SERIALIZED_QUALITIES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ('5', ('1', '5')),
+    ('no5', ('1', '3')),
+    ('omit5', ('1', '3')),
+    ('m(no5)', ('1', 'b3')),
+    ('m(omit5)', ('1', 'b3')),
+    ('', ('1', '3', '5')),
+    ('maj', ('1', '3', '5')),
+    ('m', ('1', 'b3', '5')),
+    ('min', ('1', 'b3', '5')),
+    ('-', ('1', 'b3', '5')),
+    ('dim', ('1', 'b3', 'b5')),
+    ('(b5)', ('1', '3', 'b5')),
+    ('aug', ('1', '3', '#5')),
+    ('sus2', ('1', '2', '5')),
+    ('sus4', ('1', '4', '5')),
+    ('sus', ('1', '4', '5')),
+    ('6', ('1', '3', '5', '6')),
+    ('6b5', ('1', '3', 'b5', '6')),
+    ('6-5', ('1', '3', 'b5', '6')),
+    ('7', ('1', '3', '5', 'b7')),
+    ('7-5', ('1', '3', 'b5', 'b7')),
+    ('7b5', ('1', '3', 'b5', 'b7')),
+    ('7+5', ('1', '3', '#5', 'b7')),
+    ('7#5', ('1', '3', '#5', 'b7')),
+    ('7sus4', ('1', '4', '5', 'b7')),
+    ('m6', ('1', 'b3', '5', '6')),
+    ('m7', ('1', 'b3', '5', 'b7')),
+    ('m7-5', ('1', 'b3', 'b5', 'b7')),
+    ('m7b5', ('1', 'b3', 'b5', 'b7')),
+    ('m7+5', ('1', 'b3', '#5', 'b7')),
+    ('m7#5', ('1', 'b3', '#5', 'b7')),
+    ('dim7', ('1', 'b3', 'b5', 'bb7')),
+    ('M7', ('1', '3', '5', '7')),
+    ('maj7', ('1', '3', '5', '7')),
+    ('maj7+5', ('1', '3', '#5', '7')),
+    ('M7+5', ('1', '3', '#5', '7')),
+    ('mmaj7', ('1', 'b3', '5', '7')),
+    ('mM7', ('1', 'b3', '5', '7')),
+    ('add4', ('1', '3', '4', '5')),
+    ('majadd4', ('1', '3', '4', '5')),
+    ('Madd4', ('1', '3', '4', '5')),
+    ('madd4', ('1', 'b3', '4', '5')),
+    ('add9', ('1', '3', '5', '9')),
+    ('majadd9', ('1', '3', '5', '9')),
+    ('Madd9', ('1', '3', '5', '9')),
+    ('madd9', ('1', 'b3', '5', '9')),
+    ('sus4add9', ('1', '4', '5', '9')),
+    ('sus4add2', ('1', '2', '4', '5')),
+    ('2', ('1', '3', '5', '9')),
+    ('add11', ('1', '3', '5', '11')),
+    ('4', ('1', '3', '5', '11')),
+    ('m69', ('1', 'b3', '5', '6', '9')),
+    ('69', ('1', '3', '5', '6', '9')),
+    ('9', ('1', '3', '5', 'b7', '9')),
+    ('m9', ('1', 'b3', '5', 'b7', '9')),
+    ('M9', ('1', '3', '5', '7', '9')),
+    ('maj9', ('1', '3', '5', '7', '9')),
+    ('9sus4', ('1', '4', '5', 'b7', '9')),
+    ('7-9', ('1', '3', '5', 'b7', 'b9')),
+    ('7b9', ('1', '3', '5', 'b7', 'b9')),
+    ('7(b9)', ('1', '3', '5', 'b7', 'b9')),
+    ('7+9', ('1', '3', '5', 'b7', '#9')),
+    ('7#9', ('1', '3', '5', 'b7', '#9')),
+    ('9-5', ('1', '3', 'b5', 'b7', '9')),
+    ('9b5', ('1', '3', 'b5', 'b7', '9')),
+    ('9+5', ('1', '3', '#5', 'b7', '9')),
+    ('9#5', ('1', '3', '#5', 'b7', '9')),
+    ('7#9b5', ('1', '3', 'b5', 'b7', '#9')),
+    ('7#9#5', ('1', '3', '#5', 'b7', '#9')),
+    ('m7b9b5', ('1', 'b3', 'b5', 'b7', 'b9')),
+    ('7b9b5', ('1', '3', 'b5', 'b7', 'b9')),
+    ('7b9#5', ('1', '3', '#5', 'b7', 'b9')),
+    ('7+11', ('1', '3', '5', 'b7', '#11')),
+    ('7#11', ('1', '3', '5', 'b7', '#11')),
+    ('maj7+11', ('1', '3', '5', '7', '#11')),
+    ('M7+11', ('1', '3', '5', '7', '#11')),
+    ('maj7#11', ('1', '3', '5', '7', '#11')),
+    ('M7#11', ('1', '3', '5', '7', '#11')),
+    ('7-13', ('1', '3', '5', 'b7', 'b13')),
+    ('7b13', ('1', '3', '5', 'b7', 'b13')),
+    ('m7add11', ('1', 'b3', '5', 'b7', '11')),
+    ('maj7add11', ('1', '3', '5', '7', '11')),
+    ('M7add11', ('1', '3', '5', '7', '11')),
+    ('mmaj7add11', ('1', 'b3', '5', '7', '11')),
+    ('mM7add11', ('1', 'b3', '5', '7', '11')),
+    ('maj7add13', ('1', '3', '5', '7', '13')),
+    ('M7add13', ('1', '3', '5', '7', '13')),
+    ('7b9#9', ('1', '3', '5', 'b7', 'b9', '#9')),
+    ('7b9#11', ('1', '3', '5', 'b7', 'b9', '#11')),
+    ('7#9#11', ('1', '3', '5', 'b7', '#9', '#11')),
+    ('9+11', ('1', '3', '5', 'b7', '9', '#11')),
+    ('9#11', ('1', '3', '5', 'b7', '9', '#11')),
+    ('11', ('1', '3', '5', 'b7', '9', '11')),
+    ('m11', ('1', 'b3', '5', 'b7', '9', '11')),
+    ('7b9b13', ('1', '3', '5', 'b7', 'b9', '11', 'b13')),
+    ('13', ('1', '3', '5', 'b7', '9', '11', '13')),
+    ('13-9', ('1', '3', '5', 'b7', 'b9', '11', '13')),
+    ('13b9', ('1', '3', '5', 'b7', 'b9', '11', '13')),
+    ('13+9', ('1', '3', '5', 'b7', '#9', '11', '13')),
+    ('13#9', ('1', '3', '5', 'b7', '#9', '11', '13')),
+    ('13+11', ('1', '3', '5', 'b7', '9', '#11', '13')),
+    ('13#11', ('1', '3', '5', 'b7', '9', '#11', '13')),
+    ('maj13', ('1', '3', '5', '7', '9', '11', '13')),
+    ('M13', ('1', '3', '5', '7', '9', '11', '13')),
+)
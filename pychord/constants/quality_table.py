@@ -0,0 +1,113 @@
+# Generated by tools/generate_quality_table.py from DEFAULT_QUALITIES.
+# Do not edit by hand.
+# fmt: off
+
+# (name, intervals, (alteration, degree offset, pitch) of each interval)
+DEFAULT_QUALITY_TABLE: tuple[
+    tuple[str, tuple[str, ...], tuple[tuple[int, int, int], ...]], ...
+] = (
+    ('5', ('1', '5'), ((0, 0, 0), (0, 4, 7))),
+    ('no5', ('1', '3'), ((0, 0, 0), (0, 2, 4))),
+    ('omit5', ('1', '3'), ((0, 0, 0), (0, 2, 4))),
+    ('m(no5)', ('1', 'b3'), ((0, 0, 0), (-1, 2, 3))),
+    ('m(omit5)', ('1', 'b3'), ((0, 0, 0), (-1, 2, 3))),
+    ('', ('1', '3', '5'), ((0, 0, 0), (0, 2, 4), (0, 4, 7))),
+    ('maj', ('1', '3', '5'), ((0, 0, 0), (0, 2, 4), (0, 4, 7))),
+    ('m', ('1', 'b3', '5'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7))),
+    ('min', ('1', 'b3', '5'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7))),
+    ('-', ('1', 'b3', '5'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7))),
+    ('dim', ('1', 'b3', 'b5'), ((0, 0, 0), (-1, 2, 3), (-1, 4, 6))),
+    ('(b5)', ('1', '3', 'b5'), ((0, 0, 0), (0, 2, 4), (-1, 4, 6))),
+    ('aug', ('1', '3', '#5'), ((0, 0, 0), (0, 2, 4), (1, 4, 8))),
+    ('sus2', ('1', '2', '5'), ((0, 0, 0), (0, 1, 2), (0, 4, 7))),
+    ('sus4', ('1', '4', '5'), ((0, 0, 0), (0, 3, 5), (0, 4, 7))),
+    ('sus', ('1', '4', '5'), ((0, 0, 0), (0, 3, 5), (0, 4, 7))),
+    ('6', ('1', '3', '5', '6'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 5, 9))),
+    ('6b5', ('1', '3', 'b5', '6'), ((0, 0, 0), (0, 2, 4), (-1, 4, 6), (0, 5, 9))),
+    ('6-5', ('1', '3', 'b5', '6'), ((0, 0, 0), (0, 2, 4), (-1, 4, 6), (0, 5, 9))),
+    ('7', ('1', '3', '5', 'b7'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10))),
+    ('7-5', ('1', '3', 'b5', 'b7'), ((0, 0, 0), (0, 2, 4), (-1, 4, 6), (-1, 6, 10))),
+    ('7b5', ('1', '3', 'b5', 'b7'), ((0, 0, 0), (0, 2, 4), (-1, 4, 6), (-1, 6, 10))),
+    ('7+5', ('1', '3', '#5', 'b7'), ((0, 0, 0), (0, 2, 4), (1, 4, 8), (-1, 6, 10))),
+    ('7#5', ('1', '3', '#5', 'b7'), ((0, 0, 0), (0, 2, 4), (1, 4, 8), (-1, 6, 10))),
+    ('7sus4', ('1', '4', '5', 'b7'), ((0, 0, 0), (0, 3, 5), (0, 4, 7), (-1, 6, 10))),
+    ('m6', ('1', 'b3', '5', '6'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (0, 5, 9))),
+    ('m7', ('1', 'b3', '5', 'b7'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (-1, 6, 10))),
+    ('m7-5', ('1', 'b3', 'b5', 'b7'), ((0, 0, 0), (-1, 2, 3), (-1, 4, 6), (-1, 6, 10))),
+    ('m7b5', ('1', 'b3', 'b5', 'b7'), ((0, 0, 0), (-1, 2, 3), (-1, 4, 6), (-1, 6, 10))),
+    ('m7+5', ('1', 'b3', '#5', 'b7'), ((0, 0, 0), (-1, 2, 3), (1, 4, 8), (-1, 6, 10))),
+    ('m7#5', ('1', 'b3', '#5', 'b7'), ((0, 0, 0), (-1, 2, 3), (1, 4, 8), (-1, 6, 10))),
+    ('dim7', ('1', 'b3', 'b5', 'bb7'), ((0, 0, 0), (-1, 2, 3), (-1, 4, 6), (-2, 6, 9))),
+    ('M7', ('1', '3', '5', '7'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11))),
+    ('maj7', ('1', '3', '5', '7'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11))),
+    ('maj7+5', ('1', '3', '#5', '7'), ((0, 0, 0), (0, 2, 4), (1, 4, 8), (0, 6, 11))),
+    ('M7+5', ('1', '3', '#5', '7'), ((0, 0, 0), (0, 2, 4), (1, 4, 8), (0, 6, 11))),
+    ('mmaj7', ('1', 'b3', '5', '7'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (0, 6, 11))),
+    ('mM7', ('1', 'b3', '5', '7'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (0, 6, 11))),
+    ('add4', ('1', '3', '4', '5'), ((0, 0, 0), (0, 2, 4), (0, 3, 5), (0, 4, 7))),
+    ('majadd4', ('1', '3', '4', '5'), ((0, 0, 0), (0, 2, 4), (0, 3, 5), (0, 4, 7))),
+    ('Madd4', ('1', '3', '4', '5'), ((0, 0, 0), (0, 2, 4), (0, 3, 5), (0, 4, 7))),
+    ('madd4', ('1', 'b3', '4', '5'), ((0, 0, 0), (-1, 2, 3), (0, 3, 5), (0, 4, 7))),
+    ('add9', ('1', '3', '5', '9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 8, 14))),
+    ('majadd9', ('1', '3', '5', '9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 8, 14))),
+    ('Madd9', ('1', '3', '5', '9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 8, 14))),
+    ('madd9', ('1', 'b3', '5', '9'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (0, 8, 14))),
+    ('sus4add9', ('1', '4', '5', '9'), ((0, 0, 0), (0, 3, 5), (0, 4, 7), (0, 8, 14))),
+    ('sus4add2', ('1', '2', '4', '5'), ((0, 0, 0), (0, 1, 2), (0, 3, 5), (0, 4, 7))),
+    ('2', ('1', '3', '5', '9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 8, 14))),
+    ('add11', ('1', '3', '5', '11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 10, 17))),
+    ('4', ('1', '3', '5', '11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 10, 17))),
+    ('m69', ('1', 'b3', '5', '6', '9'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (0, 5, 9), (0, 8, 14))),
+    ('69', ('1', '3', '5', '6', '9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 5, 9), (0, 8, 14))),
+    ('9', ('1', '3', '5', 'b7', '9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (0, 8, 14))),
+    ('m9', ('1', 'b3', '5', 'b7', '9'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (-1, 6, 10), (0, 8, 14))),
+    ('M9', ('1', '3', '5', '7', '9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (0, 8, 14))),
+    ('maj9', ('1', '3', '5', '7', '9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (0, 8, 14))),
+    ('9sus4', ('1', '4', '5', 'b7', '9'), ((0, 0, 0), (0, 3, 5), (0, 4, 7), (-1, 6, 10), (0, 8, 14))),
+    ('7-9', ('1', '3', '5', 'b7', 'b9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (-1, 8, 13))),
+    ('7b9', ('1', '3', '5', 'b7', 'b9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (-1, 8, 13))),
+    ('7(b9)', ('1', '3', '5', 'b7', 'b9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (-1, 8, 13))),
+    ('7+9', ('1', '3', '5', 'b7', '#9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (1, 8, 15))),
+    ('7#9', ('1', '3', '5', 'b7', '#9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (1, 8, 15))),
+    ('9-5', ('1', '3', 'b5', 'b7', '9'), ((0, 0, 0), (0, 2, 4), (-1, 4, 6), (-1, 6, 10), (0, 8, 14))),
+    ('9b5', ('1', '3', 'b5', 'b7', '9'), ((0, 0, 0), (0, 2, 4), (-1, 4, 6), (-1, 6, 10), (0, 8, 14))),
+    ('9+5', ('1', '3', '#5', 'b7', '9'), ((0, 0, 0), (0, 2, 4), (1, 4, 8), (-1, 6, 10), (0, 8, 14))),
+    ('9#5', ('1', '3', '#5', 'b7', '9'), ((0, 0, 0), (0, 2, 4), (1, 4, 8), (-1, 6, 10), (0, 8, 14))),
+    ('7#9b5', ('1', '3', 'b5', 'b7', '#9'), ((0, 0, 0), (0, 2, 4), (-1, 4, 6), (-1, 6, 10), (1, 8, 15))),
+    ('7#9#5', ('1', '3', '#5', 'b7', '#9'), ((0, 0, 0), (0, 2, 4), (1, 4, 8), (-1, 6, 10), (1, 8, 15))),
+    ('m7b9b5', ('1', 'b3', 'b5', 'b7', 'b9'), ((0, 0, 0), (-1, 2, 3), (-1, 4, 6), (-1, 6, 10), (-1, 8, 13))),
+    ('7b9b5', ('1', '3', 'b5', 'b7', 'b9'), ((0, 0, 0), (0, 2, 4), (-1, 4, 6), (-1, 6, 10), (-1, 8, 13))),
+    ('7b9#5', ('1', '3', '#5', 'b7', 'b9'), ((0, 0, 0), (0, 2, 4), (1, 4, 8), (-1, 6, 10), (-1, 8, 13))),
+    ('7+11', ('1', '3', '5', 'b7', '#11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (1, 10, 18))),
+    ('7#11', ('1', '3', '5', 'b7', '#11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (1, 10, 18))),
+    ('maj7+11', ('1', '3', '5', '7', '#11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (1, 10, 18))),
+    ('M7+11', ('1', '3', '5', '7', '#11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (1, 10, 18))),
+    ('maj7#11', ('1', '3', '5', '7', '#11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (1, 10, 18))),
+    ('M7#11', ('1', '3', '5', '7', '#11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (1, 10, 18))),
+    ('7-13', ('1', '3', '5', 'b7', 'b13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (-1, 12, 20))),
+    ('7b13', ('1', '3', '5', 'b7', 'b13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (-1, 12, 20))),
+    ('m7add11', ('1', 'b3', '5', 'b7', '11'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (-1, 6, 10), (0, 10, 17))),
+    ('maj7add11', ('1', '3', '5', '7', '11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (0, 10, 17))),
+    ('M7add11', ('1', '3', '5', '7', '11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (0, 10, 17))),
+    ('mmaj7add11', ('1', 'b3', '5', '7', '11'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (0, 6, 11), (0, 10, 17))),
+    ('mM7add11', ('1', 'b3', '5', '7', '11'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (0, 6, 11), (0, 10, 17))),
+    ('maj7add13', ('1', '3', '5', '7', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (0, 12, 21))),
+    ('M7add13', ('1', '3', '5', '7', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (0, 12, 21))),
+    ('7b9#9', ('1', '3', '5', 'b7', 'b9', '#9'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (-1, 8, 13), (1, 8, 15))),
+    ('7b9#11', ('1', '3', '5', 'b7', 'b9', '#11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (-1, 8, 13), (1, 10, 18))),
+    ('7#9#11', ('1', '3', '5', 'b7', '#9', '#11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (1, 8, 15), (1, 10, 18))),
+    ('9+11', ('1', '3', '5', 'b7', '9', '#11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (0, 8, 14), (1, 10, 18))),
+    ('9#11', ('1', '3', '5', 'b7', '9', '#11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (0, 8, 14), (1, 10, 18))),
+    ('11', ('1', '3', '5', 'b7', '9', '11'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (0, 8, 14), (0, 10, 17))),
+    ('m11', ('1', 'b3', '5', 'b7', '9', '11'), ((0, 0, 0), (-1, 2, 3), (0, 4, 7), (-1, 6, 10), (0, 8, 14), (0, 10, 17))),
+    ('7b9b13', ('1', '3', '5', 'b7', 'b9', '11', 'b13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (-1, 8, 13), (0, 10, 17), (-1, 12, 20))),
+    ('13', ('1', '3', '5', 'b7', '9', '11', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (0, 8, 14), (0, 10, 17), (0, 12, 21))),
+    ('13-9', ('1', '3', '5', 'b7', 'b9', '11', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (-1, 8, 13), (0, 10, 17), (0, 12, 21))),
+    ('13b9', ('1', '3', '5', 'b7', 'b9', '11', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (-1, 8, 13), (0, 10, 17), (0, 12, 21))),
+    ('13+9', ('1', '3', '5', 'b7', '#9', '11', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (1, 8, 15), (0, 10, 17), (0, 12, 21))),
+    ('13#9', ('1', '3', '5', 'b7', '#9', '11', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (1, 8, 15), (0, 10, 17), (0, 12, 21))),
+    ('13+11', ('1', '3', '5', 'b7', '9', '#11', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (0, 8, 14), (1, 10, 18), (0, 12, 21))),
+    ('13#11', ('1', '3', '5', 'b7', '9', '#11', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (-1, 6, 10), (0, 8, 14), (1, 10, 18), (0, 12, 21))),
+    ('maj13', ('1', '3', '5', '7', '9', '11', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (0, 8, 14), (0, 10, 17), (0, 12, 21))),
+    ('M13', ('1', '3', '5', '7', '9', '11', '13'), ((0, 0, 0), (0, 2, 4), (0, 4, 7), (0, 6, 11), (0, 8, 14), (0, 10, 17), (0, 12, 21))),
+)
@@ -0,0 +1,287 @@
+"""
+Files of many chord progressions with random access.
+
+A corpus file holds chord progressions encoded with
+:mod:`pychord.serialize`, followed by an index of their offsets. It is
+read through ``mmap``, so progressions are only decoded when accessed,
+and processes opening the same file share its pages.
+
+>>> write_corpus("songs.corpus", progressions)
+>>> with Corpus("songs.corpus") as corpus:
+...     corpus[1000].to_progression()
+<ChordProgression: C | Am | F | G>
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from types import TracebackType
+from typing import Any, overload
+
+from .chord import Chord
+from .progression import ChordProgression
+from .serialize import _decode, _decode_codes, _read_varint, dumps, loads
+
+MAGIC = b"PYCC"
+VERSION = 1
+
+# Magic, version, number of progressions and offset of the index
+_HEADER = struct.Struct("<4sB3xQQ")
+
+
+def write_corpus(path: str, progressions: Iterable[ChordProgression]) -> int:
+    """
+    Write chord progressions to a corpus file.
+
+    :param path: Path of the file.
+    :param progressions: The chord progressions.
+    :return: The number of chord progressions written.
+    """
+    with CorpusWriter(path) as writer:
+        for progression in progressions:
+            writer.append(progression)
+        return len(writer)
+
+
+class CorpusWriter:
+    """
+    Write chord progressions to a corpus file one at a time.
+
+    The index is written when the writer is closed.
+
+    :param path: Path of the file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, 0, 0))
+        self._offsets = array("Q", [_HEADER.size])
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __enter__(self) -> "CorpusWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def append(self, progression: ChordProgression) -> None:
+        """
+        Append a chord progression.
+
+        :param progression: The chord progression.
+        """
+        data = dumps(progression)
+        self._file.write(data)
+        self._offsets.append(self._offsets[-1] + len(data))
+
+    def close(self) -> None:
+        """
+        Write the index and close the file.
+        """
+        if self._file.closed:
+            return
+        offsets = array("Q", self._offsets)
+        if sys.byteorder == "big":  # pragma: no cover
+            offsets.byteswap()
+        index_offset = self._offsets[-1]
+        self._file.write(offsets.tobytes())
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, VERSION, len(self), index_offset))
+        self._file.close()
+
+
+class Corpus(Sequence["ProgressionView"]):
+    """
+    A corpus file opened for reading.
+
+    Items are :class:`ProgressionView` instances, which decode their
+    chords on access. Slices return lists of views.
+
+    Corpora can be pickled: the file is opened again when unpickled, so
+    they can be sent to worker processes.
+
+    :meth:`close` unmaps the file, unless views returned by the corpus
+    still exist: the file then stays mapped until they are garbage
+    collected.
+
+    :param path: Path of the file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap: mmap.mmap | None = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        self._buffer = memoryview(self._mmap)
+        try:
+            count, index_offset = self._read_header()
+        except ValueError:
+            self._buffer.release()
+            self._mmap.close()
+            raise
+        index = self._buffer[index_offset : index_offset + 8 * (count + 1)]
+        self._index: Sequence[int]
+        if sys.byteorder == "little":
+            self._index = index.cast("Q")
+        else:  # pragma: no cover
+            self._index = array("Q", index.tobytes())
+            self._index.byteswap()
+        self._count: int = count
+        self._data_end: int = index_offset
+
+    def __reduce__(self) -> tuple[type["Corpus"], tuple[str]]:
+        return (Corpus, (self.path,))
+
+    def __enter__(self) -> "Corpus":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> "ProgressionView": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list["ProgressionView"]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> "ProgressionView | list[ProgressionView]":
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Corpus index out of range")
+        return self._view(index)
+
+    def __iter__(self) -> Iterator["ProgressionView"]:
+        for i in range(self._count):
+            yield self._view(i)
+
+    def close(self) -> None:
+        """
+        Stop using the file, and unmap it if no views of it exist.
+        """
+        if isinstance(self._index, memoryview):
+            self._index.release()
+        self._buffer.release()
+        self._count = 0
+        self._index = []
+        mapping, self._mmap = self._mmap, None
+        if mapping is not None:
+            try:
+                mapping.close()
+            except BufferError:
+                # Views still use the mapping, which is closed with them.
+                pass
+
+    def _read_header(self) -> tuple[int, int]:
+        """Return the number of progressions and the offset of the index"""
+        if len(self._buffer) < _HEADER.size:
+            raise ValueError("Not a chord progression corpus")
+        magic, version, count, index_offset = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise ValueError("Not a chord progression corpus")
+        if version != VERSION:
+            raise ValueError(f"Unsupported version {version}")
+        index_end = index_offset + 8 * (count + 1)
+        if index_offset < _HEADER.size or index_end > len(self._buffer):
+            raise ValueError("Truncated chord progression corpus")
+        return count, index_offset
+
+    def _view(self, i: int) -> "ProgressionView":
+        start = self._index[i]
+        end = self._index[i + 1]
+        if not _HEADER.size <= start <= end <= self._data_end:
+            raise ValueError("Corrupt chord progression corpus index")
+        return ProgressionView(self._buffer[start:end])
+
+
+class ProgressionView(Sequence[Chord]):
+    """
+    A chord progression decoded on access from a buffer encoded with
+    :func:`pychord.serialize.dumps`.
+
+    Chords are created on each access, so modifying them does not modify
+    the buffer. Use :meth:`to_progression` for a :class:`ChordProgression`.
+
+    :param data: The encoded chord progression.
+    """
+
+    __slots__ = ("_data", "_start", "_len", "_positions")
+
+    def __init__(self, data: bytes | memoryview) -> None:
+        self._data = data
+        self._len, self._start = _read_varint(data, 0)
+        # Positions of the chords, found on first random access
+        self._positions: list[int] | None = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, index: int) -> Chord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Chord]: ...
+
+    def __getitem__(self, index: int | slice) -> Chord | list[Chord]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if self._positions is None:
+            self._positions = self._find_positions()
+        return _decode(self._data, self._positions[index])[0]
+
+    def __iter__(self) -> Iterator[Chord]:
+        pos = self._start
+        for _ in range(self._len):
+            chord, pos = _decode(self._data, pos)
+            yield chord
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ProgressionView):
+            return self._data == other._data
+        if isinstance(other, ChordProgression):
+            return list(self) == other.chords
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return " | ".join(chord.chord for chord in self)
+
+    def __repr__(self) -> str:
+        return f"<ProgressionView: {self}>"
+
+    def to_progression(self, compact: bool = False) -> ChordProgression:
+        """
+        Decode the whole chord progression.
+
+        :param compact: Create a compact chord progression, see :class:`ChordProgression`.
+        """
+        return loads(self._data, compact)
+
+    def _find_positions(self) -> list[int]:
+        positions = []
+        pos = self._start
+        for _ in range(self._len):
+            positions.append(pos)
+            pos = _decode_codes(self._data, pos)[3]
+        return positions
@@ -0,0 +1,130 @@
+"""
+Streaming readers of chord charts.
+
+Two formats are supported:
+
+- ``"bar"``: one progression per line, chords separated by ``|`` like
+  ``str(ChordProgression)``, e.g. ``C | Am | F | G``.
+- ``"chordpro"``: ChordPro-style lyrics with chords in brackets, e.g.
+  ``[C]Let it [G]be``. Each song, separated by a ``{new_song}`` (or
+  ``{ns}``) directive, is one progression.
+
+Progressions are yielded one at a time, so memory usage does not grow
+with the size of the input.
+"""
+
+import re
+from collections.abc import Callable, Iterable, Iterator
+
+from .chord import Chord
+from .parser import parse_many
+from .progression import ChordProgression
+
+chordpro_chord_re = re.compile(r"\[([^\]]*)\]")
+
+chordpro_directive_re = re.compile(r"^\{\s*([A-Za-z_]+)\s*(?::.*)?\}$")
+
+NEW_SONG_DIRECTIVES = ("new_song", "ns")
+
+
+class ChordChartError(ValueError):
+    """
+    An invalid chord found while reading a chord chart.
+
+    :param message: Description of the error.
+    :param lineno: Line number (starting from 1) of the invalid chord.
+    :param line: Content of the line.
+    """
+
+    def __init__(self, message: str, lineno: int, line: str) -> None:
+        super().__init__(f"line {lineno}: {message}")
+        self.lineno = lineno
+        self.line = line
+
+
+def read_progressions(
+    lines: Iterable[str],
+    format: str = "bar",
+    on_error: Callable[[ChordChartError], None] | None = None,
+) -> Iterator[ChordProgression]:
+    """
+    Read chord progressions lazily from lines of a chord chart.
+
+    Invalid chords are reported to ``on_error`` and left out of their
+    progression, the rest of the input is still read.
+
+    :param lines: Lines of the chart, e.g. an open file.
+    :param format: ``"bar"`` or ``"chordpro"``.
+    :param on_error: Called with a :class:`ChordChartError` for each invalid chord.
+    """
+    if format == "bar":
+        return _read_bar(lines, on_error)
+    elif format == "chordpro":
+        return _read_chordpro(lines, on_error)
+    else:
+        raise ValueError(f"Unknown format {format}")
+
+
+def open_progressions(
+    path: str,
+    format: str = "bar",
+    on_error: Callable[[ChordChartError], None] | None = None,
+    encoding: str = "utf-8",
+) -> Iterator[ChordProgression]:
+    """
+    Read chord progressions lazily from a chord chart file.
+
+    :param path: Path of the file.
+    :param format: ``"bar"`` or ``"chordpro"``.
+    :param on_error: Called with a :class:`ChordChartError` for each invalid chord.
+    :param encoding: Encoding of the file.
+    """
+    with open(path, encoding=encoding) as f:
+        yield from read_progressions(f, format, on_error)
+
+
+def _to_chords(
+    names: list[str],
+    lineno: int,
+    line: str,
+    on_error: Callable[[ChordChartError], None] | None,
+) -> list[Chord]:
+    chords = []
+    for name, parsed in zip(names, parse_many(names)):
+        if isinstance(parsed, ValueError):
+            if on_error is not None:
+                on_error(ChordChartError(str(parsed), lineno, line))
+            continue
+        chords.append(Chord._from_parsed(name, *parsed))
+    return chords
+
+
+def _read_bar(
+    lines: Iterable[str], on_error: Callable[[ChordChartError], None] | None
+) -> Iterator[ChordProgression]:
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        names = line.replace("|", " ").split()
+        yield ChordProgression(_to_chords(names, lineno, line, on_error))
+
+
+def _read_chordpro(
+    lines: Iterable[str], on_error: Callable[[ChordChartError], None] | None
+) -> Iterator[ChordProgression]:
+    chords: list[Chord] = []
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if line.startswith("#"):
+            continue
+        m = chordpro_directive_re.match(line)
+        if m:
+            if m.group(1).lower() in NEW_SONG_DIRECTIVES and chords:
+                yield ChordProgression(chords)
+                chords = []
+            continue
+        names = [name.strip() for name in chordpro_chord_re.findall(line)]
+        chords.extend(_to_chords(names, lineno, line, on_error))
+    if chords:
+        yield ChordProgression(chords)
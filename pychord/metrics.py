@@ -0,0 +1,200 @@
+"""
+Opt-in counters and timings of pychord internals.
+
+Metrics are disabled by default, and instrumented code only checks
+:data:`enabled` until :func:`enable` is called.
+
+>>> from pychord import Chord, metrics
+>>> metrics.enable()
+>>> Chord("Am7").components()
+['A', 'C', 'E', 'G']
+>>> metrics.snapshot()["counters"]["parse.calls"]
+1
+
+Counters:
+
+- ``parse.calls``, ``parse.errors``, ``parse.cache_hits``, ``parse.cache_misses``
+- ``get_quality.calls``, ``get_quality.inversions``: inverted qualities built
+- ``find_quality_from_components.calls``, ``find_quality_from_components.misses``
+- ``find_chords.calls``, ``find_chords.errors``, ``find_chords.rotations``:
+  rotations of the notes looked up, ``find_chords.rotations_skipped``:
+  rotations ruled out by the pitch-class set
+
+Timings, in seconds: ``parse.time``, ``find_chords.time``.
+"""
+
+import bisect
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Upper bounds in seconds of the buckets of the timing histograms
+BUCKETS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    1e-2,
+    1e-1,
+    float("inf"),
+)
+
+# Number of slowest calls kept for each timing
+SLOWEST_SIZE = 10
+
+enabled = False
+"""Whether metrics are recorded, see :func:`enable`."""
+
+Hook = Callable[[str, float, Any], None]
+
+
+class _Timing:
+    __slots__ = ("count", "total", "max", "buckets", "slowest")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        # Min-heap of (seconds, sequence number, input)
+        self.slowest: list[tuple[float, int, Any]] = []
+
+
+_lock = threading.Lock()
+_counters: dict[str, int] = {}
+_timings: dict[str, _Timing] = {}
+_sequence = itertools.count()
+_hook: Hook | None = None
+
+
+def enable() -> None:
+    """
+    Start recording metrics.
+    """
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    """
+    Stop recording metrics. Recorded values are kept until :func:`reset`.
+    """
+    global enabled
+    enabled = False
+
+
+def reset() -> None:
+    """
+    Forget every recorded value.
+    """
+    with _lock:
+        _counters.clear()
+        _timings.clear()
+
+
+def set_hook(hook: Hook | None) -> None:
+    """
+    Call a function on every recorded value, e.g. to forward it to
+    another metrics system.
+
+    The hook is called with the name of the metric, the value (the
+    increment of a counter or the duration of a call in seconds) and the
+    input of the timed call, or ``None`` for counters.
+
+    :param hook: The function, or ``None`` to remove the current one.
+    """
+    global _hook
+    _hook = hook
+
+
+def snapshot() -> dict[str, Any]:
+    """
+    Return the recorded values as plain dicts.
+
+    ``"timings"`` maps each timing to its ``count``, ``total`` and
+    ``max`` durations, its histogram in ``buckets`` (the number of calls
+    by upper bound of their duration) and its ``slowest`` calls as a list
+    of (seconds, input), slowest first.
+    """
+    with _lock:
+        return {
+            "enabled": enabled,
+            "counters": dict(_counters),
+            "timings": {
+                name: {
+                    "count": t.count,
+                    "total": t.total,
+                    "max": t.max,
+                    "buckets": dict(zip(BUCKETS, t.buckets)),
+                    "slowest": [(s, d) for s, _, d in sorted(t.slowest, reverse=True)],
+                }
+                for name, t in _timings.items()
+            },
+        }
+
+
+def increment(name: str, value: int = 1) -> None:
+    """
+    Add a value to a counter.
+    """
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+    hook = _hook
+    if hook is not None:
+        hook(name, value, None)
+
+
+def observe(name: str, seconds: float, detail: Any = None) -> None:
+    """
+    Record the duration of a call.
+
+    :param name: Name of the timing.
+    :param seconds: Duration of the call.
+    :param detail: Input of the call, reported with the slowest calls.
+    """
+    with _lock:
+        timing = _timings.get(name)
+        if timing is None:
+            timing = _timings[name] = _Timing()
+        timing.count += 1
+        timing.total += seconds
+        timing.max = max(timing.max, seconds)
+        timing.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        entry = (seconds, next(_sequence), detail)
+        if len(timing.slowest) < SLOWEST_SIZE:
+            heapq.heappush(timing.slowest, entry)
+        elif entry > timing.slowest[0]:
+            heapq.heapreplace(timing.slowest, entry)
+    hook = _hook
+    if hook is not None:
+        hook(name, seconds, detail)
+
+
+def timed(
+    name: str, detail: Any, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs
+) -> R:
+    """
+    Call a function, counting the call and its errors and recording its
+    duration as ``<name>.calls``, ``<name>.errors`` and ``<name>.time``.
+    """
+    increment(f"{name}.calls")
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        increment(f"{name}.errors")
+        raise
+    finally:
+        observe(f"{name}.time", time.perf_counter() - start, detail)
@@ -1,13 +1,152 @@
 import re
+import threading
+import weakref
+from collections.abc import Iterable
+from typing import NamedTuple
 
+from . import metrics
 from .constants.scales import RELATIVE_KEY_DICT
-from .quality import QualityManager, Quality
+from .quality import Quality, QualityRegistry, get_registry
 
 # We accept notes with up to two flats or two sharps.
 note_re = re.compile("^[A-G](b{0,2}|#{0,2})$")
 
 inversion_re = re.compile("/([0-9]+)")
 
+DEFAULT_PARSE_CACHE_SIZE = 4096
+
+
+class ParseCacheInfo(NamedTuple):
+    """Statistics of the parse cache, like :func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _CacheEntry:
+    __slots__ = ("result", "used")
+
+    def __init__(self, result: tuple[str, Quality, str]) -> None:
+        self.result = result
+        # Set on hits, gives the entry a second chance before eviction
+        self.used = False
+
+
+class _ParseCache:
+    """
+    A bounded cache of parse results keyed on the version of the quality
+    registry and the chord string.
+
+    Versions are unique across registries and change whenever the
+    qualities of a registry change, so outdated entries are never hit
+    and are eventually evicted.
+
+    Hits take no lock: they only read the dict of entries, mark the entry
+    as used and count the hit in per-thread statistics. Entries are
+    evicted in approximate LRU order (the CLOCK algorithm): the oldest
+    entry is evicted unless it was used since it was last checked, in
+    which case it is moved to the end. Inserting and evicting take a lock.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: dict[tuple[int, str], _CacheEntry] = {}
+        self._lock = threading.Lock()
+        # [hits, misses] of each running thread which used the cache, by
+        # id, and of the threads which have ended
+        self._local = threading.local()
+        self._counters: dict[int, list[int]] = {}
+        self._ended = [0, 0]
+
+    def get(self, chord: str, version: int) -> tuple[str, Quality, str] | None:
+        entry = self._entries.get((version, chord))
+        try:
+            counters = self._local.counters
+        except AttributeError:
+            counters = self._local.counters = [0, 0]
+            with self._lock:
+                self._counters[id(counters)] = counters
+            weakref.finalize(threading.current_thread(), self._end, counters)
+        if entry is None:
+            counters[1] += 1
+            return None
+        counters[0] += 1
+        entry.used = True
+        return entry.result
+
+    def put(self, chord: str, result: tuple[str, Quality, str], version: int) -> None:
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._entries[(version, chord)] = _CacheEntry(result)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._ended = [0, 0]
+            for counters in self._counters.values():
+                counters[:] = [0, 0]
+
+    def info(self) -> ParseCacheInfo:
+        with self._lock:
+            hits, misses = self._ended
+            for counters in self._counters.values():
+                hits += counters[0]
+                misses += counters[1]
+            return ParseCacheInfo(hits, misses, self.maxsize, len(self._entries))
+
+    def _end(self, counters: list[int]) -> None:
+        """Keep the statistics of a thread which has ended"""
+        with self._lock:
+            del self._counters[id(counters)]
+            self._ended[0] += counters[0]
+            self._ended[1] += counters[1]
+
+    def _evict(self) -> None:
+        entries = self._entries
+        while len(entries) > self.maxsize:
+            key = next(iter(entries))
+            entry = entries.pop(key)
+            if entry.used:
+                entry.used = False
+                entries[key] = entry
+
+
+_parse_cache = _ParseCache(DEFAULT_PARSE_CACHE_SIZE)
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    """
+    Return hit/miss statistics of the parse cache.
+    """
+    return _parse_cache.info()
+
+
+def clear_parse_cache() -> None:
+    """
+    Empty the parse cache and reset its statistics.
+    """
+    _parse_cache.clear()
+
+
+def set_parse_cache_size(maxsize: int) -> None:
+    """
+    Change the maximum number of chords kept in the parse cache.
+
+    :param maxsize: Maximum number of entries, ``0`` disables the cache.
+    """
+    if maxsize < 0:
+        raise ValueError(f"Invalid cache size {maxsize}")
+    _parse_cache.resize(maxsize)
+
 
 def _check_mode(mode: str) -> None:
     """Raise ValueError if mode is invalid"""
@@ -21,13 +160,72 @@ def _check_note(note: str) -> None:
         raise ValueError(f"Invalid note {note}")
 
 
-def parse(chord: str) -> tuple[str, Quality, str]:
+def parse(
+    chord: str, registry: QualityRegistry | None = None
+) -> tuple[str, Quality, str]:
     """
     Parse a string to get chord component.
 
+    Results are kept in a bounded cache, keyed on the version of the
+    quality registry so that changing its qualities invalidates them.
+
     :param chord: Name of the chord.
+    :param registry: Qualities to use, defaults to :func:`get_registry`.
     :return: (root, quality, on)
     """
+    if metrics.enabled:
+        return metrics.timed("parse", chord, _cached_parse, chord, registry)
+    return _cached_parse(chord, registry)
+
+
+def parse_many(
+    chords: Iterable[str], registry: QualityRegistry | None = None
+) -> list[tuple[str, Quality, str] | ValueError]:
+    """
+    Parse many strings at once.
+
+    Identical chord names are parsed only once and share their result.
+    Invalid chord names do not raise, the ``ValueError`` is returned in
+    place of their result instead.
+
+    :param chords: Names of the chords.
+    :param registry: Qualities to use, defaults to :func:`get_registry`.
+    :return: List of (root, quality, on) or ``ValueError``, in input order.
+    """
+    if registry is None:
+        registry = get_registry()
+    seen: dict[str, tuple[str, Quality, str] | ValueError] = {}
+    results: list[tuple[str, Quality, str] | ValueError] = []
+    for chord in chords:
+        result = seen.get(chord)
+        if result is None:
+            try:
+                result = parse(chord, registry)
+            except ValueError as e:
+                result = e
+            seen[chord] = result
+        results.append(result)
+    return results
+
+
+def _cached_parse(
+    chord: str, registry: QualityRegistry | None
+) -> tuple[str, Quality, str]:
+    if registry is None:
+        registry = get_registry()
+    version = registry.version
+    result = _parse_cache.get(chord, version)
+    if result is None:
+        if metrics.enabled:
+            metrics.increment("parse.cache_misses")
+        result = _parse(chord, registry)
+        _parse_cache.put(chord, result, version)
+    elif metrics.enabled:
+        metrics.increment("parse.cache_hits")
+    return result
+
+
+def _parse(chord: str, registry: QualityRegistry) -> tuple[str, Quality, str]:
 
     if len(chord) > 2 and chord[1:3] in ("bb", "##"):
         root = chord[:3]
@@ -54,7 +252,7 @@ def parse(chord: str) -> tuple[str, Quality, str]:
         _check_note(on)
     else:
         on = ""
-    quality = QualityManager().get_quality(rest, inversion)
+    quality = registry.get_quality(rest, inversion)
     return root, quality, on
 
 
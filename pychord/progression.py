@@ -1,6 +1,18 @@
-from typing import Any
+import hashlib
+from array import array
+from collections.abc import Iterable, Iterator, MutableSequence
+from typing import TYPE_CHECKING, Any, overload
 
 from .chord import Chord
+from .quality import get_quality_by_id, get_quality_id
+from .utils import code_to_val, transpose_code
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Root interval from the previous chord, components and bass interval
+_CanonicalChord = tuple[int, tuple[int, ...], int | None]
 
 
 class ChordProgression:
@@ -8,22 +20,35 @@ class ChordProgression:
     A chord progression, which is a sequence of :class:`Chord` instances.
 
     :param initial_chords: Initial chord or chords of the chord progression.
+    :param compact: If True, store the chords as arrays of integers, which
+        uses much less memory. :class:`Chord` instances are then created on
+        access, so modifying them does not modify the chord progression.
     """
 
     def __init__(
-        self, initial_chords: str | Chord | list[str] | list[Chord] = []
+        self,
+        initial_chords: str | Chord | list[str] | list[Chord] = [],
+        compact: bool = False,
     ) -> None:
         if isinstance(initial_chords, Chord):
             chords = [initial_chords]
         elif isinstance(initial_chords, str):
             chords = [self._as_chord(initial_chords)]
         elif isinstance(initial_chords, list):
-            chords = [self._as_chord(chord) for chord in initial_chords]
+            if all(isinstance(chord, str) for chord in initial_chords):
+                chords = Chord.from_strings(initial_chords)  # type: ignore[arg-type]
+            else:
+                chords = [self._as_chord(chord) for chord in initial_chords]
         else:
             raise TypeError(
                 f"Cannot initialize ChordProgression with argument of {type(initial_chords)} type"
             )
-        self._chords: list[Chord] = chords
+        self._chords: MutableSequence[Chord] = (
+            _ChordArray(chords) if compact else chords
+        )
+        # Cached canonical form and fingerprint, reset when chords change
+        self._canonical: tuple[_CanonicalChord, ...] | None = None
+        self._fingerprint: str | None = None
 
     def __str__(self) -> str:
         return " | ".join([chord.chord for chord in self._chords])
@@ -32,7 +57,10 @@ class ChordProgression:
         return f"<ChordProgression: {self}>"
 
     def __add__(self, other: "ChordProgression") -> "ChordProgression":
-        return ChordProgression(self._chords + other._chords)
+        return ChordProgression(
+            [*self._chords, *other._chords],
+            compact=isinstance(self._chords, _ChordArray),
+        )
 
     def __len__(self) -> int:
         return len(self._chords)
@@ -42,6 +70,7 @@ class ChordProgression:
 
     def __setitem__(self, key: int, value: Chord) -> None:
         self._chords[key] = value
+        self._canonical = self._fingerprint = None
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, ChordProgression):
@@ -55,7 +84,45 @@ class ChordProgression:
         """
         The component chords of the chord progression.
         """
-        return self._chords
+        if isinstance(self._chords, _ChordArray):
+            return list(self._chords)
+        return self._chords  # type: ignore[return-value]
+
+    @property
+    def canonical(self) -> tuple[_CanonicalChord, ...]:
+        """
+        A key-independent form of the chord progression: for each chord,
+        the interval from the root of the previous chord (``0`` for the
+        first one), the components of its quality, and the interval of its
+        bass note from its root (``None`` if there is none).
+
+        Transposed chord progressions have the same canonical form. It is
+        cached, so changes to the chords made other than through the
+        methods of the chord progression are not seen.
+
+        >>> ChordProgression(["Am7", "D7/F#"]).canonical
+        ((0, (0, 3, 7, 10), None), (5, (0, 4, 7, 10), 4))
+        """
+        if self._canonical is None:
+            self._canonical = tuple(self._canonicalize())
+        return self._canonical
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        A hash of :attr:`canonical` as a hexadecimal string, which is the
+        same in every process and Python version.
+        """
+        if self._fingerprint is None:
+            data = bytearray()
+            for interval, components, bass in self.canonical:
+                data += bytes(
+                    (interval, 0 if bass is None else bass + 1, len(components))
+                )
+                for component in components:
+                    _write_signed_varint(data, component)
+            self._fingerprint = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return self._fingerprint
 
     def append(self, chord: str | Chord) -> None:
         """
@@ -64,6 +131,7 @@ class ChordProgression:
         :param chord: A chord to append.
         """
         self._chords.append(self._as_chord(chord))
+        self._canonical = self._fingerprint = None
 
     def insert(self, index: int, chord: str | Chord) -> None:
         """
@@ -73,6 +141,7 @@ class ChordProgression:
         :param chord: A chord to insert.
         """
         self._chords.insert(index, self._as_chord(chord))
+        self._canonical = self._fingerprint = None
 
     def pop(self, index: int = -1) -> Chord:
         """
@@ -80,7 +149,9 @@ class ChordProgression:
 
         :param index: Index of the chord to pop (default: -1).
         """
-        return self._chords.pop(index)
+        chord = self._chords.pop(index)
+        self._canonical = self._fingerprint = None
+        return chord
 
     def transpose(self, trans: int) -> None:
         """
@@ -88,9 +159,68 @@ class ChordProgression:
 
         :param trans: The number of semitones.
         """
+        if isinstance(self._chords, _ChordArray):
+            self._chords.transpose(trans)
+            return
         for chord in self._chords:
             chord.transpose(trans)
 
+    def transposed(self, trans: int) -> "ChordProgression":
+        """
+        Return a transposed copy of the whole chord progression.
+
+        :param trans: The number of semitones.
+        """
+        if isinstance(self._chords, _ChordArray):
+            cp = ChordProgression(compact=True)
+            cp._chords = self._chords.copy()
+            cp.transpose(trans)
+            return cp
+        return ChordProgression([chord.transposed(trans) for chord in self._chords])
+
+    def to_pitch_array(
+        self, root_pitch: int = 4, pad: int = -1
+    ) -> "npt.NDArray[np.int64]":
+        """
+        Return the MIDI pitches of the chords as a 2-D NumPy array.
+
+        Requires NumPy, see :func:`pychord.arrays.chords_to_pitch_array`.
+
+        :param root_pitch: The octave of the root notes.
+        :param pad: Value filling the rows of chords with fewer notes.
+        """
+        # Imported here so that NumPy stays an optional dependency.
+        from .arrays import chords_to_pitch_array
+
+        return chords_to_pitch_array(self._chords, root_pitch, pad)
+
+    def _canonicalize(self) -> Iterator[_CanonicalChord]:
+        if isinstance(self._chords, _ChordArray):
+            components_of = {
+                quality_id: get_quality_by_id(quality_id).components
+                for quality_id in set(self._chords._qualities)
+            }
+            keys: Iterable[tuple[int, tuple[int, ...], int | None]] = (
+                (
+                    code_to_val(root),
+                    components_of[quality_id],
+                    code_to_val(on) if on else None,
+                )
+                for root, quality_id, on in zip(
+                    self._chords._roots, self._chords._qualities, self._chords._ons
+                )
+            )
+        else:
+            keys = (chord.key for chord in self._chords)
+        previous = None
+        for root, components, on in keys:
+            yield (
+                0 if previous is None else (root - previous) % 12,
+                components,
+                None if on is None else (on - root) % 12,
+            )
+            previous = root
+
     @staticmethod
     def _as_chord(chord: str | Chord) -> Chord:
         """Convert from str to Chord instance if input is str.
@@ -103,3 +233,115 @@ class ChordProgression:
             return Chord(chord)
         else:
             raise TypeError("input type should be str or Chord instance.")
+
+
+def _write_signed_varint(out: bytearray, value: int) -> None:
+    """Append a zigzag-encoded LEB128 varint"""
+    value = value << 1 if value >= 0 else (-value << 1) - 1
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _ChordArray(MutableSequence[Chord]):
+    """
+    Chords stored as parallel arrays of root note codes, quality ids,
+    bass note codes (``0`` for none) and inversions given in their names
+    (``0`` for none, e.g. ``2`` for ``Am7/2``).
+    """
+
+    __slots__ = ("_roots", "_qualities", "_ons", "_inversions")
+
+    def __init__(self, chords: Iterable[Chord] = ()) -> None:
+        self._roots = array("H")
+        self._qualities = array("H")
+        self._ons = array("H")
+        self._inversions = array("H")
+        for chord in chords:
+            self.append(chord)
+
+    def __len__(self) -> int:
+        return len(self._roots)
+
+    @overload
+    def __getitem__(self, index: int) -> Chord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Chord]: ...
+
+    def __getitem__(self, index: int | slice) -> Chord | list[Chord]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        root = self._roots[index]
+        quality = get_quality_by_id(self._qualities[index])
+        on = self._ons[index] or None
+        return Chord._from_codes(root, quality, on, None, self._inversions[index])
+
+    @overload
+    def __setitem__(self, index: int, value: Chord) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Chord]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: Chord | Iterable[Chord]) -> None:
+        if isinstance(index, slice) or not isinstance(value, Chord):
+            raise TypeError("Slice assignment is not supported")
+        quality_id = self._quality_id(value)
+        self._roots[index] = value._root_code
+        self._qualities[index] = quality_id
+        self._ons[index] = value._on_code or 0
+        self._inversions[index] = value._get_inversion()
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self._roots[index]
+        del self._qualities[index]
+        del self._ons[index]
+        del self._inversions[index]
+
+    def __iter__(self) -> Iterator[Chord]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reduce__(self) -> tuple[type["_ChordArray"], tuple[list[Chord]]]:
+        # Quality ids are specific to a process, so pickle the chords.
+        return (_ChordArray, (list(self),))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (list, _ChordArray)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def copy(self) -> "_ChordArray":
+        chords = _ChordArray()
+        chords._roots = self._roots[:]
+        chords._qualities = self._qualities[:]
+        chords._ons = self._ons[:]
+        chords._inversions = self._inversions[:]
+        return chords
+
+    def insert(self, index: int, value: Chord) -> None:
+        quality_id = self._quality_id(value)
+        inversion = value._get_inversion()
+        self._roots.insert(index, value._root_code)
+        self._qualities.insert(index, quality_id)
+        self._ons.insert(index, value._on_code or 0)
+        self._inversions.insert(index, inversion)
+
+    def _quality_id(self, chord: Chord) -> int:
+        quality_id = get_quality_id(chord.quality)
+        if quality_id > 0xFFFF and self._qualities.typecode == "H":
+            # Quality ids are shared by all registries and only grow, so
+            # widen the array once they do not fit in two bytes.
+            self._qualities = array("L", self._qualities)
+        return quality_id
+
+    def transpose(self, trans: int) -> None:
+        if not isinstance(trans, int):
+            raise TypeError(f"Expected integers, not {type(trans)}")
+        codes: dict[int, int] = {0: 0}
+        for notes in (self._roots, self._ons):
+            for i, code in enumerate(notes):
+                if code not in codes:
+                    codes[code] = transpose_code(code, trans)
+                notes[i] = codes[code]
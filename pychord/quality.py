@@ -1,11 +1,28 @@
-import copy
 import functools
+import itertools
 import re
-from typing import Any, Literal, overload
-
-from .constants.qualities import DEFAULT_QUALITIES
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, ClassVar, Literal, overload
+
+from . import metrics
+from .constants.quality_table import DEFAULT_QUALITY_TABLE
 from .constants.scales import RELATIVE_KEY_DICT
-from .utils import augment, diminish, note_to_val
+from .utils import (
+    alter_code,
+    augment,
+    code_to_note,
+    diminish,
+    note_to_code,
+    note_to_val,
+)
+
+interval_re = re.compile(r"^([b#]*)(\d+)$")
+
+# Largest inversion accepted in chord names, e.g. ``C7/3``
+MAX_INVERSION = 16
 
 
 class Quality:
@@ -17,25 +34,100 @@ class Quality:
     Use :class:`QualityManager` if you need to define a new quality or
     override an existing one.
 
+    Instances are immutable and shared between chords.
+
     :param name: Name of the quality.
     :param intervals: Intervals defining the quality.
     """
 
+    __slots__ = (
+        "_quality",
+        "_intervals",
+        "_table",
+        "_components",
+        "_mask",
+        "_component_codes",
+        "_id",
+    )
+
+    _quality: str
+    _intervals: tuple[str, ...]
+    # (alteration, degree offset, pitch) for each interval
+    _table: tuple[tuple[int, int, int], ...]
+    _components: tuple[int, ...]
+    # Pitch-class set of the components with a C root, as a 12-bit mask
+    _mask: int
+    # Memoized note codes of the components, by root note code
+    _component_codes: dict[int, tuple[int, ...]]
+    # Cached result of get_quality_id, -1 until requested
+    _id: int
+
     def __init__(self, name: str, intervals: tuple[str, ...]) -> None:
-        self._quality: str = name
-        self._intervals = intervals
+        intervals = tuple(intervals)
+        self._set_table(
+            name, intervals, tuple(_get_interval_entry(i) for i in intervals)
+        )
+
+    @classmethod
+    def _from_table(
+        cls,
+        name: str,
+        intervals: tuple[str, ...],
+        table: tuple[tuple[int, int, int], ...],
+    ) -> "Quality":
+        """Create a quality from precomputed interval entries without parsing"""
+        quality = cls.__new__(cls)
+        quality._set_table(name, intervals, table)
+        return quality
+
+    def _set_table(
+        self,
+        name: str,
+        intervals: tuple[str, ...],
+        table: tuple[tuple[int, int, int], ...],
+    ) -> None:
+        object.__setattr__(self, "_quality", name)
+        object.__setattr__(self, "_intervals", intervals)
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_components", tuple(e[2] for e in table))
+        object.__setattr__(self, "_mask", pitch_classes_to_mask(self._components))
+        object.__setattr__(self, "_component_codes", {})
+        object.__setattr__(self, "_id", -1)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} object is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} object is immutable")
+
+    def __reduce__(
+        self,
+    ) -> tuple[
+        Callable[[str, tuple[str, ...]], "Quality"], tuple[str, tuple[str, ...]]
+    ]:
+        # Unpickled qualities are shared like the ones of QualityManager.
+        return (_intern_quality, (self._quality, self._intervals))
+
+    def __copy__(self) -> "Quality":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Quality":
+        return self
 
     def __str__(self) -> str:
         return self._quality
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Quality):
-            raise TypeError(f"Cannot compare Quality object with {type(other)} object")
-        return self.components == other.components
+            return NotImplemented
+        return self._components == other._components
+
+    def __hash__(self) -> int:
+        return hash(self._components)
 
     @property
     def components(self) -> tuple[int, ...]:
-        return tuple(_get_interval_pitch(i) for i in self._intervals)
+        return self._components
 
     @property
     def intervals(self) -> list[str]:
@@ -71,42 +163,171 @@ class Quality:
         :return: components of chord quality
         """
         if visible:
-            return [_apply_interval_to_note(root, i) for i in self._intervals]
+            codes = self._get_component_codes(note_to_code(root))
+            return [code_to_note(c) for c in codes]
         else:
             root_val = note_to_val(root)
             return [v + root_val for v in self.components]
 
+    def _get_component_codes(self, root: int) -> list[int]:
+        """Get the note codes of the components for a root note code"""
+        codes = self._component_codes.get(root)
+        if codes is None:
+            notes_in_key = _major_scale_codes(root)
+            codes = tuple(
+                alter_code(notes_in_key[offset % 7], alteration)
+                for alteration, offset, _ in self._table
+            )
+            self._component_codes[root] = codes
+        return list(codes)
 
-class QualityManager:
+
+class _QualityState:
     """
-    Singleton class to manage the chord qualities.
+    A snapshot of the registered qualities and their lookup indexes.
+
+    Snapshots are never modified once published, except for caches which
+    can be filled concurrently without harm.
     """
 
-    def __new__(cls) -> "QualityManager":
-        if not hasattr(cls, "_instance"):
-            cls._instance = super(QualityManager, cls).__new__(cls)
-            cls._instance.load_default_qualities()
-        return cls._instance
+    __slots__ = (
+        "qualities",
+        "components_index",
+        "inversions",
+        "pitch_class_index",
+        "version",
+    )
+
+    def __init__(
+        self,
+        qualities: dict[str, Quality],
+        components_index: dict[tuple[int, ...], Quality],
+        version: int,
+    ) -> None:
+        self.qualities = qualities
+        self.components_index = components_index
+        # Cache of inverted qualities by (name, inversion), bounded since
+        # inversions are at most MAX_INVERSION
+        self.inversions: dict[tuple[str, int], Quality] = {}
+        # Built on first use, see QualityRegistry.find_qualities_from_mask
+        self.pitch_class_index: dict[int, list[tuple[int, Quality]]] | None = None
+        self.version = version
+
+
+class QualityRegistry:
+    """
+    A set of chord qualities with their lookup indexes.
+
+    :class:`QualityManager` is the registry used by default. Other
+    registries can be passed to :func:`pychord.parser.parse` or made the
+    default for the current context with :func:`use_registry`.
+
+    Reads never take a lock: writes build a new snapshot of the qualities
+    and their indexes, and replace the current one at once.
+
+    :param qualities: Names and intervals of the qualities, the default ones if omitted.
+    """
+
+    _versions = itertools.count()
+
+    _state: _QualityState
+    _lock: threading.Lock
+    _read_only: bool
+
+    def __init__(
+        self, qualities: Iterable[tuple[str, tuple[str, ...]]] | None = None
+    ) -> None:
+        self._lock = threading.Lock()
+        self._read_only = False
+        if qualities is None:
+            self.load_default_qualities()
+        else:
+            self._load(qualities)
+
+    @property
+    def read_only(self) -> bool:
+        """
+        Whether the qualities of the registry can no longer be changed.
+        """
+        return self._read_only
+
+    def freeze(self) -> "QualityRegistry":
+        """
+        Make the registry read-only and return it.
+        """
+        self._read_only = True
+        return self
+
+    def copy(self) -> "QualityRegistry":
+        """
+        Return a new, writable registry with the same qualities.
+        """
+        return QualityRegistry(
+            (name, q._intervals) for name, q in self._state.qualities.items()
+        )
 
     def load_default_qualities(self) -> None:
-        self._qualities = {q: Quality(q, c) for q, c in DEFAULT_QUALITIES}
+        # The intervals of the default qualities are parsed at build time,
+        # see tools/generate_quality_table.py.
+        self._set_qualities(
+            {q: _intern_quality(q, c, t) for q, c, t in DEFAULT_QUALITY_TABLE}
+        )
+
+    def _load(self, items: Iterable[tuple[str, tuple[str, ...]]]) -> None:
+        self._set_qualities({q: _intern_quality(q, tuple(c)) for q, c in items})
+
+    def _set_qualities(self, qualities: dict[str, Quality]) -> None:
+        self._check_writable()
+        components_index: dict[tuple[int, ...], Quality] = {}
+        for q in qualities.values():
+            components_index.setdefault(q.components, q)
+        with self._lock:
+            self._state = _QualityState(
+                qualities, components_index, next(self._versions)
+            )
+
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise RuntimeError("Cannot modify a read-only quality registry")
+
+    @property
+    def version(self) -> int:
+        """
+        A number which changes whenever the registered qualities change.
+        """
+        return self._state.version
 
     def get_quality(self, name: str, inversion: int = 0) -> Quality:
-        if name not in self._qualities:
+        if metrics.enabled:
+            metrics.increment("get_quality.calls")
+        state = self._state
+        if name not in state.qualities:
             raise ValueError(f"Unknown quality: {name}")
-        # Create a new instance not to affect any existing instances
-        q = copy.deepcopy(self._qualities[name])
-        # apply requested inversion :
+        if inversion == 0:
+            return state.qualities[name]
+        if not 0 < inversion <= MAX_INVERSION:
+            raise ValueError(f"Invalid inversion {inversion}")
+        q = state.inversions.get((name, inversion))
+        if q is None:
+            if metrics.enabled:
+                metrics.increment("get_quality.inversions")
+            q = self._invert(state.qualities[name], inversion)
+            state.inversions[(name, inversion)] = q
+        return q
+
+    @staticmethod
+    def _invert(quality: Quality, inversion: int) -> Quality:
+        intervals = quality._intervals
         for i in range(inversion):
-            max_a, max_o = _parse_interval(q._intervals[-1])
-            a, o = _parse_interval(q._intervals[0])
+            max_a, max_o = _parse_interval(intervals[-1])
+            a, o = _parse_interval(intervals[0])
             while o < max_o:
                 o += 7
-            q._intervals = q._intervals[1:] + (f"{a}{o + 1}",)
-        return q
+            intervals = intervals[1:] + (f"{a}{o + 1}",)
+        return Quality(quality.quality, intervals)
 
     def get_qualities(self) -> dict[str, Quality]:
-        return dict(self._qualities)
+        return dict(self._state.qualities)
 
     def set_quality(self, name: str, intervals: tuple[str, ...]) -> None:
         """
@@ -117,7 +338,25 @@ class QualityManager:
         :param name: Name of the quality, e.g. ``"m"``.
         :param intervals: Intervals defining the quality, e.g. ``["1", "b3", "5"]``.
         """
-        self._qualities[name] = Quality(name, intervals)
+        self._check_writable()
+        quality = _intern_quality(name, tuple(intervals))
+        with self._lock:
+            state = self._state
+            old = state.qualities.get(name)
+            qualities = dict(state.qualities)
+            qualities[name] = quality
+            components_index = dict(state.components_index)
+            # Only the entries for the old and new components can change.
+            if old is not None:
+                _reindex(qualities, components_index, old.components)
+            _reindex(qualities, components_index, quality.components)
+            new_state = _QualityState(qualities, components_index, next(self._versions))
+            # Readers add inversions without the lock, so iterate a copy.
+            inversions = state.inversions.copy()
+            new_state.inversions.update(
+                (k, v) for k, v in inversions.items() if k[0] != name
+            )
+            self._state = new_state
 
     def find_quality_from_components(self, components: list[int]) -> Quality | None:
         """
@@ -125,46 +364,215 @@ class QualityManager:
 
         :param components: Components of the quality.
         """
-        for q in self._qualities.values():
-            if list(q.components) == components:
-                return copy.deepcopy(q)
-        return None
+        quality = self._state.components_index.get(tuple(components))
+        if metrics.enabled:
+            metrics.increment("find_quality_from_components.calls")
+            if quality is None:
+                metrics.increment("find_quality_from_components.misses")
+        return quality
+
+    def find_qualities_from_mask(self, mask: int) -> list[tuple[int, Quality]]:
+        """
+        Find all qualities and roots producing a pitch-class set.
 
+        Qualities sharing the same components are reported once, like
+        :meth:`find_quality_from_components`.
 
-def _apply_interval_to_note(root: str, interval: str) -> str:
-    alterations, offset = _parse_interval(interval)
+        :param mask: Pitch-class set as a 12-bit mask, see :func:`pitch_classes_to_mask`.
+        :return: List of (root pitch class, quality).
+        """
+        state = self._state
+        index = state.pitch_class_index
+        if index is None:
+            index = state.pitch_class_index = _build_pitch_class_index(state)
+        return index.get(mask, [])
+
+
+class QualityManager(QualityRegistry):
+    """
+    Singleton class to manage the chord qualities.
+
+    This is the registry used when no other one is given or set with
+    :func:`use_registry`.
+    """
+
+    _instance: ClassVar["QualityManager | None"] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __new__(cls) -> "QualityManager":
+        instance = cls._instance
+        if instance is None:
+            with cls._instance_lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = super(QualityManager, cls).__new__(cls)
+                    QualityRegistry.__init__(instance)
+                    cls._instance = instance
+        return instance
+
+    def __init__(self) -> None:
+        # The singleton is initialized once in __new__.
+        pass
+
+
+_current_registry: ContextVar[QualityRegistry | None] = ContextVar(
+    "pychord_quality_registry", default=None
+)
+
+
+def get_registry() -> QualityRegistry:
+    """
+    Return the quality registry of the current context.
+
+    This is the registry set with :func:`use_registry`, or :class:`QualityManager`.
+    """
+    registry = _current_registry.get()
+    if registry is None:
+        return QualityManager()
+    return registry
+
+
+@contextmanager
+def use_registry(registry: QualityRegistry) -> Iterator[QualityRegistry]:
+    """
+    Use a quality registry by default within a ``with`` block.
+
+    The registry is stored in a context variable, so it only applies to
+    the current thread or asyncio task.
+
+    >>> registry = QualityRegistry()
+    >>> registry.set_quality("-", ("1", "3", "b5"))
+    >>> with use_registry(registry):
+    ...     Chord("C-").components()
+    ['C', 'E', 'Gb']
+    """
+    token = _current_registry.set(registry)
+    try:
+        yield registry
+    finally:
+        _current_registry.reset(token)
+
+
+def _build_pitch_class_index(
+    state: _QualityState,
+) -> dict[int, list[tuple[int, Quality]]]:
+    index: dict[int, list[tuple[int, Quality]]] = {}
+    for q in state.qualities.values():
+        if state.components_index[q.components] is not q:
+            continue
+        for root in range(12):
+            mask = (q._mask << root | q._mask >> (12 - root)) & 0xFFF
+            index.setdefault(mask, []).append((root, q))
+    return index
+
+
+def _reindex(
+    qualities: dict[str, Quality],
+    components_index: dict[tuple[int, ...], Quality],
+    components: tuple[int, ...],
+) -> None:
+    """Recompute the index entry for the given components.
+
+    The first registered quality wins, as with a linear scan.
+    """
+    for q in qualities.values():
+        if q.components == components:
+            components_index[components] = q
+            return
+    components_index.pop(components, None)
 
-    # Apply the interval and alteration.
-    notes_in_key = scale_notes(root, "maj")
-    note = notes_in_key[offset % 7]
-    for alteration in alterations:
-        if alteration == "#":
-            note = augment(note)
+
+# Table of every quality which has been given an id, see get_quality_id.
+# Default qualities are interned at the end of the module, so their ids are their indexes in DEFAULT_QUALITY_TABLE in every process.
+_quality_table: list[Quality] = []
+_quality_ids: dict[tuple[str, tuple[str, ...]], int] = {}
+_quality_table_lock = threading.Lock()
+
+
+def get_quality_id(quality: Quality) -> int:
+    """
+    Return a small integer identifying a quality by its name and intervals.
+
+    Ids are never reused, so they stay valid after the quality is
+    overridden with :meth:`QualityManager.set_quality`.
+    """
+    if quality._id >= 0:
+        return quality._id
+    key = (quality._quality, quality._intervals)
+    quality_id = _quality_ids.get(key)
+    if quality_id is None:
+        with _quality_table_lock:
+            quality_id = _quality_ids.get(key)
+            if quality_id is None:
+                quality_id = len(_quality_table)
+                _quality_table.append(quality)
+                _quality_ids[key] = quality_id
+    object.__setattr__(quality, "_id", quality_id)
+    return quality_id
+
+
+def _intern_quality(
+    name: str,
+    intervals: tuple[str, ...],
+    table: tuple[tuple[int, int, int], ...] | None = None,
+) -> Quality:
+    """Return the quality with an id for the given name and intervals"""
+    quality_id = _quality_ids.get((name, intervals))
+    if quality_id is None:
+        if table is None:
+            quality = Quality(name, intervals)
         else:
-            note = diminish(note)
-    return note
+            quality = Quality._from_table(name, intervals, table)
+        quality_id = get_quality_id(quality)
+    return _quality_table[quality_id]
 
 
-def _get_interval_pitch(interval: str) -> int:
-    alterations, offset = _parse_interval(interval)
+def get_quality_by_id(quality_id: int) -> Quality:
+    """
+    Return the quality identified by :func:`get_quality_id`.
+    """
+    if not 0 <= quality_id < len(_quality_table):
+        raise ValueError(f"Unknown quality id {quality_id}")
+    return _quality_table[quality_id]
 
+
+def pitch_classes_to_mask(values: Iterable[int]) -> int:
+    """
+    Return the pitch-class set of note values as a 12-bit mask.
+
+    >>> bin(pitch_classes_to_mask([0, 4, 7]))
+    '0b10010001'
+    """
+    mask = 0
+    for value in values:
+        mask |= 1 << value % 12
+    return mask
+
+
+@functools.lru_cache(maxsize=None)
+def _get_interval_entry(interval: str) -> tuple[int, int, int]:
+    """Return (alteration, degree offset, pitch) of an interval."""
+    alterations, offset = _parse_interval(interval)
+    alteration = alterations.count("#") - alterations.count("b")
     value = RELATIVE_KEY_DICT["maj"][offset % 7] + 12 * (offset // 7)
-    for alteration in alterations:
-        if alteration == "#":
-            value += 1
-        else:
-            value -= 1
-    return value
+    return alteration, offset, value + alteration
 
 
+@functools.lru_cache(maxsize=None)
 def _parse_interval(interval: str) -> tuple[str, int]:
-    m = re.match(r"^([b#]*)(\d+)$", interval)
+    m = interval_re.match(interval)
     assert m, f"Invalid interval {interval}"
     alterations = m.group(1)
     offset = int(m.group(2)) - 1
     return alterations, offset
 
 
+@functools.lru_cache(maxsize=None)
+def _major_scale_codes(root: int) -> tuple[int, ...]:
+    """Return the note codes of the major scale of a root note code."""
+    return tuple(note_to_code(n) for n in scale_notes(code_to_note(root), "maj"))
+
+
 @functools.lru_cache()
 def scale_notes(root: str, mode: str) -> list[str]:
     """
@@ -203,3 +611,9 @@ def scale_notes(root: str, mode: str) -> list[str]:
             raise ValueError(f"{root}{mode} scale requires too many accidentals")
 
     return notes
+
+
+# Give the default qualities the first ids, see _quality_table.
+for _name, _intervals, _table in DEFAULT_QUALITY_TABLE:
+    _intern_quality(_name, _intervals, _table)
+del _name, _intervals, _table
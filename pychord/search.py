@@ -0,0 +1,176 @@
+"""
+Search chord patterns in many chord progressions.
+
+>>> index = ProgressionIndex(progressions)
+>>> index.find(["Dm7", "G7", "Cmaj7"])  # ii-V-I in any key
+[3, 17, 240]
+"""
+
+from array import array
+from collections.abc import Iterable
+
+from .chord import Chord
+from .progression import ChordProgression
+
+# Bits of the position in postings, the progression index is above them
+_POSITION_BITS = 32
+_POSITION_MASK = (1 << _POSITION_BITS) - 1
+
+
+class ProgressionIndex:
+    """
+    An index of chord progressions answering which of them contain a
+    sequence of chords, in any key.
+
+    Chords are indexed by their quality components and the interval of
+    their bass note, and sequences by the intervals between their roots,
+    so that a pattern matches its transpositions and chords match like
+    with ``==`` (e.g. ``Cmaj7`` matches ``CM7``, and ``Dm7 G7`` matches
+    ``Em7 A7``). Sequences of ``n`` chords are indexed, and searching checks
+    the occurrences of the rarest sequence of the pattern instead of
+    scanning every progression.
+
+    Progressions are identified by their index, in the order they were
+    added.
+
+    :param progressions: Initial chord progressions.
+    :param n: Length of the indexed chord sequences.
+    """
+
+    def __init__(
+        self,
+        progressions: Iterable[ChordProgression | Iterable[Chord]] = (),
+        n: int = 3,
+    ) -> None:
+        if n < 1:
+            raise ValueError(f"Invalid n {n}")
+        self._n = n
+        # Small integers for the quality components seen so far
+        self._classes: dict[tuple[int, ...], int] = {}
+        # Chord tokens and root intervals from the previous chord of
+        # each progression
+        self._tokens: list[array[int]] = []
+        self._intervals: list[array[int]] = []
+        # Positions of each chord and each n-gram, as
+        # progression << _POSITION_BITS | position
+        self._postings: dict[tuple[int, ...], array[int]] = {}
+        for progression in progressions:
+            self.add(progression)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    @property
+    def n(self) -> int:
+        """
+        Length of the indexed chord sequences.
+        """
+        return self._n
+
+    def add(self, progression: ChordProgression | Iterable[Chord]) -> int:
+        """
+        Add a chord progression to the index.
+
+        :param progression: The chord progression.
+        :return: The index of the chord progression.
+        """
+        tokens, intervals = self._encode(progression, add=True)
+        doc = len(self._tokens)
+        self._tokens.append(tokens)
+        self._intervals.append(intervals)
+        base = doc << _POSITION_BITS
+        postings = self._postings
+        for pos in range(len(tokens)):
+            keys: list[tuple[int, ...]] = [(tokens[pos],)]
+            if self._n > 1 and pos + self._n <= len(tokens):
+                keys.append(self._gram(tokens, intervals, pos, self._n))
+            for key in keys:
+                posting = postings.get(key)
+                if posting is None:
+                    posting = postings[key] = array("Q")
+                posting.append(base | pos)
+        return doc
+
+    def search(
+        self, pattern: ChordProgression | Iterable[str | Chord]
+    ) -> list[tuple[int, int]]:
+        """
+        Find the occurrences of a sequence of chords.
+
+        :param pattern: The chords, in any key.
+        :return: The indexes of the chord progressions and the positions
+            of the pattern in them, in order.
+        """
+        tokens, intervals = self._encode(pattern, add=False)
+        size = len(tokens)
+        if size == 0:
+            raise ValueError("Empty pattern")
+        if any(token < 0 for token in tokens):
+            return []
+        length = self._n if size >= self._n else 1
+        best: array[int] | None = None
+        best_offset = 0
+        for offset in range(size - length + 1):
+            posting = self._postings.get(
+                self._gram(tokens, intervals, offset, length), array("Q")
+            )
+            if best is None or len(posting) < len(best):
+                best, best_offset = posting, offset
+        assert best is not None
+        matches = []
+        for entry in best:
+            doc = entry >> _POSITION_BITS
+            start = (entry & _POSITION_MASK) - best_offset
+            doc_tokens = self._tokens[doc]
+            if start < 0 or start + size > len(doc_tokens):
+                continue
+            if (
+                doc_tokens[start : start + size] == tokens
+                and self._intervals[doc][start + 1 : start + size] == intervals[1:]
+            ):
+                matches.append((doc, start))
+        return matches
+
+    def find(self, pattern: ChordProgression | Iterable[str | Chord]) -> list[int]:
+        """
+        Find the chord progressions containing a sequence of chords.
+
+        :param pattern: The chords, in any key.
+        :return: The indexes of the chord progressions, in order.
+        """
+        return sorted({doc for doc, _ in self.search(pattern)})
+
+    def _encode(
+        self, chords: ChordProgression | Iterable[str | Chord], add: bool
+    ) -> tuple["array[int]", "array[int]"]:
+        """
+        Return the tokens of the chords and the intervals between their
+        roots. Unknown qualities get the token -1 unless ``add`` is True.
+        """
+        tokens = array("l")
+        intervals = array("B")
+        classes = self._classes
+        if isinstance(chords, ChordProgression):
+            chords = chords._chords
+        previous = None
+        for chord in chords:
+            if isinstance(chord, str):
+                chord = Chord(chord)
+            root, components, on = chord.key
+            class_id = classes.get(components)
+            if class_id is None:
+                if add:
+                    class_id = classes[components] = len(classes)
+                else:
+                    class_id = -1
+            bass = 0 if on is None else (on - root) % 12 + 1
+            tokens.append(-1 if class_id < 0 else class_id * 13 + bass)
+            intervals.append(0 if previous is None else (root - previous) % 12)
+            previous = root
+        return tokens, intervals
+
+    @staticmethod
+    def _gram(
+        tokens: "array[int]", intervals: "array[int]", pos: int, length: int
+    ) -> tuple[int, ...]:
+        return (*tokens[pos : pos + length], *intervals[pos + 1 : pos + length])
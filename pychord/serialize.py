@@ -0,0 +1,389 @@
+"""
+Compact binary encoding of chords and chord progressions.
+
+A chord takes two bytes in most cases (three with a bass note):
+
+- one byte for the root note, whose bit 6 tells that a bass note follows
+  and bit 7 that the quality is not a default one,
+- the id of the quality in ``SERIALIZED_QUALITIES`` as a varint,
+- the bass note, if any.
+
+``SERIALIZED_QUALITIES`` is append-only, so ids keep their meaning when
+default qualities are added. Inversions of these qualities, up to
+``MAX_INVERSION`` like in chord names, are stored as the inversion and
+the id of the quality. Other qualities are stored with their name and
+intervals, so encoded chords do not depend on the qualities registered
+in a process. Loading never parses chord names.
+
+Files hold a header followed by progressions, each one prefixed with its
+length, see :func:`dump` and :func:`load`.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import repeat
+from typing import BinaryIO
+
+from .chord import Chord
+from .constants.quality_ids import SERIALIZED_QUALITIES
+from .constants.quality_table import DEFAULT_QUALITY_TABLE
+from .constants.scales import RELATIVE_KEY_DICT
+from .progression import ChordProgression, _ChordArray
+from .quality import (
+    MAX_INVERSION,
+    Quality,
+    QualityRegistry,
+    _intern_quality,
+    get_quality_by_id,
+    get_quality_id,
+)
+from .utils import LETTERS, note_to_code
+
+MAGIC = b"PYCH"
+VERSION = 1
+
+_BASS = 0x40
+_EXTENDED = 0x80
+_NOTE_MASK = 0x3F
+
+# Note codes by note index, from Cbb to B##
+_NOTE_CODES = [
+    note_to_code(letter + ("#" * accidental if accidental > 0 else "b" * -accidental))
+    for letter in LETTERS
+    for accidental in range(-2, 3)
+]
+_NOTE_INDEXES = {code: i for i, code in enumerate(_NOTE_CODES)}
+
+_DEFAULT_IDS = {quality: i for i, quality in enumerate(SERIALIZED_QUALITIES)}
+# Ids of the default qualities by name, for their inversions
+_DEFAULT_NAMES = {
+    name: _DEFAULT_IDS[(name, intervals)]
+    for name, intervals, _ in DEFAULT_QUALITY_TABLE
+}
+
+# Encoded qualities by quality id (see get_quality_id), with the
+# _EXTENDED flag of the first byte
+_encoded_qualities: dict[int, tuple[int, bytes]] = {}
+# Decoded default qualities, and inversions by (default id, inversion)
+_default_qualities: list[Quality] = []
+_inverted_qualities: dict[tuple[int, int], Quality] = {}
+
+
+def encode_chord(chord: Chord) -> bytes:
+    """
+    Encode a chord.
+
+    >>> encode_chord(Chord("Am7/G"))
+    b'[\\x1a\\x16'
+
+    :param chord: The chord.
+    """
+    out = bytearray()
+    _encode(out, chord._root_code, chord.quality, chord._on_code)
+    return bytes(out)
+
+
+def decode_chord(data: bytes | memoryview) -> Chord:
+    """
+    Decode a chord encoded with :func:`encode_chord`.
+
+    :param data: The encoded chord.
+    """
+    chord, pos = _decode(data, 0)
+    if pos != len(data):
+        raise ValueError("Unexpected data after the chord")
+    return chord
+
+
+def dumps(progression: ChordProgression | Iterable[Chord]) -> bytes:
+    """
+    Encode a chord progression, or any sequence of chords.
+
+    :param progression: The chord progression.
+    """
+    out = bytearray()
+    chords = (
+        progression._chords
+        if isinstance(progression, ChordProgression)
+        else progression
+    )
+    if isinstance(chords, _ChordArray):
+        _write_varint(out, len(chords))
+        for root, quality_id, on in zip(chords._roots, chords._qualities, chords._ons):
+            _encode(out, root, get_quality_by_id(quality_id), on or None)
+        return bytes(out)
+    chords = list(chords)
+    _write_varint(out, len(chords))
+    for chord in chords:
+        _encode(out, chord._root_code, chord.quality, chord._on_code)
+    return bytes(out)
+
+
+def loads(data: bytes | memoryview, compact: bool = False) -> ChordProgression:
+    """
+    Decode a chord progression encoded with :func:`dumps`.
+
+    :param data: The encoded chord progression.
+    :param compact: Create a compact chord progression, see :class:`ChordProgression`.
+    """
+    try:
+        progression, pos = _loads(data, 0, compact)
+    except IndexError:
+        raise ValueError("Invalid chord progression data")
+    if pos != len(data):
+        raise ValueError("Unexpected data after the chord progression")
+    return progression
+
+
+def dump(progressions: Iterable[ChordProgression], file: BinaryIO) -> int:
+    """
+    Write chord progressions to a binary file.
+
+    :param progressions: The chord progressions.
+    :param file: A file opened for writing in binary mode.
+    :return: The number of chord progressions written.
+    """
+    file.write(MAGIC + bytes([VERSION]))
+    count = 0
+    for progression in progressions:
+        payload = dumps(progression)
+        header = bytearray()
+        _write_varint(header, len(payload))
+        file.write(header + payload)
+        count += 1
+    return count
+
+
+def load(file: BinaryIO, compact: bool = False) -> Iterator[ChordProgression]:
+    """
+    Read chord progressions lazily from a binary file written by :func:`dump`.
+
+    :param file: A file opened for reading in binary mode.
+    :param compact: Create compact chord progressions, see :class:`ChordProgression`.
+    """
+    header = file.read(len(MAGIC) + 1)
+    if len(header) <= len(MAGIC) or header[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not a chord progression file")
+    if header[len(MAGIC)] != VERSION:
+        raise ValueError(f"Unsupported version {header[len(MAGIC)]}")
+    while True:
+        size = _read_file_varint(file)
+        if size is None:
+            return
+        payload = file.read(size)
+        if len(payload) != size:
+            raise ValueError("Truncated chord progression file")
+        yield loads(payload, compact)
+
+
+def _encode(out: bytearray, root: int, quality: Quality, on: int | None) -> None:
+    quality_id = get_quality_id(quality)
+    encoded = _encoded_qualities.get(quality_id)
+    if encoded is None:
+        encoded = _encoded_qualities[quality_id] = _encode_quality(quality)
+    flags, quality_bytes = encoded
+    try:
+        if on is None:
+            out.append(_NOTE_INDEXES[root] | flags)
+            out += quality_bytes
+        else:
+            out.append(_NOTE_INDEXES[root] | flags | _BASS)
+            out += quality_bytes
+            out.append(_NOTE_INDEXES[on])
+    except KeyError:
+        raise ValueError("Cannot encode notes with more than two accidentals")
+
+
+def _encode_quality(quality: Quality) -> tuple[int, bytes]:
+    out = bytearray()
+    default_id = _DEFAULT_IDS.get((quality.quality, quality._intervals))
+    if default_id is not None:
+        _write_varint(out, default_id)
+        return 0, bytes(out)
+    default_id = _DEFAULT_NAMES.get(quality.quality)
+    if default_id is not None:
+        default = _get_default_quality(default_id)
+        for inversion in range(1, MAX_INVERSION + 1):
+            inverted = _get_inverted_quality(default_id, inversion)
+            if inverted._intervals == quality._intervals:
+                _write_varint(out, inversion)
+                _write_varint(out, default_id)
+                return _EXTENDED, bytes(out)
+    # Neither a default quality nor one of its inversions
+    _write_varint(out, 0)
+    name = quality.quality.encode()
+    _write_varint(out, len(name))
+    out += name
+    _write_varint(out, len(quality._table))
+    for alteration, offset, _ in quality._table:
+        out.append(alteration + 8)
+        _write_varint(out, offset)
+    return _EXTENDED, bytes(out)
+
+
+def _decode(data: bytes | memoryview, pos: int) -> tuple[Chord, int]:
+    root, quality, on, pos, inversion = _decode_codes(data, pos)
+    return Chord._from_codes(root, quality, on, None, inversion), pos
+
+
+def _decode_codes(
+    data: bytes | memoryview, pos: int
+) -> tuple[int, Quality, int | None, int, int]:
+    """Return the root code, quality, bass code, next position and inversion"""
+    try:
+        first = data[pos]
+        root = _NOTE_CODES[first & _NOTE_MASK]
+        inversion = 0
+        if first & _EXTENDED:
+            inversion, pos = _read_varint(data, pos + 1)
+            if inversion:
+                default_id, pos = _read_varint(data, pos)
+                quality = _get_inverted_quality(default_id, inversion)
+            else:
+                quality, pos = _read_quality(data, pos)
+        else:
+            default_id, pos = _read_varint(data, pos + 1)
+            quality = _get_default_quality(default_id)
+        on = None
+        if first & _BASS:
+            on = _NOTE_CODES[data[pos]]
+            pos += 1
+    except IndexError:
+        raise ValueError("Invalid chord data")
+    return root, quality, on, pos, inversion
+
+
+def _read_quality(data: bytes | memoryview, pos: int) -> tuple[Quality, int]:
+    size, pos = _read_varint(data, pos)
+    name = bytes(data[pos : pos + size]).decode()
+    pos += size
+    count, pos = _read_varint(data, pos)
+    table = []
+    for _ in range(count):
+        alteration = data[pos] - 8
+        offset, pos = _read_varint(data, pos + 1)
+        table.append((alteration, offset, _interval_pitch(alteration, offset)))
+    intervals = tuple(
+        ("#" * a if a > 0 else "b" * -a) + str(o + 1) for a, o, _ in table
+    )
+    return _intern_quality(name, intervals, tuple(table)), pos
+
+
+def _interval_pitch(alteration: int, offset: int) -> int:
+    """Same as the pitch of pychord.quality._get_interval_entry, without parsing"""
+    return RELATIVE_KEY_DICT["maj"][offset % 7] + 12 * (offset // 7) + alteration
+
+
+def _get_default_qualities() -> list[Quality]:
+    if not _default_qualities:
+        tables = {
+            (name, intervals): table for name, intervals, table in DEFAULT_QUALITY_TABLE
+        }
+        _default_qualities.extend(
+            _intern_quality(name, intervals, tables.get((name, intervals)))
+            for name, intervals in SERIALIZED_QUALITIES
+        )
+    return _default_qualities
+
+
+def _get_default_quality(default_id: int) -> Quality:
+    qualities = _get_default_qualities()
+    if default_id >= len(qualities):
+        raise ValueError(f"Unknown quality id {default_id}")
+    return qualities[default_id]
+
+
+def _get_inverted_quality(default_id: int, inversion: int) -> Quality:
+    quality = _inverted_qualities.get((default_id, inversion))
+    if quality is None:
+        default = _get_default_quality(default_id)
+        if not 1 <= inversion <= MAX_INVERSION:
+            raise ValueError(f"Invalid inversion {inversion}")
+        inverted = QualityRegistry._invert(default, inversion)
+        quality = _intern_quality(inverted.quality, inverted._intervals)
+        _inverted_qualities[(default_id, inversion)] = quality
+    return quality
+
+
+def _loads(
+    data: bytes | memoryview, pos: int, compact: bool
+) -> tuple[ChordProgression, int]:
+    count, pos = _read_varint(data, pos)
+    defaults = _get_default_qualities()
+    # Quality ids below this take one byte and need no lookup
+    fast_ids = min(len(defaults), 0x80)
+    roots: list[int] = []
+    qualities: list[Quality] = []
+    ons: list[int | None] = []
+    inversions: list[int] = []
+    for _ in range(count):
+        first = data[pos]
+        quality_id = data[pos + 1]
+        if first & _EXTENDED or quality_id >= fast_ids:
+            root, quality, on, pos, inversion = _decode_codes(data, pos)
+            roots.append(root)
+            qualities.append(quality)
+            ons.append(on)
+            inversions.append(inversion)
+            continue
+        roots.append(_NOTE_CODES[first & _NOTE_MASK])
+        qualities.append(defaults[quality_id])
+        if first & _BASS:
+            ons.append(_NOTE_CODES[data[pos + 2]])
+            pos += 3
+        else:
+            ons.append(None)
+            pos += 2
+        inversions.append(0)
+    progression = ChordProgression(compact=compact)
+    if compact:
+        chords = progression._chords
+        assert isinstance(chords, _ChordArray)
+        quality_ids = [get_quality_id(q) for q in qualities]
+        chords._roots = array("H", roots)
+        chords._qualities = array(
+            "H" if max(quality_ids, default=0) <= 0xFFFF else "L", quality_ids
+        )
+        chords._ons = array("H", [on or 0 for on in ons])
+        chords._inversions = array("H", inversions)
+    else:
+        from_codes = Chord._from_codes
+        progression._chords = list(
+            map(from_codes, roots, qualities, ons, repeat(None), inversions)
+        )
+    return progression, pos
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes | memoryview, pos: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _read_file_varint(file: BinaryIO) -> int | None:
+    """Read a varint from a file, None at the end of the file"""
+    value = 0
+    shift = 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            if shift:
+                raise ValueError("Truncated chord progression file")
+            return None
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
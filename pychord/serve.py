@@ -0,0 +1,233 @@
+"""
+A local chord recognition server.
+
+Run it with::
+
+    python -m pychord.serve --port 8765        # TCP on 127.0.0.1
+    python -m pychord.serve --unix /tmp/pychord.sock
+
+Clients send one JSON request per line and receive one JSON response
+per line, in the same order. Requests can be pipelined: the requests
+received together are handled as one batch, and their responses are
+written at once. A line can also hold a JSON array of requests, which
+gets a JSON array of responses.
+
+Requests are objects with an ``"op"`` and its arguments, and an optional
+``"id"`` which is copied to the response::
+
+    {"id": 1, "op": "parse", "chord": "Am7/G"}
+    {"id": 2, "op": "components", "chord": "Am7", "visible": true}
+    {"id": 3, "op": "components", "chord": "Am7", "root_pitch": 3}
+    {"id": 4, "op": "transpose", "chord": "Am7", "trans": 3, "scale": "C"}
+    {"id": 5, "op": "find_chords", "notes": ["C", "E", "G"], "ordered": true}
+
+Responses hold either a ``"result"`` or an ``"error"`` message::
+
+    {"id": 4, "result": "Cm7"}
+    {"id": 6, "error": "Invalid note H"}
+
+Requests are handled on the threads of the default executor of the event
+loop, so a slow request does not hold up the other connections.
+
+The process keeps its parse cache and quality indexes between requests,
+and fills them on startup unless ``--no-warm`` is given.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from .analyzer import find_chords_from_notes
+from .chord import Chord
+from .constants.scales import FLATTED_SCALE, SCALE_VAL_DICT, SHARPED_SCALE
+from .parser import parse
+from .quality import get_registry
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Size of the chunks read from a connection
+READ_SIZE = 64 * 1024
+
+# Maximum length of a request line, longer lines close the connection
+MAX_LINE_LENGTH = 1024 * 1024
+
+
+def warm_up() -> None:
+    """
+    Fill the parse cache with every default chord without a bass note
+    and build the quality indexes.
+    """
+    registry = get_registry()
+    registry.find_qualities_from_mask(0)
+    roots = {*SHARPED_SCALE.values(), *FLATTED_SCALE.values()}
+    for root in sorted(roots):
+        for quality in registry.get_qualities():
+            parse(f"{root}{quality}", registry)
+
+
+def _parse_op(request: dict[str, Any]) -> Any:
+    root, quality, on = parse(request["chord"])
+    return {
+        "root": root,
+        "quality": quality.quality,
+        "intervals": quality.intervals,
+        "on": on or None,
+    }
+
+
+def _components_op(request: dict[str, Any]) -> Any:
+    chord = Chord(request["chord"])
+    if request.get("root_pitch") is not None:
+        return chord.components_with_pitch(request["root_pitch"])
+    return chord.components(visible=request.get("visible", True))
+
+
+def _transpose_op(request: dict[str, Any]) -> Any:
+    chord = Chord(request["chord"])
+    scale = request.get("scale", "C")
+    if not isinstance(scale, str) or scale not in SCALE_VAL_DICT:
+        raise ValueError(f"Invalid scale {scale}")
+    return chord.transposed(request["trans"], scale).chord
+
+
+def _find_chords_op(request: dict[str, Any]) -> Any:
+    chords = find_chords_from_notes(request["notes"], request.get("ordered", True))
+    return [chord.chord for chord in chords]
+
+
+OPERATIONS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "parse": _parse_op,
+    "components": _components_op,
+    "transpose": _transpose_op,
+    "find_chords": _find_chords_op,
+}
+
+# Arguments each operation cannot do without
+REQUIRED_ARGUMENTS: dict[str, tuple[str, ...]] = {
+    "parse": ("chord",),
+    "components": ("chord",),
+    "transpose": ("chord", "trans"),
+    "find_chords": ("notes",),
+}
+
+
+def handle_request(request: Any) -> dict[str, Any]:
+    """
+    Return the response to a decoded request.
+    """
+    if not isinstance(request, dict):
+        return {"error": "Request must be an object"}
+    response: dict[str, Any] = {}
+    if "id" in request:
+        response["id"] = request["id"]
+    name = request.get("op")
+    if not isinstance(name, str) or name not in OPERATIONS:
+        response["error"] = f"Unknown op {name}"
+        return response
+    op = OPERATIONS[name]
+    for argument in REQUIRED_ARGUMENTS.get(name, ()):
+        if argument not in request:
+            response["error"] = f"Missing argument {argument!r}"
+            return response
+    try:
+        response["result"] = op(request)
+    except (TypeError, ValueError, NotImplementedError) as e:
+        response["error"] = str(e)
+    return response
+
+
+def handle_line(line: bytes) -> bytes:
+    """
+    Return the response line to a request line.
+    """
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        response: Any = {"error": f"Invalid JSON: {e}"}
+    except RecursionError:
+        response = {"error": "Invalid JSON: too deeply nested"}
+    else:
+        if isinstance(request, list):
+            response = [handle_request(r) for r in request]
+        else:
+            response = handle_request(request)
+    return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+
+def _handle_lines(lines: list[bytes]) -> bytes:
+    return b"".join(handle_line(line) for line in lines)
+
+
+async def handle_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """
+    Answer the requests of a client until it disconnects.
+    """
+    loop = asyncio.get_running_loop()
+    buffer = b""
+    try:
+        while data := await reader.read(READ_SIZE):
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            lines = [line for line in lines if line.strip()]
+            if lines:
+                responses = await loop.run_in_executor(None, _handle_lines, lines)
+                writer.write(responses)
+                await writer.drain()
+            if len(buffer) > MAX_LINE_LENGTH:
+                writer.write(b'{"error":"Request too long"}\n')
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(
+    host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, path: str | None = None
+) -> asyncio.Server:
+    """
+    Start serving on TCP, or on a Unix socket if ``path`` is given.
+    """
+    if path is not None:
+        return await asyncio.start_unix_server(handle_connection, path)
+    return await asyncio.start_server(handle_connection, host, port)
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    path: str | None = None,
+    warm: bool = True,
+) -> None:
+    """
+    Run the server until cancelled.
+    """
+    if warm:
+        warm_up()
+    server = await start_server(host, port, path)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run a pychord server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket")
+    parser.add_argument("--no-warm", action="store_true", help="skip cache warm-up")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, not args.no_warm))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
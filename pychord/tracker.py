@@ -0,0 +1,230 @@
+"""
+Real-time chord recognition from note-on and note-off events.
+"""
+
+import bisect
+import re
+import time
+from collections.abc import Callable
+
+from .analyzer import _find_unordered_chords
+from .chord import Chord
+from .constants.scales import NOTE_VALUES
+from .quality import QualityRegistry, get_registry
+from .utils import (
+    LETTERS,
+    code_accidental,
+    code_letter,
+    code_to_note,
+    code_to_val,
+    note_to_code,
+    transpose_code,
+)
+
+note_with_octave_re = re.compile(r"^([A-G][b#]*)(-?\d+)?$")
+
+C_CODE = note_to_code("C")
+
+
+class ChordTracker:
+    """
+    Recognize chords from a stream of note-on and note-off events.
+
+    The sounding notes are tracked incrementally, and chords are only
+    looked up again when the lowest note of each pitch class, in order,
+    changes. Chords are found like ``find_chords_from_notes(notes,
+    ordered=False)`` with the sounding notes from the lowest one.
+
+    >>> tracker = ChordTracker()
+    >>> tracker.note_on(60)
+    >>> tracker.note_on("E4")
+    [<Chord: Cno5>]
+    >>> tracker.note_on("G4")
+    [<Chord: C>]
+    >>> tracker.note_on("A3")
+    [<Chord: Am7>, <Chord: C6/A>]
+
+    With ``debounce``, a change is only reported once the chords have
+    stayed the same for that long, so that notes of a chord played
+    slightly apart do not report every intermediate chord. Pending
+    changes are reported by the next event or by :meth:`poll`.
+
+    :param on_change: Called with the new chords each time they change.
+    :param debounce: Seconds a change must last before being reported.
+    :param key: Key used to spell notes given as MIDI numbers, as in :func:`pychord.utils.transpose_note`.
+    :param registry: Qualities to use, defaults to :func:`pychord.quality.get_registry`.
+    """
+
+    def __init__(
+        self,
+        on_change: Callable[[list[Chord]], None] | None = None,
+        debounce: float = 0.0,
+        key: str = "C",
+        registry: QualityRegistry | None = None,
+    ) -> None:
+        if debounce < 0:
+            raise ValueError(f"Invalid debounce {debounce}")
+        self._on_change = on_change
+        self._debounce = debounce
+        self._key = key
+        self._registry = registry
+        # Sounding MIDI pitches in ascending order, and their note codes
+        self._pitches: list[int] = []
+        self._codes: dict[int, int] = {}
+        # Number of sounding notes of each pitch class
+        self._pitch_classes = [0] * 12
+        self._mask = 0
+        self._chords: list[Chord] = []
+        # Chords of the current notes, when they started, and the
+        # note codes they were found with, one per pitch class from the lowest
+        self._current: list[Chord] = []
+        self._since = 0.0
+        self._lookup: tuple[int, ...] = ()
+
+    @property
+    def chords(self) -> list[Chord]:
+        """
+        The last reported chords.
+        """
+        return list(self._chords)
+
+    @property
+    def notes(self) -> list[str]:
+        """
+        The sounding notes from the lowest one, e.g. ``["E3", "C4", "G4"]``.
+        """
+        notes = []
+        for pitch in self._pitches:
+            code = self._codes[pitch]
+            octave = (pitch - _letter_value(code)) // 12 - 1
+            notes.append(f"{code_to_note(code)}{octave}")
+        return notes
+
+    def note_on(
+        self, note: int | str, timestamp: float | None = None
+    ) -> list[Chord] | None:
+        """
+        Start a note. Notes which are already sounding are ignored.
+
+        :param note: MIDI note number, or note name with an optional octave (``"C4"`` is 60, ``"C"`` means ``"C4"``).
+        :param timestamp: Time of the event in seconds, defaults to :func:`time.monotonic`.
+        :return: The new chords if a change is reported, otherwise ``None``.
+        """
+        pitch, code = self._to_pitch(note)
+        if pitch in self._codes:
+            return self.poll(timestamp)
+        bisect.insort(self._pitches, pitch)
+        self._codes[pitch] = code
+        pitch_class = pitch % 12
+        self._pitch_classes[pitch_class] += 1
+        self._mask |= 1 << pitch_class
+        return self._update(timestamp)
+
+    def note_off(
+        self, note: int | str, timestamp: float | None = None
+    ) -> list[Chord] | None:
+        """
+        Stop a note. Notes which are not sounding are ignored.
+
+        :param note: MIDI note number, or note name with an optional octave.
+        :param timestamp: Time of the event in seconds, defaults to :func:`time.monotonic`.
+        :return: The new chords if a change is reported, otherwise ``None``.
+        """
+        pitch, _ = self._to_pitch(note)
+        if pitch not in self._codes:
+            return self.poll(timestamp)
+        self._pitches.remove(pitch)
+        del self._codes[pitch]
+        pitch_class = pitch % 12
+        self._pitch_classes[pitch_class] -= 1
+        if not self._pitch_classes[pitch_class]:
+            self._mask &= ~(1 << pitch_class)
+        return self._update(timestamp)
+
+    def reset(self, timestamp: float | None = None) -> list[Chord] | None:
+        """
+        Stop all notes.
+
+        :param timestamp: Time of the event in seconds, defaults to :func:`time.monotonic`.
+        :return: The new chords if a change is reported, otherwise ``None``.
+        """
+        self._pitches.clear()
+        self._codes.clear()
+        self._pitch_classes = [0] * 12
+        self._mask = 0
+        return self._update(timestamp)
+
+    def poll(self, timestamp: float | None = None) -> list[Chord] | None:
+        """
+        Report the pending change if it has lasted for ``debounce`` seconds.
+
+        :param timestamp: Current time in seconds, defaults to :func:`time.monotonic`.
+        :return: The new chords if a change is reported, otherwise ``None``.
+        """
+        if self._current == self._chords:
+            return None
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if timestamp - self._since < self._debounce:
+            return None
+        return self._report()
+
+    def _update(self, timestamp: float | None) -> list[Chord] | None:
+        if timestamp is None:
+            timestamp = time.monotonic()
+        reported = self.poll(timestamp)
+        chords = self._find_chords()
+        if chords != self._current:
+            self._current = chords
+            self._since = timestamp
+            if chords != self._chords and self._debounce == 0:
+                reported = self._report()
+        return reported
+
+    def _report(self) -> list[Chord]:
+        self._chords = self._current
+        if self._on_change is not None:
+            self._on_change(list(self._chords))
+        return list(self._chords)
+
+    def _find_chords(self) -> list[Chord]:
+        # One note per pitch class, from the lowest one
+        codes: list[int] = []
+        seen = 0
+        for pitch in self._pitches:
+            bit = 1 << pitch % 12
+            if not seen & bit:
+                seen |= bit
+                codes.append(self._codes[pitch])
+        lookup = tuple(codes)
+        if lookup == self._lookup:
+            return self._current
+        self._lookup = lookup
+        if not codes:
+            return []
+        registry = self._registry if self._registry is not None else get_registry()
+        candidates = registry.find_qualities_from_mask(self._mask)
+        return _find_unordered_chords(
+            codes, [code_to_val(c) for c in codes], candidates
+        )
+
+    def _to_pitch(self, note: int | str) -> tuple[int, int]:
+        """Return the MIDI pitch and the note code of a note"""
+        if isinstance(note, int):
+            if not 0 <= note <= 127:
+                raise ValueError(f"Invalid MIDI note {note}")
+            return note, transpose_code(C_CODE, note, self._key)
+        m = note_with_octave_re.match(note)
+        if not m:
+            raise ValueError(f"Invalid note {note}")
+        code = note_to_code(m.group(1))
+        octave = int(m.group(2)) if m.group(2) else 4
+        pitch = 12 * (octave + 1) + _letter_value(code)
+        if not 0 <= pitch <= 127:
+            raise ValueError(f"Invalid note {note}")
+        return pitch, code
+
+
+def _letter_value(code: int) -> int:
+    """Return the value of a note from the C of its octave, e.g. -1 for Cb"""
+    return NOTE_VALUES[LETTERS[code_letter(code)]] + code_accidental(code)
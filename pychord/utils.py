@@ -1,5 +1,45 @@
 from .constants.scales import NOTE_VALUES, SCALE_VAL_DICT
 
+# A note code packs the pitch class, the letter and the accidental of a
+# note into a small int: ``pitch_class << 8 | letter << 4 | accidental + 8``.
+# ``letter`` is the index in ``LETTERS`` and ``accidental`` counts sharps
+# (positive) or flats (negative).
+LETTERS = ("C", "D", "E", "F", "G", "A", "B")
+
+
+def _make_code(letter: int, accidental: int) -> int:
+    pitch = (NOTE_VALUES[LETTERS[letter]] + accidental) % 12
+    return pitch << 8 | letter << 4 | accidental + 8
+
+
+def _make_name(letter: int, accidental: int) -> str:
+    return LETTERS[letter] + ("#" * accidental if accidental > 0 else "b" * -accidental)
+
+
+# Names which can be parsed (up to two accidentals).
+_NOTE_CODES = {
+    _make_name(letter, accidental): _make_code(letter, accidental)
+    for letter in range(7)
+    for accidental in range(-2, 3)
+}
+
+# Names which can be produced by altering a parsed note.
+_CODE_NAMES = {
+    _make_code(letter, accidental): _make_name(letter, accidental)
+    for letter in range(7)
+    for accidental in range(-4, 5)
+}
+
+# Transposed note codes by key, semitones and pitch class:
+# _TRANSPOSE_CODES[scale][transpose][pitch]
+_TRANSPOSE_CODES = {
+    scale: tuple(
+        tuple(_NOTE_CODES[notes[(pitch + transpose) % 12]] for pitch in range(12))
+        for transpose in range(12)
+    )
+    for scale, notes in SCALE_VAL_DICT.items()
+}
+
 
 def augment(note: str) -> str:
     """
@@ -29,6 +69,9 @@ def note_to_val(note: str) -> int:
     >>> note_to_val("B")
     11
     """
+    code = _NOTE_CODES.get(note)
+    if code is not None:
+        return code >> 8
     try:
         pitch = NOTE_VALUES[note[0]]
     except KeyError:
@@ -49,6 +92,45 @@ def transpose_note(note: str, transpose: int, scale: str = "C") -> str:
     >>> transpose_note("D", 4, "A")
     "F#"
     """
-    val = note_to_val(note)
-    val += transpose
-    return SCALE_VAL_DICT[scale][val % 12]
+    return _CODE_NAMES[_TRANSPOSE_CODES[scale][transpose % 12][note_to_val(note)]]
+
+
+def note_to_code(note: str) -> int:
+    """Get the note code of a note name
+
+    :param note: Note name with up to two flats or sharps, e.g. ``"F#"``.
+    """
+    try:
+        return _NOTE_CODES[note]
+    except KeyError:
+        raise ValueError(f"Invalid note {note}")
+
+
+def code_to_note(code: int) -> str:
+    """Get the note name of a note code"""
+    return _CODE_NAMES[code]
+
+
+def code_to_val(code: int) -> int:
+    """Get index value (pitch class) of a note code"""
+    return code >> 8
+
+
+def code_letter(code: int) -> int:
+    """Get the letter index of a note code, ``0`` for C to ``6`` for B"""
+    return code >> 4 & 0xF
+
+
+def code_accidental(code: int) -> int:
+    """Get the accidental of a note code, positive for sharps"""
+    return (code & 0xF) - 8
+
+
+def alter_code(code: int, alteration: int) -> int:
+    """Raise (or lower if negative) a note code by semitones, keeping its letter"""
+    return _make_code(code_letter(code), code_accidental(code) + alteration)
+
+
+def transpose_code(code: int, transpose: int, scale: str = "C") -> int:
+    """Transpose a note code, like :func:`transpose_note`"""
+    return _TRANSPOSE_CODES[scale][transpose % 12][code >> 8]
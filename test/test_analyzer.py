@@ -39,6 +39,15 @@ class TestFindChordsFromNotes(unittest.TestCase):
         with self.assertRaises(ValueError):
             find_chords_from_notes([])
 
+    def test_too_many_accidentals(self):
+        for ordered in (True, False):
+            with self.subTest(ordered=ordered):
+                self.assertEqual(
+                    find_chords_from_notes(["C###", "E", "G"], ordered), []
+                )
+                with self.assertRaises(ValueError):
+                    find_chords_from_notes(["C###", "F##", "A#"], ordered)
+
     def test_find_chords_from_notes(self):
         """
         Validates that the specified notes translated to the expected chords.
@@ -79,3 +88,24 @@ class TestFindChordsFromNotes(unittest.TestCase):
             self.assertEqual(
                 chords[0].components(visible=True), ["Eb", "Gb", "Bbb", "Dbb"]
             )
+
+
+class TestFindChordsFromUnorderedNotes(unittest.TestCase):
+    def test_find_chords_from_unordered_notes(self):
+        for notes, expected_chord_strs in [
+            (["C", "G", "E"], ["C"]),
+            (["E", "C", "G"], ["C/E"]),
+            (["E", "C", "A", "G"], ["C6/E", "Am7/E"]),
+            (["Eb", "A", "Gb", "C"], ["Ebdim7", "Adim7/Eb", "Gbdim7/Eb", "Cdim7/Eb"]),
+            (["C", "D", "F#"], []),
+        ]:
+            with self.subTest(notes=notes):
+                chords = find_chords_from_notes(notes, ordered=False)
+                self.assertEqual([str(c) for c in chords], expected_chord_strs)
+
+    def test_contains_ordered_results(self):
+        notes = ["F#", "A", "C", "E"]
+        ordered = find_chords_from_notes(notes)
+        unordered = find_chords_from_notes(notes, ordered=False)
+        for chord in ordered:
+            self.assertIn(chord, unordered)
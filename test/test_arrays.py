@@ -0,0 +1,43 @@
+import unittest
+
+from pychord import Chord, ChordProgression
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+else:
+    from pychord.arrays import chords_to_pitch_array, chords_to_pitch_offsets
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestPitchArray(unittest.TestCase):
+    def test_matches_components_with_pitch(self):
+        names = ["C", "Am7", "C/G", "F/1", "Cm7/3/F", "G13"]
+        chords = [Chord(name) for name in names]
+        offsets, values = chords_to_pitch_offsets(chords, root_pitch=3)
+        for i, chord in enumerate(chords):
+            with self.subTest(chord=chord):
+                notes = chord.components_with_pitch(root_pitch=3)
+                pitches = values[offsets[i] : offsets[i + 1]].tolist()
+                self.assertEqual(len(pitches), len(notes))
+                for note, pitch in zip(notes, pitches):
+                    name, octave = note[:-1], int(note[-1])
+                    self.assertEqual(pitch % 12, Chord(name).components(False)[0] % 12)
+                    self.assertEqual(pitch // 12 - 1, octave)
+
+    def test_pitch_array(self):
+        array = chords_to_pitch_array([Chord("C"), Chord("G7")])
+        self.assertEqual(array.tolist(), [[60, 64, 67, -1], [67, 71, 74, 77]])
+
+    def test_pad(self):
+        array = chords_to_pitch_array([Chord("C5"), Chord("C")], pad=0)
+        self.assertEqual(array.tolist(), [[60, 67, 0], [60, 64, 67]])
+
+    def test_empty(self):
+        self.assertEqual(chords_to_pitch_array([]).shape, (0, 0))
+
+    def test_progression(self):
+        cp = ChordProgression(["Am7", "C/G"])
+        array = cp.to_pitch_array(root_pitch=3)
+        self.assertEqual(array.tolist(), [[57, 60, 64, 67], [55, 60, 64, -1]])
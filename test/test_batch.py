@@ -0,0 +1,130 @@
+import multiprocessing
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from unittest import mock
+
+from pychord import Chord, ChordProgression, QualityManager, QualityRegistry
+from pychord import batch, use_registry
+from pychord.batch import find_chords_many, parse_chords, transpose_progressions
+from pychord.batch import _init_worker
+
+
+class TestBatch(unittest.TestCase):
+    def tearDown(self):
+        QualityManager().load_default_qualities()
+        batch._registry = None
+
+    def test_find_chords_many(self):
+        note_lists = [["C", "E", "G"], ["G", "C", "D"], ["C", "D", "F#"]] * 3
+        for max_workers in [0, 2]:
+            with self.subTest(max_workers=max_workers):
+                results = find_chords_many(
+                    note_lists, max_workers=max_workers, chunksize=2
+                )
+                self.assertEqual(
+                    [[str(c) for c in chords] for chords in results],
+                    [["C"], ["Gsus4", "Csus2/G"], []] * 3,
+                )
+
+    def test_find_chords_many_unordered(self):
+        results = find_chords_many([["C", "G", "E"]], ordered=False, max_workers=0)
+        self.assertEqual(results, [[Chord("C")]])
+
+    def test_parse_chords(self):
+        for max_workers in [0, 2]:
+            with self.subTest(max_workers=max_workers):
+                results = parse_chords(
+                    ["C", "H", "Am7/G"], max_workers=max_workers, chunksize=1
+                )
+                self.assertEqual(results[0], Chord("C"))
+                self.assertIsInstance(results[1], ValueError)
+                self.assertEqual(str(results[2]), "Am7/G")
+
+    def test_transpose_progressions(self):
+        progressions = [
+            ChordProgression(["C", "F", "G"]),
+            ChordProgression(["Am", "E7/G#"], compact=True),
+        ]
+        for max_workers in [0, 2]:
+            with self.subTest(max_workers=max_workers):
+                results = transpose_progressions(
+                    progressions, 2, max_workers=max_workers
+                )
+                self.assertEqual(
+                    [str(cp) for cp in results], ["D | G | A", "Bm | Gb7/Bb"]
+                )
+        self.assertEqual(str(progressions[0]), "C | F | G")
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            transpose_progressions([], "A")
+        with self.assertRaises(ValueError):
+            parse_chords(["C"], chunksize=0)
+
+    def test_custom_quality(self):
+        QualityManager().set_quality("11", ("1", "3", "5", "b7", "11"))
+        QualityManager().set_quality("testquality", ("1", "b3", "b6"))
+        results = find_chords_many(
+            [["C", "E", "G", "Bb", "F"], ["C", "Eb", "Ab"]], max_workers=1
+        )
+        self.assertEqual(
+            results, [[Chord("C11")], [Chord("Ctestquality"), Chord("Ab/C")]]
+        )
+
+    def test_init_worker(self):
+        quality_manager = QualityManager()
+        quality_manager.set_quality("testquality", ("1", "b3", "b13"))
+        qualities = [
+            (q.quality, tuple(q.intervals))
+            for q in quality_manager.get_qualities().values()
+        ]
+        quality_manager.load_default_qualities()
+        _init_worker(qualities)
+        assert batch._registry is not None
+        self.assertEqual(
+            list(batch._registry.get_qualities()), [name for name, _ in qualities]
+        )
+        self.assertNotIn("testquality", quality_manager.get_qualities())
+
+    def test_registry_spawn(self):
+        registry = QualityRegistry(
+            [("", ("1", "3", "5")), ("7", ("1", "3", "5", "b7"))]
+        )
+        executor = partial(
+            ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+        )
+        with (
+            use_registry(registry),
+            mock.patch.object(batch, "ProcessPoolExecutor", executor),
+        ):
+            for max_workers in (0, 1):
+                with self.subTest(max_workers=max_workers):
+                    c, cm7 = parse_chords(["C", "CM7"], max_workers=max_workers)
+                    self.assertEqual(c, Chord("C"))
+                    self.assertIsInstance(cm7, ValueError)
+
+
+class TestPickle(unittest.TestCase):
+    def test_chord(self):
+        c = Chord("Am7/G")
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                c2 = pickle.loads(pickle.dumps(c, protocol))
+                self.assertEqual(c2, c)
+                self.assertEqual(str(c2), "Am7/G")
+                self.assertIs(c2.quality, c.quality)
+
+    def test_transposed_chord(self):
+        c = Chord("Am7/1")
+        c.transpose(2)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                self.assertEqual(str(pickle.loads(pickle.dumps(c, protocol))), "Bm7/1")
+
+    def test_compact_progression(self):
+        cp = ChordProgression(["C", "Am7/G"], compact=True)
+        cp2 = pickle.loads(pickle.dumps(cp))
+        self.assertEqual(cp2, cp)
+        self.assertEqual(str(cp2), "C | Am7/G")
@@ -43,6 +43,16 @@ class TestChordCreations(unittest.TestCase):
                 self.assertEqual(expected_quality, c.quality.quality)
                 self.assertEqual(expected_on, c.on)
 
+    def test_from_strings(self):
+        chords = Chord.from_strings(["C", "G/B", "Am", "C"])
+        self.assertEqual(chords, [Chord("C"), Chord("G/B"), Chord("Am"), Chord("C")])
+        self.assertEqual([str(c) for c in chords], ["C", "G/B", "Am", "C"])
+        self.assertIsNot(chords[0], chords[3])
+
+    def test_from_strings_invalid(self):
+        with self.assertRaises(ValueError):
+            Chord.from_strings(["C", "H"])
+
     def test_invalid_slash_chord(self):
         self.assertRaises(ValueError, Chord, "C/H")
 
@@ -69,9 +79,41 @@ class TestChordCreations(unittest.TestCase):
     def test_eq_root_alias(self):
         self.assertEqual(Chord("C#"), Chord("Db"))
 
-    def test_eq_invalid(self):
-        with self.assertRaises(TypeError):
-            Chord("C") == 0
+    def test_eq_other_type(self):
+        self.assertFalse(Chord("C") == 0)
+        self.assertTrue(Chord("C") != "C")
+
+    def test_hash(self):
+        for c1, c2 in [
+            ("C", "C"),
+            ("C#", "Db"),
+            ("Cmaj7", "CM7"),
+            ("Am/G", "Amin/G"),
+            ("F#m7-5/A", "Gbm7b5/A"),
+        ]:
+            with self.subTest(c1=c1, c2=c2):
+                self.assertEqual(hash(Chord(c1)), hash(Chord(c2)))
+                self.assertEqual(Chord(c1).key, Chord(c2).key)
+
+    def test_dedup(self):
+        chords = [Chord(c) for c in ["C", "Db", "C#", "CM7", "Cmaj7", "C/G", "C"]]
+        self.assertEqual(len(set(chords)), 4)
+        counts = {}
+        for chord in chords:
+            counts[chord] = counts.get(chord, 0) + 1
+        self.assertEqual(counts[Chord("C")], 2)
+        self.assertEqual(counts[Chord("Db")], 2)
+
+    def test_key(self):
+        self.assertEqual(Chord("Am7/G").key, (9, (0, 3, 7, 10), 7))
+        self.assertEqual(Chord("C").key, (0, (0, 4, 7), None))
+
+    def test_key_after_transpose(self):
+        c = Chord("C")
+        hash(c)
+        c.transpose(2)
+        self.assertEqual(c.key, Chord("D").key)
+        self.assertIn(c, {Chord("D")})
 
     def test_eq_different_root(self):
         self.assertNotEqual(Chord("C"), Chord("D"))
@@ -173,3 +215,41 @@ class TestChordFromNoteIndex(unittest.TestCase):
     def test_diatonic_note_non_generic(self):
         with self.assertRaises(NotImplementedError):
             Chord.from_note_index(note=5, quality="sus", diatonic=True, scale="Fmaj")
+
+    def test_harmonize(self):
+        for scale, sevenths, expected in [
+            ("Cmaj", False, ["C", "Dm", "Em", "F", "G", "Am", "Bdim"]),
+            ("Amin", True, ["Am7", "Bm7-5", "CM7", "Dm7", "Em7", "FM7", "G7"]),
+            ("EbLyd", False, ["Eb", "F", "Gm", "Adim", "Bb", "Cm", "Dm"]),
+        ]:
+            with self.subTest(scale=scale, sevenths=sevenths):
+                chords = Chord.harmonize(scale, sevenths=sevenths)
+                self.assertEqual([chord.chord for chord in chords], expected)
+                self.assertEqual(
+                    chords,
+                    [
+                        Chord.from_note_index(
+                            note, "7" if sevenths else "", scale, True
+                        )
+                        for note in range(1, 8)
+                    ],
+                )
+
+    def test_harmonize_returns_new_chords(self):
+        chords = Chord.harmonize("Gmaj")
+        chords[0].transpose(2)
+        self.assertEqual(Chord.harmonize("Gmaj")[0], Chord("G"))
+
+    def test_harmonize_invalid_scale(self):
+        with self.assertRaises(ValueError):
+            Chord.harmonize("Hmaj")
+
+
+class TestChordSubclass(unittest.TestCase):
+    def test_transposed(self):
+        class MyChord(Chord):
+            pass
+
+        c = MyChord("Am7").transposed(2)
+        self.assertIsInstance(c, MyChord)
+        self.assertEqual(c, Chord("Bm7"))
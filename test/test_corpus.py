@@ -0,0 +1,141 @@
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+from pychord import Chord, ChordProgression
+from pychord.corpus import MAGIC, Corpus, CorpusWriter, ProgressionView, write_corpus
+from pychord.serialize import dumps
+
+
+class TestCorpus(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "test.corpus")
+        self.progressions = [
+            ChordProgression(["C", "Am", "F", "G"]),
+            ChordProgression(),
+            ChordProgression(["Dm7", "G7/B", "Cmaj7/1"]),
+            ChordProgression([f"{root}7" for root in "CDEFGAB"] * 50),
+        ]
+        write_corpus(self.path, self.progressions)
+
+    def open(self):
+        corpus = Corpus(self.path)
+        self.addCleanup(corpus.close)
+        return corpus
+
+    def test_round_trip(self):
+        corpus = self.open()
+        self.assertEqual(len(corpus), 4)
+        self.assertEqual([view.to_progression() for view in corpus], self.progressions)
+        self.assertEqual(corpus[3].to_progression(compact=True), self.progressions[3])
+
+    def test_inversion_names(self):
+        progression = ChordProgression(["C7/5", "C/3", "Cm(no5)/3/Ab", "G/1"])
+        write_corpus(self.path, [progression])
+        view = self.open()[0]
+        self.assertEqual(str(view), str(progression))
+        self.assertEqual(
+            [chord.chord for chord in view], ["C7/5", "C/3", "Cm(no5)/3/Ab", "G/1"]
+        )
+
+    def test_random_access(self):
+        corpus = self.open()
+        self.assertEqual(corpus[2], self.progressions[2])
+        self.assertEqual(corpus[-1], self.progressions[-1])
+        for index in [4, -5]:
+            with self.subTest(index=index):
+                with self.assertRaises(IndexError):
+                    corpus[index]
+
+    def test_slices(self):
+        corpus = self.open()
+        self.assertEqual(corpus[1:3], self.progressions[1:3])
+        self.assertEqual(corpus[::-2], self.progressions[::-2])
+        self.assertEqual(corpus[10:], [])
+
+    def test_view(self):
+        view = self.open()[2]
+        self.assertEqual(len(view), 3)
+        self.assertEqual(view[1], Chord("G7/B"))
+        self.assertEqual(view[-1].chord, "Cmaj7/1")
+        self.assertEqual(view[:2], [Chord("Dm7"), Chord("G7/B")])
+        self.assertEqual(list(view), self.progressions[2].chords)
+        self.assertEqual(str(view), "Dm7 | G7/B | Cmaj7/1")
+        self.assertEqual(repr(view), "<ProgressionView: Dm7 | G7/B | Cmaj7/1>")
+        self.assertEqual(view, ProgressionView(dumps(self.progressions[2])))
+        self.assertNotEqual(view, self.progressions[0])
+        self.assertNotEqual(view, "Dm7 | G7/B | Cmaj7/1")
+
+    def test_view_outlives_corpus(self):
+        corpus = Corpus(self.path)
+        view = corpus[0]
+        corpus.close()
+        self.assertEqual(len(corpus), 0)
+        self.assertEqual(view, self.progressions[0])
+
+    def test_close(self):
+        corpus = Corpus(self.path)
+        mapping = corpus._mmap
+        corpus.close()
+        corpus.close()
+        self.assertTrue(mapping.closed)
+
+    def test_writer(self):
+        with CorpusWriter(self.path) as writer:
+            writer.append(ChordProgression("C"))
+            writer.append(ChordProgression(["G", "C"], compact=True))
+            self.assertEqual(len(writer), 2)
+        writer.close()
+        with Corpus(self.path) as corpus:
+            self.assertEqual(
+                corpus[:], [ChordProgression("C"), ChordProgression(["G", "C"])]
+            )
+
+    def test_pickle(self):
+        corpus = pickle.loads(pickle.dumps(self.open()))
+        self.addCleanup(corpus.close)
+        self.assertEqual(corpus.path, self.path)
+        self.assertEqual(corpus[0], self.progressions[0])
+
+    def test_invalid(self):
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for invalid in [
+            b"X" * 10,
+            b"XXXX" + data[4:],
+            MAGIC + b"\x02" + data[5:],
+            data[:-1],
+            data[:16] + struct.pack("<Q", 8) + data[24:],
+        ]:
+            with self.subTest(data=invalid):
+                with open(self.path, "wb") as f:
+                    f.write(invalid)
+                mappings = []
+
+                def map_file(*args, mmap=mmap.mmap, **kwargs):
+                    mappings.append(mmap(*args, **kwargs))
+                    return mappings[-1]
+
+                with mock.patch.object(mmap, "mmap", map_file):
+                    with self.assertRaises(ValueError):
+                        Corpus(self.path)
+                self.assertTrue(all(mapping.closed for mapping in mappings))
+
+    def test_corrupt_index(self):
+        with open(self.path, "rb") as f:
+            data = bytearray(f.read())
+        index_offset = struct.unpack_from("<Q", data, 16)[0]
+        struct.pack_into("<Q", data, index_offset + 8, len(data) * 2)
+        with open(self.path, "wb") as f:
+            f.write(data)
+        with Corpus(self.path) as corpus:
+            for index in [0, 1, slice(None)]:
+                with self.subTest(index=index):
+                    with self.assertRaises(ValueError):
+                        corpus[index]
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+
+from pychord import ChordProgression
+from pychord.io import ChordChartError, open_progressions, read_progressions
+
+
+class TestReadBar(unittest.TestCase):
+    def test_read(self):
+        lines = ["C | Am | F | G\n", "\n", "# comment\n", "Dm7 G7 | Cmaj7\n"]
+        progressions = list(read_progressions(lines))
+        self.assertEqual(
+            progressions,
+            [
+                ChordProgression(["C", "Am", "F", "G"]),
+                ChordProgression(["Dm7", "G7", "Cmaj7"]),
+            ],
+        )
+
+    def test_round_trip(self):
+        cp = ChordProgression(["C", "G/B", "Am", "Em/G"])
+        self.assertEqual(list(read_progressions([str(cp)])), [cp])
+
+    def test_lazy(self):
+        def lines():
+            yield "C | G"
+            raise RuntimeError("should not be read")
+
+        progressions = read_progressions(lines())
+        self.assertEqual(next(progressions), ChordProgression(["C", "G"]))
+
+    def test_errors(self):
+        errors = []
+        lines = ["C | H | G", "Csus3", "F"]
+        progressions = list(read_progressions(lines, on_error=errors.append))
+        self.assertEqual(
+            progressions,
+            [ChordProgression(["C", "G"]), ChordProgression(), ChordProgression("F")],
+        )
+        self.assertEqual([e.lineno for e in errors], [1, 2])
+        self.assertEqual(errors[0].line, "C | H | G")
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertTrue(str(errors[1]).startswith("line 2: "))
+
+    def test_errors_ignored(self):
+        self.assertEqual(len(list(read_progressions(["C | H"]))), 1)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            read_progressions([], format="abc")
+
+
+class TestReadChordPro(unittest.TestCase):
+    def test_read(self):
+        lines = [
+            "{title: Song 1}",
+            "[C]Let it [G]be, let it [Am]be",
+            "# comment [D]",
+            "lyrics without chords",
+            "[F] [C/E]",
+            "{new_song}",
+            "{ns}",
+            "{title: Song 2}",
+            "[Dm7]Hello [G7]world",
+        ]
+        progressions = list(read_progressions(lines, format="chordpro"))
+        self.assertEqual(
+            progressions,
+            [
+                ChordProgression(["C", "G", "Am", "F", "C/E"]),
+                ChordProgression(["Dm7", "G7"]),
+            ],
+        )
+
+    def test_errors(self):
+        errors: list[ChordChartError] = []
+        lines = ["[C]a [X]b", "[]c [G]d"]
+        progressions = list(
+            read_progressions(lines, format="chordpro", on_error=errors.append)
+        )
+        self.assertEqual(progressions, [ChordProgression(["C", "G"])])
+        self.assertEqual([e.lineno for e in errors], [1, 2])
+
+    def test_empty(self):
+        self.assertEqual(list(read_progressions([], format="chordpro")), [])
+
+
+class TestOpenProgressions(unittest.TestCase):
+    def test_open(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "chart.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("C | F\nG | C\n")
+            progressions = list(open_progressions(path))
+        self.assertEqual(
+            progressions, [ChordProgression(["C", "F"]), ChordProgression(["G", "C"])]
+        )
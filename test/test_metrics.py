@@ -0,0 +1,113 @@
+import unittest
+
+from pychord import Chord, QualityManager, find_chords_from_notes, metrics
+from pychord.parser import clear_parse_cache, parse
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        clear_parse_cache()
+        metrics.reset()
+        metrics.enable()
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.set_hook(None)
+        metrics.reset()
+
+    def test_disabled(self):
+        metrics.disable()
+        Chord("Am7")
+        find_chords_from_notes(["C", "E", "G"])
+        snapshot = metrics.snapshot()
+        self.assertFalse(snapshot["enabled"])
+        self.assertEqual(snapshot["counters"], {})
+        self.assertEqual(snapshot["timings"], {})
+
+    def test_parse(self):
+        parse("Am7")
+        parse("Am7")
+        with self.assertRaises(ValueError):
+            parse("H")
+        snapshot = metrics.snapshot()
+        counters = snapshot["counters"]
+        self.assertEqual(counters["parse.calls"], 3)
+        self.assertEqual(counters["parse.errors"], 1)
+        self.assertEqual(counters["parse.cache_hits"], 1)
+        self.assertEqual(counters["parse.cache_misses"], 2)
+        timing = snapshot["timings"]["parse.time"]
+        self.assertEqual(timing["count"], 3)
+        self.assertEqual(sum(timing["buckets"].values()), 3)
+        self.assertGreaterEqual(timing["total"], timing["max"])
+        self.assertEqual(
+            sorted(detail for _, detail in timing["slowest"]), ["Am7", "Am7", "H"]
+        )
+
+    def test_get_quality(self):
+        QualityManager().get_quality("m7", 2)
+        QualityManager().get_quality("m7", 2)
+        counters = metrics.snapshot()["counters"]
+        self.assertEqual(counters["get_quality.calls"], 2)
+        self.assertLessEqual(counters.get("get_quality.inversions", 0), 1)
+
+    def test_find_chords(self):
+        find_chords_from_notes(["E", "G", "C"])
+        find_chords_from_notes(["C", "D", "E"])
+        snapshot = metrics.snapshot()
+        counters = snapshot["counters"]
+        self.assertEqual(counters["find_chords.calls"], 2)
+        self.assertEqual(counters["find_chords.rotations"], 1)
+        self.assertEqual(counters["find_chords.rotations_skipped"], 5)
+        self.assertEqual(counters["find_quality_from_components.calls"], 1)
+        self.assertNotIn("find_quality_from_components.misses", counters)
+        QualityManager().find_quality_from_components([0, 1])
+        counters = metrics.snapshot()["counters"]
+        self.assertEqual(counters["find_quality_from_components.misses"], 1)
+        timing = snapshot["timings"]["find_chords.time"]
+        self.assertEqual(timing["count"], 2)
+        self.assertIn(("E", "G", "C"), [detail for _, detail in timing["slowest"]])
+
+    def test_find_chords_error(self):
+        with self.assertRaises(ValueError):
+            find_chords_from_notes([])
+        self.assertEqual(metrics.snapshot()["counters"]["find_chords.errors"], 1)
+
+    def test_slowest(self):
+        for i in range(metrics.SLOWEST_SIZE + 5):
+            metrics.observe("test.time", i / 1000, i)
+        slowest = metrics.snapshot()["timings"]["test.time"]["slowest"]
+        self.assertEqual(
+            [detail for _, detail in slowest],
+            list(range(metrics.SLOWEST_SIZE + 4, 4, -1)),
+        )
+        metrics.observe("test.time", 0.0, "fast")
+        self.assertEqual(metrics.snapshot()["timings"]["test.time"]["slowest"], slowest)
+
+    def test_buckets(self):
+        metrics.observe("test.time", 1e-6)
+        metrics.observe("test.time", 3e-6)
+        metrics.observe("test.time", 10.0)
+        buckets = metrics.snapshot()["timings"]["test.time"]["buckets"]
+        self.assertEqual(buckets[1e-6], 1)
+        self.assertEqual(buckets[5e-6], 1)
+        self.assertEqual(buckets[float("inf")], 1)
+
+    def test_hook(self):
+        events = []
+        metrics.set_hook(lambda *event: events.append(event))
+        parse("C")
+        self.assertEqual(
+            [(name, detail) for name, _, detail in events],
+            [
+                ("parse.calls", None),
+                ("parse.cache_misses", None),
+                ("get_quality.calls", None),
+                ("parse.time", "C"),
+            ],
+        )
+        self.assertEqual(events[0][1], 1)
+
+    def test_reset(self):
+        parse("C")
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()["counters"], {})
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+import unittest
+
+import pychord
+from pychord.chord import Chord
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_attributes(self):
+        self.assertIs(pychord.Chord, Chord)
+        for name in pychord.__all__:
+            self.assertTrue(hasattr(pychord, name))
+
+    def test_dir(self):
+        self.assertLessEqual(set(pychord.__all__), set(dir(pychord)))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            pychord.NotAChord
+
+    def test_import_is_lazy(self):
+        code = "import sys, pychord; print('pychord.chord' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_no_helper_attributes(self):
+        for name in ["importlib", "TYPE_CHECKING"]:
+            with self.subTest(name=name):
+                self.assertFalse(hasattr(pychord, name))
+                self.assertNotIn(name, dir(pychord))
@@ -0,0 +1,124 @@
+import gc
+import threading
+import unittest
+from unittest import mock
+
+from pychord import Chord, QualityManager
+from pychord.parser import (
+    DEFAULT_PARSE_CACHE_SIZE,
+    _parse_cache,
+    clear_parse_cache,
+    parse,
+    parse_cache_info,
+    parse_many,
+    set_parse_cache_size,
+)
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        clear_parse_cache()
+
+    def tearDown(self):
+        set_parse_cache_size(DEFAULT_PARSE_CACHE_SIZE)
+        QualityManager().load_default_qualities()
+        clear_parse_cache()
+
+    def test_hits_and_misses(self):
+        self.assertIs(parse("Am7"), parse("Am7"))
+        parse("C")
+        info = parse_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.maxsize, DEFAULT_PARSE_CACHE_SIZE)
+        self.assertEqual(info.currsize, 2)
+
+    def test_invalid_chord_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                parse("H")
+        self.assertEqual(parse_cache_info().currsize, 0)
+
+    def test_invalidated_by_set_quality(self):
+        self.assertEqual(Chord("C11").components(), ["C", "E", "G", "Bb", "D", "F"])
+        QualityManager().set_quality("11", ("1", "3", "5", "b7", "11"))
+        self.assertEqual(Chord("C11").components(), ["C", "E", "G", "Bb", "F"])
+        self.assertEqual(parse_cache_info().hits, 0)
+
+    def test_lru_eviction(self):
+        set_parse_cache_size(2)
+        parse("C")
+        parse("D")
+        parse("C")
+        parse("E")
+        info = parse_cache_info()
+        self.assertEqual(info.currsize, 2)
+        parse("C")
+        self.assertEqual(parse_cache_info().hits, info.hits + 1)
+        parse("D")
+        self.assertEqual(parse_cache_info().misses, info.misses + 1)
+
+    def test_hits_take_no_lock(self):
+        parse("Am7")
+        lock = mock.MagicMock()
+        lock.__enter__.side_effect = AssertionError("lock taken")
+        with mock.patch.object(_parse_cache, "_lock", lock):
+            parse("Am7")
+        self.assertEqual(parse_cache_info().hits, 1)
+
+    def test_threads(self):
+        def worker():
+            for _ in range(100):
+                parse("Am7")
+
+        parse("Am7")
+        running = len(_parse_cache._counters)
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(parse_cache_info().hits, 400)
+        del thread, threads
+        gc.collect()
+        self.assertEqual(len(_parse_cache._counters), running)
+        self.assertEqual(parse_cache_info().hits, 400)
+
+    def test_resize(self):
+        for chord in ["C", "D", "E"]:
+            parse(chord)
+        set_parse_cache_size(1)
+        self.assertEqual(parse_cache_info().currsize, 1)
+
+    def test_disabled(self):
+        set_parse_cache_size(0)
+        parse("C")
+        parse("C")
+        info = parse_cache_info()
+        self.assertEqual(info.hits, 0)
+        self.assertEqual(info.currsize, 0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            set_parse_cache_size(-1)
+
+
+class TestParseMany(unittest.TestCase):
+    def test_parse_many(self):
+        results = parse_many(["C", "Am7", "C", "F/G"])
+        self.assertEqual(
+            [(root, str(quality), on) for root, quality, on in results],
+            [("C", "", ""), ("A", "m7", ""), ("C", "", ""), ("F", "", "G")],
+        )
+        self.assertIs(results[0], results[2])
+
+    def test_errors(self):
+        results = parse_many(["C", "H", "Csus3", "H"])
+        self.assertEqual(results[0][0], "C")
+        for result in results[1:]:
+            self.assertIsInstance(result, ValueError)
+        self.assertIs(results[1], results[3])
+
+    def test_generator(self):
+        results = parse_many(c for c in ["C", "D"])
+        self.assertEqual([r[0] for r in results], ["C", "D"])
@@ -1,6 +1,7 @@
 import unittest
+from unittest import mock
 
-from pychord import Chord, ChordProgression
+from pychord import Chord, ChordProgression, QualityRegistry
 
 
 class TestChordProgressionCreations(unittest.TestCase):
@@ -85,6 +86,12 @@ class TestChordProgressionFunctions(unittest.TestCase):
         cp.transpose(3)
         self.assertEqual(cp.chords, [Chord("Eb"), Chord("Ab"), Chord("Bb")])
 
+    def test_transposed(self):
+        cp = ChordProgression(["C", "F", "G"])
+        transposed = cp.transposed(3)
+        self.assertEqual(str(cp), "C | F | G")
+        self.assertEqual(str(transposed), "Eb | Ab | Bb")
+
     def test_add(self):
         cp1 = ChordProgression(["C", "F", "G"])
         cp2 = ChordProgression(["Am", "Em"])
@@ -137,3 +144,177 @@ class TestChordProgressionFunctions(unittest.TestCase):
         cp = ChordProgression(["C", "F", "G"])
         with self.assertRaises(TypeError):
             print(cp == 0)
+
+
+class TestCompactChordProgression(unittest.TestCase):
+    def test_creation(self):
+        names = ["C", "G/B", "Am7", "Fmin", "Cm7/3/F"]
+        cp = ChordProgression(names, compact=True)
+        self.assertEqual(len(cp), 5)
+        self.assertEqual(cp, ChordProgression(names))
+        self.assertEqual(ChordProgression(names), cp)
+        self.assertEqual(str(cp), "C | G/B | Am7 | Fmin | Cm7/3/F")
+        self.assertEqual(cp[4].components(), Chord("Cm7/3/F").components())
+
+    def test_materialized_on_access(self):
+        cp = ChordProgression(["C", "F"], compact=True)
+        self.assertIsNot(cp[0], cp[0])
+        cp[0].transpose(2)
+        self.assertEqual(cp[0], Chord("C"))
+        self.assertEqual(cp.chords, [Chord("C"), Chord("F")])
+
+    def test_functions(self):
+        cp = ChordProgression(["C", "D", "E"], compact=True)
+        cp.append("F")
+        cp.insert(0, Chord("Bb/D"))
+        self.assertEqual(cp.pop(), Chord("F"))
+        cp[1] = Chord("Cm")
+        self.assertEqual(
+            cp.chords, [Chord("Bb/D"), Chord("Cm"), Chord("D"), Chord("E")]
+        )
+        self.assertEqual(cp[1:3], [Chord("Cm"), Chord("D")])
+        self.assertEqual(cp[-1], Chord("E"))
+
+    def test_inversions(self):
+        names = ["C/1", "Am7/2", "Cm7/3/F", "G/B", "C6/9"]
+        cp = ChordProgression(names, compact=True)
+        self.assertEqual(str(cp), str(ChordProgression(names)))
+        self.assertEqual(ChordProgression(str(cp).split(" | "), compact=True), cp)
+        cp[0] = Chord("F/2")
+        cp.insert(1, Chord("D7/1"))
+        del cp._chords[2]
+        self.assertEqual(str(cp), "F/2 | D7/1 | Cm7/3/F | G/B | C6/9")
+        self.assertEqual(str(cp.transposed(2)), "G/2 | E7/1 | Dm7/3/G | A/Db | D6/9")
+        self.assertEqual(cp[0].components(), Chord("F/2").components())
+
+    def test_same_names_as_list(self):
+        names = ["C/1", "G", "Am7/2", "Cm7/3/F", "C7/5", "G/B"]
+        for trans in [0, 2, -5]:
+            with self.subTest(trans=trans):
+                cp = ChordProgression(names)
+                compact = ChordProgression(names, compact=True)
+                self.assertEqual(
+                    str(compact.transposed(trans)), str(cp.transposed(trans))
+                )
+                cp.transpose(trans)
+                compact.transpose(trans)
+                self.assertEqual(str(compact), str(cp))
+        cp = ChordProgression(["C/1", "G"])
+        cp.transpose(2)
+        self.assertEqual(str(cp), "D/1 | A")
+        self.assertEqual(str(ChordProgression(["C/1"]).transposed(0)), "C/1")
+
+    def test_large_quality_ids(self):
+        cp = ChordProgression(["C", "Am"], compact=True)
+        with mock.patch("pychord.progression.get_quality_id", return_value=0x10000):
+            cp.append("F")
+        self.assertEqual(cp._chords._qualities.typecode, "L")
+        self.assertEqual(cp._chords._qualities[-1], 0x10000)
+        self.assertEqual(cp[:2], [Chord("C"), Chord("Am")])
+
+    def test_set_slice(self):
+        cp = ChordProgression(["C", "D"], compact=True)
+        with self.assertRaises(TypeError):
+            cp._chords[0:1] = [Chord("E")]
+
+    def test_transpose(self):
+        cp = ChordProgression(["C", "F/A", "G"], compact=True)
+        cp.transpose(3)
+        self.assertEqual(str(cp), "Eb | Ab/C | Bb")
+        with self.assertRaises(TypeError):
+            cp.transpose("A")
+
+    def test_transposed(self):
+        cp = ChordProgression(["C", "F/A", "G"], compact=True)
+        transposed = cp.transposed(3)
+        self.assertEqual(str(cp), "C | F/A | G")
+        self.assertEqual(str(transposed), "Eb | Ab/C | Bb")
+        self.assertIsInstance(transposed._chords, type(cp._chords))
+
+    def test_add(self):
+        cp = ChordProgression(["C"], compact=True) + ChordProgression(["Am"])
+        self.assertEqual(cp, ChordProgression(["C", "Am"]))
+        self.assertIsInstance(cp.chords, list)
+
+    def test_not_equal(self):
+        cp = ChordProgression(["C", "F"], compact=True)
+        self.assertNotEqual(cp, ChordProgression(["C", "G"]))
+        self.assertNotEqual(cp, ChordProgression(["C"], compact=True))
+        self.assertFalse(cp._chords == ("C", "F"))
+
+
+class TestCanonicalForm(unittest.TestCase):
+    def test_canonical(self):
+        cp = ChordProgression(["Am7", "D7/F#", "G"])
+        self.assertEqual(
+            cp.canonical,
+            ((0, (0, 3, 7, 10), None), (5, (0, 4, 7, 10), 4), (5, (0, 4, 7), None)),
+        )
+        self.assertEqual(ChordProgression().canonical, ())
+
+    def test_transposition_invariant(self):
+        names = ["C", "Am7", "Dm7/G", "G7", "C/1"]
+        cp = ChordProgression(names)
+        for compact in [False, True]:
+            for trans in range(12):
+                with self.subTest(compact=compact, trans=trans):
+                    transposed = ChordProgression(names, compact).transposed(trans)
+                    self.assertEqual(transposed.canonical, cp.canonical)
+                    self.assertEqual(transposed.fingerprint, cp.fingerprint)
+
+    def test_aliases(self):
+        self.assertEqual(
+            ChordProgression(["Cmaj7", "Fmin"]).fingerprint,
+            ChordProgression(["DM7", "Gm"], compact=True).fingerprint,
+        )
+
+    def test_different(self):
+        fingerprints = {
+            ChordProgression(names).fingerprint
+            for names in [
+                ["C", "F"],
+                ["C", "G"],
+                ["C", "F/A"],
+                ["C", "Fm"],
+                ["C", "F", "C"],
+                ["C/E", "F"],
+            ]
+        }
+        self.assertEqual(len(fingerprints), 6)
+
+    def test_stable(self):
+        self.assertEqual(
+            ChordProgression(["C", "G/B", "Am"]).fingerprint,
+            "5fdd7ee91b177d98a04d8e03d73eaaca",
+        )
+
+    def test_custom_components(self):
+        registry = QualityRegistry()
+        registry.set_quality("low", ("b1", "3", "5"))
+        registry.set_quality("far", ("1", "3", "40"))
+        cp = ChordProgression([Chord("Clow", registry), Chord("C")])
+        self.assertEqual(cp.canonical[0], (0, (-1, 4, 7), None))
+        self.assertNotEqual(cp.fingerprint, ChordProgression(["C", "C"]).fingerprint)
+        far = ChordProgression([Chord("Cfar", registry)])
+        self.assertEqual(far.canonical, ((0, (0, 4, 67), None),))
+        self.assertEqual(len(far.fingerprint), 32)
+
+    def test_cache(self):
+        for compact in [False, True]:
+            with self.subTest(compact=compact):
+                cp = ChordProgression(["C", "F"], compact)
+                fingerprint = cp.fingerprint
+                self.assertIs(cp.canonical, cp.canonical)
+                self.assertIs(cp.fingerprint, fingerprint)
+                cp.transpose(2)
+                self.assertEqual(cp.fingerprint, fingerprint)
+                cp.append("A")
+                self.assertEqual(cp.canonical[-1], (2, (0, 4, 7), None))
+                cp.insert(0, "Am")
+                self.assertEqual(
+                    cp.canonical[:2], ((0, (0, 3, 7), None), (5, (0, 4, 7), None))
+                )
+                cp[1] = Chord("C7")
+                self.assertEqual(cp.canonical[1], (3, (0, 4, 7, 10), None))
+                cp.pop(0)
+                self.assertEqual(cp.canonical[0], (0, (0, 4, 7, 10), None))
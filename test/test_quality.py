@@ -1,8 +1,27 @@
 # -*- coding: utf-8 -*-
 
+import copy
+import pickle
+import threading
 import unittest
 
-from pychord import QualityManager, Chord, find_chords_from_notes
+from pychord import (
+    QualityManager,
+    QualityRegistry,
+    Chord,
+    find_chords_from_notes,
+    use_registry,
+)
+from pychord.constants.qualities import DEFAULT_QUALITIES
+from pychord.constants.quality_table import DEFAULT_QUALITY_TABLE
+from pychord.parser import parse
+from pychord.quality import (
+    MAX_INVERSION,
+    Quality,
+    get_quality_by_id,
+    get_quality_id,
+    get_registry,
+)
 
 
 class TestQuality(unittest.TestCase):
@@ -31,10 +50,12 @@ class TestQuality(unittest.TestCase):
         self.assertEqual(q1, q2)
         self.assertEqual(q1, q3)
 
-    def test_invalid_eq(self):
+    def test_eq_other_types(self):
         q = self.quality_manager.get_quality("m7")
-        with self.assertRaises(TypeError):
-            print(q == 0)
+        self.assertNotEqual(q, 0)
+        self.assertNotEqual(q, "m7")
+        self.assertNotIn(q, ["m7", "maj"])
+        self.assertIsNone({q: 1}.get(q.components))
 
     def subtest_quality_synonym(self, a, b):
         with self.subTest(msg=f"{a}_has_{b}_synonym"):
@@ -57,6 +78,68 @@ class TestQuality(unittest.TestCase):
         self.assertEqual(q.intervals, ["1", "b3", "5"])
         self.assertEqual(q.quality, "m")
 
+    def test_get_components(self):
+        q = self.quality_manager.get_quality("dim7")
+        self.assertEqual(q.get_components(), [0, 3, 6, 9])
+        self.assertEqual(q.get_components(root="D", visible=False), [2, 5, 8, 11])
+        self.assertEqual(
+            q.get_components(root="Eb", visible=True), ["Eb", "Gb", "Bbb", "Dbb"]
+        )
+
+    def test_get_components_memoized(self):
+        q = self.quality_manager.get_quality("m7")
+        notes = q.get_components(root="A", visible=True)
+        notes.append("X")
+        self.assertEqual(q.get_components(root="A", visible=True), ["A", "C", "E", "G"])
+
+    def test_get_components_too_many_accidentals(self):
+        q = self.quality_manager.get_quality("")
+        with self.assertRaises(ValueError):
+            q.get_components(root="B##", visible=True)
+
+    def test_immutable(self):
+        q = self.quality_manager.get_quality("m")
+        with self.assertRaises(AttributeError):
+            q._intervals = ("1", "3", "5")
+        with self.assertRaises(AttributeError):
+            del q._quality
+
+    def test_hash(self):
+        q1 = self.quality_manager.get_quality("m7-5")
+        q2 = self.quality_manager.get_quality("m7b5")
+        self.assertEqual(hash(q1), hash(q2))
+        self.assertEqual(len({q1, q2}), 1)
+
+    def test_copy(self):
+        q = self.quality_manager.get_quality("m7")
+        self.assertIs(copy.copy(q), q)
+        self.assertIs(copy.deepcopy(q), q)
+
+    def test_pickle(self):
+        q = self.quality_manager.get_quality("m7", 1)
+        q2 = pickle.loads(pickle.dumps(q))
+        self.assertEqual(q2.quality, "m7")
+        self.assertEqual(q2.intervals, q.intervals)
+
+
+class TestDefaultQualityTable(unittest.TestCase):
+    def test_up_to_date(self):
+        self.assertEqual(
+            [(name, intervals) for name, intervals, _ in DEFAULT_QUALITY_TABLE],
+            [(name, tuple(intervals)) for name, intervals in DEFAULT_QUALITIES],
+        )
+        for name, intervals, table in DEFAULT_QUALITY_TABLE:
+            with self.subTest(name=name):
+                self.assertEqual(Quality(name, intervals)._table, table)
+
+    def test_same_as_parsed(self):
+        for name, intervals, _ in DEFAULT_QUALITY_TABLE:
+            with self.subTest(name=name):
+                quality = QualityManager().get_quality(name)
+                parsed = Quality(name, intervals)
+                self.assertEqual(quality.components, parsed.components)
+                self.assertEqual(quality._mask, parsed._mask)
+
 
 class TestQualityManager(unittest.TestCase):
     def test_singleton(self):
@@ -64,6 +147,76 @@ class TestQualityManager(unittest.TestCase):
         quality_manager2 = QualityManager()
         self.assertIs(quality_manager, quality_manager2)
 
+    def test_shared_quality(self):
+        quality_manager = QualityManager()
+        self.assertIs(quality_manager.get_quality("m"), Chord("Am").quality)
+        self.assertIs(Chord("C/1").quality, Chord("D/1").quality)
+        self.assertIsNot(Chord("C/1").quality, Chord("C").quality)
+
+    def test_invalid_inversion(self):
+        quality_manager = QualityManager()
+        self.assertEqual(
+            Chord("C7/5").components(),
+            quality_manager.get_quality("7", 5).get_components("C", True),
+        )
+        quality_manager.get_quality("7", MAX_INVERSION)
+        for inversion in (-1, MAX_INVERSION + 1, 100000000):
+            with self.assertRaises(ValueError):
+                quality_manager.get_quality("7", inversion)
+        with self.assertRaises(ValueError):
+            Chord(f"C/{MAX_INVERSION + 1}")
+
+
+class TestConcurrency(unittest.TestCase):
+    def tearDown(self):
+        QualityManager().load_default_qualities()
+
+    def test_singleton_threads(self):
+        instances = []
+        threads = [
+            threading.Thread(target=lambda: instances.append(QualityManager()))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertTrue(all(i is QualityManager() for i in instances))
+
+    def test_concurrent_set_quality(self):
+        quality_manager = QualityManager()
+        errors = []
+
+        def write(n):
+            try:
+                for i in range(50):
+                    quality_manager.set_quality(f"test{n}_{i}", ("1", "b3", "b6"))
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        def read():
+            try:
+                for _ in range(50):
+                    find_chords_from_notes(["C", "Eb", "G"], ordered=False)
+                    Chord("Am7/1").components()
+                    self.assertEqual(
+                        quality_manager.find_quality_from_components([0, 4, 7]).quality,
+                        "",
+                    )
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        threads += [threading.Thread(target=read) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            len(quality_manager.get_qualities()), len(DEFAULT_QUALITIES) + 200
+        )
+
 
 class TestOverwriteQuality(unittest.TestCase):
     def setUp(self):
@@ -84,12 +237,70 @@ class TestOverwriteQuality(unittest.TestCase):
         chords = find_chords_from_notes(["C", "E", "G", "Bb", "F"])
         self.assertEqual(chords, [Chord("C11")])
 
+    def test_find_from_components_after_overwrite(self):
+        # The overwritten quality's old components fall back to an alias.
+        self.quality_manager.set_quality("m", ("1", "b3", "5", "b7"))
+        q = self.quality_manager.find_quality_from_components([0, 3, 7])
+        self.assertEqual(q.quality, "min")
+        q = self.quality_manager.find_quality_from_components([0, 3, 7, 10])
+        self.assertEqual(q.quality, "m")
+
+    def test_find_from_mask_after_overwrite(self):
+        mask = 0b10010001  # C, E, G
+        self.assertEqual(
+            [
+                (r, q.quality)
+                for r, q in self.quality_manager.find_qualities_from_mask(mask)
+            ],
+            [(0, "")],
+        )
+        self.quality_manager.set_quality("testquality", ("1", "b6", "b3"))
+        self.assertEqual(
+            [
+                (r, q.quality)
+                for r, q in self.quality_manager.find_qualities_from_mask(mask)
+            ],
+            [(0, ""), (4, "testquality")],
+        )
+
+    def test_find_from_components_after_removal(self):
+        self.quality_manager.set_quality("dim", ("1", "b3", "5"))
+        q = self.quality_manager.find_quality_from_components([0, 3, 6])
+        self.assertIsNone(q)
+
     def test_keep_existing_chord(self):
         # Remove the 9th from the "11" quality after building a chord.
         chord = Chord("C11")
         self.quality_manager.set_quality("11", ("1", "3", "5", "b7", "11"))
         self.assertEqual(chord.components(), ["C", "E", "G", "Bb", "D", "F"])
 
+    def test_overwrite_inverted(self):
+        self.assertEqual(Chord("C11/1").components()[-1], "C")
+        self.quality_manager.set_quality("11", ("1", "3", "5", "b7", "11"))
+        self.assertEqual(Chord("C11/1").components(), ["E", "G", "Bb", "F", "C"])
+
+
+class TestQualityId(unittest.TestCase):
+    def tearDown(self):
+        QualityManager().load_default_qualities()
+
+    def test_default_ids(self):
+        for i, (name, _) in enumerate(DEFAULT_QUALITIES):
+            quality = QualityManager().get_quality(name)
+            self.assertEqual(get_quality_id(quality), i)
+            self.assertIs(get_quality_by_id(i), quality)
+
+    def test_overwritten_quality(self):
+        old = QualityManager().get_quality("11")
+        QualityManager().set_quality("11", ("1", "3", "5", "b7", "11"))
+        new = QualityManager().get_quality("11")
+        self.assertNotEqual(get_quality_id(old), get_quality_id(new))
+        self.assertIs(get_quality_by_id(get_quality_id(old)), old)
+
+    def test_invalid_id(self):
+        with self.assertRaises(ValueError):
+            get_quality_by_id(-1)
+
 
 class TestIterateQualities(unittest.TestCase):
     def setUp(self):
@@ -112,3 +323,82 @@ class TestIterateQualities(unittest.TestCase):
         self.quality_manager.set_quality("testquality", ("1",))
         qualities = self.quality_manager.get_qualities()
         assert "testquality" in qualities
+
+
+class TestQualityRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = QualityRegistry()
+        self.registry.set_quality("11", ("1", "3", "5", "b7", "11"))
+
+    def test_default_qualities(self):
+        self.assertIs(
+            QualityRegistry().get_quality("m7"), QualityManager().get_quality("m7")
+        )
+
+    def test_isolated(self):
+        self.assertEqual(Chord("C11").components(), ["C", "E", "G", "Bb", "D", "F"])
+        self.assertEqual(
+            Chord("C11", self.registry).components(), ["C", "E", "G", "Bb", "F"]
+        )
+        self.assertEqual(Chord("C11").components(), ["C", "E", "G", "Bb", "D", "F"])
+
+    def test_custom_qualities(self):
+        registry = QualityRegistry([("", ("1", "3", "5")), ("pow", ("1", "5"))])
+        self.assertEqual(list(registry.get_qualities()), ["", "pow"])
+        self.assertEqual(Chord("Cpow", registry).components(), ["C", "G"])
+        with self.assertRaises(ValueError):
+            Chord("Cm", registry)
+
+    def test_parse_cache_per_registry(self):
+        self.assertIsNot(parse("C11")[1], parse("C11", self.registry)[1])
+        self.assertIs(parse("C11", self.registry), parse("C11", self.registry))
+
+    def test_use_registry(self):
+        self.assertIs(get_registry(), QualityManager())
+        with use_registry(self.registry) as registry:
+            self.assertIs(registry, self.registry)
+            self.assertIs(get_registry(), self.registry)
+            self.assertEqual(Chord("C11").components(), ["C", "E", "G", "Bb", "F"])
+            self.assertEqual(
+                find_chords_from_notes(["C", "E", "G", "Bb", "F"]), [Chord("C11")]
+            )
+        self.assertIs(get_registry(), QualityManager())
+
+    def test_use_registry_thread(self):
+        results = []
+        with use_registry(self.registry):
+            thread = threading.Thread(target=lambda: results.append(get_registry()))
+            thread.start()
+            thread.join()
+        self.assertIs(results[0], QualityManager())
+
+    def test_find_chords_registry(self):
+        notes = ["C", "E", "G", "Bb", "F"]
+        self.assertEqual(find_chords_from_notes(notes), [])
+        self.assertEqual(
+            find_chords_from_notes(notes, registry=self.registry),
+            [Chord("C11", self.registry)],
+        )
+
+    def test_freeze(self):
+        self.assertFalse(self.registry.read_only)
+        self.assertIs(self.registry.freeze(), self.registry)
+        self.assertTrue(self.registry.read_only)
+        with self.assertRaises(RuntimeError):
+            self.registry.set_quality("m", ("1", "b3", "5"))
+        with self.assertRaises(RuntimeError):
+            self.registry.load_default_qualities()
+
+    def test_copy(self):
+        copied = self.registry.freeze().copy()
+        self.assertFalse(copied.read_only)
+        self.assertNotEqual(copied.version, self.registry.version)
+        self.assertEqual(copied.get_qualities(), self.registry.get_qualities())
+        copied.set_quality("11", ("1", "3", "5", "b7", "9", "11"))
+        self.assertEqual(
+            Chord("C11", self.registry).components(), ["C", "E", "G", "Bb", "F"]
+        )
+
+    def test_manager_is_registry(self):
+        self.assertIsInstance(QualityManager(), QualityRegistry)
+        self.assertIs(QualityManager(), QualityManager())
@@ -0,0 +1,63 @@
+import unittest
+
+from pychord import Chord, ChordProgression
+from pychord.search import ProgressionIndex
+
+
+class TestProgressionIndex(unittest.TestCase):
+    def setUp(self):
+        self.progressions = [
+            ChordProgression(["C", "Dm7", "G7", "Cmaj7"]),
+            ChordProgression(["Em7", "A7", "DM7", "F"], compact=True),
+            ChordProgression(["Dm7", "G7"]),
+            ChordProgression(["C/E", "F", "G", "C/E", "F", "G"]),
+            ChordProgression(),
+        ]
+        self.index = ProgressionIndex(self.progressions)
+
+    def test_len(self):
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index.n, 3)
+
+    def test_search(self):
+        self.assertEqual(self.index.search(["Dm7", "G7", "Cmaj7"]), [(0, 1), (1, 0)])
+        self.assertEqual(self.index.search(["D/F#", "G", "A"]), [(3, 0), (3, 3)])
+        self.assertEqual(self.index.search(["C", "Dm7", "G7", "Cmaj7", "C"]), [])
+
+    def test_find(self):
+        self.assertEqual(self.index.find(["Gm7", "C7"]), [0, 1, 2])
+        self.assertEqual(self.index.find([Chord("F"), Chord("G")]), [3])
+        self.assertEqual(self.index.find(ChordProgression(["Bb", "C"])), [3])
+        self.assertEqual(self.index.find(["A#", "C/E", "F"]), [])
+        self.assertEqual(self.index.find(["C13"]), [])
+
+    def test_short_patterns(self):
+        self.assertEqual(
+            self.index.search(["F"]), [(0, 0), (1, 3), (3, 1), (3, 2), (3, 4), (3, 5)]
+        )
+        self.assertEqual(self.index.find(["Bb/D"]), [3])
+        self.assertEqual(self.index.find(["G7", "Cmaj7"]), [0, 1])
+
+    def test_pattern_at_end(self):
+        self.assertEqual(self.index.search(["C", "D", "F/A"]), [])
+        self.assertEqual(self.index.search(["G", "A", "D/F#"]), [(3, 1)])
+
+    def test_add(self):
+        self.assertEqual(
+            self.index.add(Chord(name) for name in ["Fm7", "Bb7", "Eb"]), 5
+        )
+        self.assertEqual(self.index.find(["Dm7", "G7"]), [0, 1, 2, 5])
+        self.assertEqual(self.index.find(["Cm7", "F7", "Bb"]), [5])
+
+    def test_n(self):
+        for n in [1, 2, 5]:
+            with self.subTest(n=n):
+                index = ProgressionIndex(self.progressions, n=n)
+                self.assertEqual(index.find(["Gm7", "C7"]), [0, 1, 2])
+                self.assertEqual(index.search(["C/E", "F", "G", "C/E"]), [(3, 0)])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            ProgressionIndex(n=0)
+        with self.assertRaises(ValueError):
+            self.index.search([])
@@ -0,0 +1,183 @@
+import hashlib
+import io
+import unittest
+
+from pychord import Chord, ChordProgression, QualityManager, QualityRegistry
+from pychord.constants.qualities import DEFAULT_QUALITIES
+from pychord.constants.quality_ids import SERIALIZED_QUALITIES
+from pychord.quality import MAX_INVERSION
+from pychord.serialize import (
+    MAGIC,
+    decode_chord,
+    dump,
+    dumps,
+    encode_chord,
+    load,
+    loads,
+)
+from pychord.utils import alter_code, note_to_code
+
+
+class TestEncodeChord(unittest.TestCase):
+    def test_size(self):
+        self.assertEqual(len(encode_chord(Chord("C"))), 2)
+        self.assertEqual(len(encode_chord(Chord("F#m7-5/A"))), 3)
+
+    def test_round_trip(self):
+        for name in [
+            "C",
+            "Am7/G",
+            "Cbb",
+            "F##m",
+            "C/1",
+            "Cm7/3/F",
+            "EbmM7",
+            "C7/5",
+            "C/3",
+            "Cm(no5)/3/Ab",
+            f"C/{MAX_INVERSION}",
+        ]:
+            with self.subTest(name=name):
+                self.assertLessEqual(len(encode_chord(Chord(name))), 4)
+                chord = decode_chord(encode_chord(Chord(name)))
+                self.assertEqual(chord, Chord(name))
+                self.assertEqual(chord.chord, name)
+                self.assertEqual(chord.components(), Chord(name).components())
+
+    def test_default_qualities(self):
+        for name, _ in DEFAULT_QUALITIES:
+            with self.subTest(name=name):
+                chord = decode_chord(encode_chord(Chord(f"D{name}")))
+                self.assertIs(chord.quality, QualityManager().get_quality(name))
+
+    def test_custom_quality(self):
+        registry = QualityRegistry()
+        registry.set_quality("11", ("1", "3", "5", "b7", "11"))
+        registry.set_quality("weird", ("1", "#4", "bb7", "##9"))
+        for name in ["E11", "Eweird/G#"]:
+            with self.subTest(name=name):
+                chord = Chord(name, registry)
+                decoded = decode_chord(encode_chord(chord))
+                self.assertEqual(decoded.chord, name)
+                self.assertEqual(decoded.components(), chord.components())
+                self.assertEqual(decoded.quality.intervals, chord.quality.intervals)
+        self.assertEqual(
+            decode_chord(encode_chord(Chord("E11"))).components(),
+            Chord("E11").components(),
+        )
+
+    def test_invalid(self):
+        for data in [b"", b"\x02", b"\x3f\x05", b"\x02\x7f", b"\x42\x05"]:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    decode_chord(data)
+        with self.assertRaises(ValueError):
+            decode_chord(encode_chord(Chord("C")) + b"\x00")
+
+    def test_invalid_inversion(self):
+        for inversion in [b"\x11", b"\x40", b"\xc0\x84\x3d"]:
+            with self.subTest(inversion=inversion):
+                with self.assertRaises(ValueError):
+                    decode_chord(b"\x82" + inversion + b"\x05")
+
+    def test_too_many_accidentals(self):
+        root = alter_code(note_to_code("B##"), 1)
+        with self.assertRaises(ValueError):
+            encode_chord(Chord._from_codes(root, Chord("C").quality))
+
+
+class TestSerializedQualities(unittest.TestCase):
+    # Number of ids and hash of their qualities when this test was last
+    # updated. Update them only when appending qualities.
+    COUNT = 104
+    SHA256 = "9278616376f731a6f27232b982f8ef44de9ba9bb492efc6cffc40e1425b7096a"
+
+    def test_existing_ids_unchanged(self):
+        existing = repr(SERIALIZED_QUALITIES[: self.COUNT]).encode()
+        self.assertEqual(hashlib.sha256(existing).hexdigest(), self.SHA256)
+
+    def test_default_qualities_have_ids(self):
+        for name, intervals in DEFAULT_QUALITIES:
+            with self.subTest(name=name):
+                self.assertIn((name, tuple(intervals)), SERIALIZED_QUALITIES)
+
+    def test_ids_unique(self):
+        self.assertEqual(len(set(SERIALIZED_QUALITIES)), len(SERIALIZED_QUALITIES))
+
+    def test_stored_bytes(self):
+        self.assertEqual(decode_chord(b"[\x1a\x16").chord, "Am7/G")
+        self.assertEqual(decode_chord(b"\x82\x01\x05").chord, "C/1")
+
+
+class TestDumps(unittest.TestCase):
+    def setUp(self):
+        self.names = ["C", "G/B", "Am7", "F", "C/1", "Dm7/G", "G7"]
+
+    def test_round_trip(self):
+        cp = ChordProgression(self.names)
+        loaded = loads(dumps(cp))
+        self.assertEqual(loaded, cp)
+        self.assertEqual(str(loaded), str(cp))
+
+    def test_compact(self):
+        cp = ChordProgression(self.names, compact=True)
+        data = dumps(cp)
+        self.assertEqual(data, dumps(ChordProgression(self.names)))
+        loaded = loads(data, compact=True)
+        self.assertEqual(loaded, cp)
+        self.assertEqual(str(loaded), str(cp))
+
+    def test_chords(self):
+        chords = [Chord(name) for name in self.names]
+        self.assertEqual(loads(dumps(chords)).chords, chords)
+        self.assertEqual(len(loads(dumps([]))), 0)
+        self.assertEqual(len(loads(dumps(chords * 100))), len(chords) * 100)
+
+    def test_invalid(self):
+        data = dumps(ChordProgression(self.names))
+        for invalid in [data[:-1], data[:1], data + b"\x00", b"\x01\x82\x00\x01"]:
+            with self.subTest(data=invalid):
+                with self.assertRaises(ValueError):
+                    loads(invalid)
+
+
+class TestFile(unittest.TestCase):
+    def test_round_trip(self):
+        progressions = [
+            ChordProgression(["C", "Am", "F", "G"]),
+            ChordProgression(),
+            ChordProgression(["Cmaj7"] * 100, compact=True),
+        ]
+        f = io.BytesIO()
+        self.assertEqual(dump(progressions, f), 3)
+        self.assertTrue(f.getvalue().startswith(MAGIC))
+        f.seek(0)
+        loaded = list(load(f))
+        self.assertEqual(loaded, progressions)
+        f.seek(0)
+        self.assertEqual(list(load(f, compact=True)), progressions)
+
+    def test_lazy(self):
+        f = io.BytesIO()
+        dump([ChordProgression("C")] * 3, f)
+        f.seek(0)
+        progressions = load(f)
+        self.assertEqual(next(progressions), ChordProgression("C"))
+        self.assertLess(f.tell(), len(f.getvalue()))
+
+    def test_invalid(self):
+        f = io.BytesIO()
+        dump([ChordProgression(["C", "Am"] * 100)], f)
+        data = f.getvalue()
+        for invalid in [
+            b"",
+            b"XXXX\x01",
+            MAGIC,
+            MAGIC + b"\x02",
+            data[:-1],
+            data[:6],
+            MAGIC + b"\x01\x80",
+        ]:
+            with self.subTest(data=invalid):
+                with self.assertRaises(ValueError):
+                    list(load(io.BytesIO(invalid)))
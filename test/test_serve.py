@@ -0,0 +1,226 @@
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from pychord import serve
+from pychord.parser import clear_parse_cache, parse_cache_info
+
+
+class TestHandleRequest(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(
+            serve.handle_request({"id": 1, "op": "parse", "chord": "Am7/G"}),
+            {
+                "id": 1,
+                "result": {
+                    "root": "A",
+                    "quality": "m7",
+                    "intervals": ["1", "b3", "5", "b7"],
+                    "on": "G",
+                },
+            },
+        )
+        result = serve.handle_request({"op": "parse", "chord": "C"})["result"]
+        self.assertIsNone(result["on"])
+
+    def test_components(self):
+        request = {"op": "components", "chord": "Am7"}
+        self.assertEqual(serve.handle_request(request)["result"], ["A", "C", "E", "G"])
+        request["visible"] = False
+        self.assertEqual(serve.handle_request(request)["result"], [9, 12, 16, 19])
+        request["root_pitch"] = 3
+        self.assertEqual(
+            serve.handle_request(request)["result"], ["A3", "C4", "E4", "G4"]
+        )
+
+    def test_transpose(self):
+        request = {"op": "transpose", "chord": "Am7/G", "trans": 3}
+        self.assertEqual(serve.handle_request(request)["result"], "Cm7/Bb")
+        request["scale"] = "D"
+        request["trans"] = 1
+        self.assertEqual(serve.handle_request(request)["result"], "A#m7/G#")
+
+    def test_find_chords(self):
+        request = {"op": "find_chords", "notes": ["F", "G", "C"]}
+        self.assertEqual(serve.handle_request(request)["result"], ["Fsus2", "Csus4/F"])
+        request["notes"] = ["E", "C", "A", "G"]
+        request["ordered"] = False
+        self.assertEqual(serve.handle_request(request)["result"], ["C6/E", "Am7/E"])
+
+    def test_errors(self):
+        for request, error in [
+            ([], "Request must be an object"),
+            ({"op": "play"}, "Unknown op play"),
+            ({"op": ["parse"]}, "Unknown op ['parse']"),
+            ({"op": "parse"}, "Missing argument 'chord'"),
+            ({"op": "parse", "chord": "H"}, "Invalid note H"),
+            ({"op": "parse", "chord": "C/100000000"}, "Invalid inversion 100000000"),
+            ({"op": "transpose", "chord": "C", "trans": "1"}, None),
+            ({"op": "transpose", "chord": "C"}, "Missing argument 'trans'"),
+            (
+                {"op": "transpose", "chord": "C", "trans": 1, "scale": "H"},
+                "Invalid scale H",
+            ),
+            ({"op": "transpose", "chord": "C", "trans": 1, "scale": []}, None),
+        ]:
+            with self.subTest(request=request):
+                response = serve.handle_request(request)
+                self.assertNotIn("result", response)
+                if error is not None:
+                    self.assertEqual(response["error"], error)
+
+    def test_handle_line(self):
+        self.assertEqual(
+            serve.handle_line(
+                b'{"id": "a", "op": "transpose", "chord": "C", "trans": 2}'
+            ),
+            b'{"id":"a","result":"D"}\n',
+        )
+        response = json.loads(
+            serve.handle_line(b'[{"op": "parse", "chord": "C"}, {"op": "x"}]')
+        )
+        self.assertEqual(len(response), 2)
+        self.assertIn("error", response[1])
+        self.assertIn("Invalid JSON", json.loads(serve.handle_line(b"{"))["error"])
+        self.assertIn(
+            "Invalid JSON", json.loads(serve.handle_line(b"[" * 100000))["error"]
+        )
+
+    def test_warm_up(self):
+        clear_parse_cache()
+        serve.warm_up()
+        self.assertGreater(parse_cache_info().currsize, 1000)
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    async def request_lines(self, reader, writer, lines):
+        writer.write(b"".join(line + b"\n" for line in lines))
+        await writer.drain()
+        return [json.loads(await reader.readline()) for _ in lines]
+
+    async def test_tcp_pipelining(self):
+        server = await serve.start_server(port=0)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            requests = [
+                json.dumps({"id": i, "op": "transpose", "chord": "C", "trans": i})
+                for i in range(12)
+            ]
+            responses = await self.request_lines(
+                reader, writer, [r.encode() for r in requests]
+            )
+            self.assertEqual([r["id"] for r in responses], list(range(12)))
+            self.assertEqual(responses[2]["result"], "D")
+            writer.close()
+            await writer.wait_closed()
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires Unix sockets")
+    async def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pychord.sock")
+            server = await serve.start_server(path=path)
+            async with server:
+                reader, writer = await asyncio.open_unix_connection(path)
+                responses = await self.request_lines(
+                    reader, writer, [b'{"op": "find_chords", "notes": ["C", "E", "G"]}']
+                )
+                self.assertEqual(responses, [{"result": ["C"]}])
+                writer.close()
+                await writer.wait_closed()
+
+    async def test_blank_lines_and_partial_requests(self):
+        server = await serve.start_server(port=0)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'\n{"op": "parse", ')
+            await writer.drain()
+            writer.write(b'"chord": "C"}\n')
+            response = json.loads(await reader.readline())
+            self.assertEqual(response["result"]["root"], "C")
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_request_too_long(self):
+        server = await serve.start_server(port=0)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            with mock.patch.object(serve, "MAX_LINE_LENGTH", 10):
+                writer.write(b'{"op": "parse", "chord": "C"')
+                await writer.drain()
+                response = json.loads(await reader.readline())
+                self.assertEqual(response, {"error": "Request too long"})
+                self.assertEqual(await reader.read(), b"")
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_slow_request(self):
+        done = threading.Event()
+
+        def wait_op(request):
+            done.wait(10)
+            return "done"
+
+        server = await serve.start_server(port=0)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            slow = await asyncio.open_connection("127.0.0.1", port)
+            fast = await asyncio.open_connection("127.0.0.1", port)
+            try:
+                with mock.patch.dict(serve.OPERATIONS, {"wait": wait_op}):
+                    slow[1].write(b'{"op": "wait"}\n')
+                    await slow[1].drain()
+                    # Answered while the other connection waits
+                    responses = await asyncio.wait_for(
+                        self.request_lines(*fast, [b'{"op": "parse", "chord": "C"}']),
+                        5,
+                    )
+                    self.assertEqual(responses[0]["result"]["root"], "C")
+                    done.set()
+                    self.assertEqual(
+                        json.loads(await slow[0].readline()), {"result": "done"}
+                    )
+            finally:
+                done.set()
+                for _, writer in (slow, fast):
+                    writer.close()
+                    await writer.wait_closed()
+
+    async def test_connection_reset(self):
+        reader = mock.AsyncMock(spec=asyncio.StreamReader)
+        reader.read.side_effect = ConnectionResetError
+        writer = mock.Mock(spec=asyncio.StreamWriter)
+        await serve.handle_connection(reader, writer)
+        writer.close.assert_called_once_with()
+
+    async def test_serve(self):
+        serve_forever = mock.AsyncMock()
+        with (
+            mock.patch.object(serve, "warm_up") as warm_up,
+            mock.patch.object(asyncio.Server, "serve_forever", serve_forever),
+        ):
+            await serve.serve(port=0)
+        warm_up.assert_called_once_with()
+        serve_forever.assert_awaited_once_with()
+
+
+class TestMain(unittest.TestCase):
+    def test_main(self):
+        with mock.patch.object(serve, "serve", mock.AsyncMock()) as run:
+            self.assertEqual(serve.main(["--unix", "/tmp/x.sock", "--no-warm"]), 0)
+        run.assert_awaited_once_with(
+            serve.DEFAULT_HOST, serve.DEFAULT_PORT, "/tmp/x.sock", False
+        )
+
+    def test_interrupted(self):
+        with mock.patch.object(
+            serve, "serve", mock.AsyncMock(side_effect=KeyboardInterrupt)
+        ):
+            self.assertEqual(serve.main([]), 0)
@@ -0,0 +1,161 @@
+import random
+import re
+import unittest
+from unittest import mock
+
+from pychord import Chord, QualityRegistry, find_chords_from_notes
+from pychord.tracker import ChordTracker
+
+
+class TestChordTracker(unittest.TestCase):
+    def test_note_on_off(self):
+        tracker = ChordTracker()
+        self.assertIsNone(tracker.note_on(60))
+        self.assertEqual(tracker.note_on(64), [Chord("Cno5")])
+        self.assertEqual(tracker.note_on(67), [Chord("C")])
+        self.assertEqual(tracker.note_off(64), [Chord("C5")])
+        self.assertEqual(tracker.note_on(63), [Chord("Cm")])
+        self.assertEqual(tracker.chords, [Chord("Cm")])
+        self.assertEqual(tracker.notes, ["C4", "Eb4", "G4"])
+        self.assertEqual(tracker.note_off(60), [Chord("Ebno5")])
+        self.assertEqual(tracker.reset(), [])
+        self.assertEqual(tracker.notes, [])
+
+    def test_same_as_find_chords(self):
+        tracker = ChordTracker()
+        for note in ["G3", "B3", "D4", "F4"]:
+            tracker.note_on(note)
+        self.assertEqual(
+            tracker.chords, find_chords_from_notes(["G", "B", "D", "F"], ordered=False)
+        )
+        self.assertEqual([c.chord for c in tracker.chords], ["G7"])
+
+    def test_same_as_find_chords_random(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            tracker = ChordTracker()
+            for _ in range(12):
+                pitch = rng.randrange(48, 73)
+                if rng.random() < 0.3:
+                    tracker.note_off(pitch)
+                else:
+                    tracker.note_on(pitch)
+                names = [re.sub(r"-?\d+$", "", note) for note in tracker.notes]
+                expected = find_chords_from_notes(names, ordered=False) if names else []
+                self.assertEqual(tracker.chords, expected)
+
+    def test_spelling_change(self):
+        tracker = ChordTracker()
+        for note in ["C4", "E4", "G4", "A#4"]:
+            tracker.note_on(note)
+        self.assertEqual([c.chord for c in tracker.chords], ["C7"])
+        tracker.note_on("Bb3")
+        tracker.note_off("A#4")
+        self.assertEqual(
+            tracker.chords,
+            find_chords_from_notes(["Bb", "C", "E", "G"], ordered=False),
+        )
+
+    def test_note_names(self):
+        tracker = ChordTracker()
+        for note in ["F#3", "A", "C#5"]:
+            tracker.note_on(note)
+        self.assertEqual(tracker.notes, ["F#3", "A4", "C#5"])
+        self.assertEqual([c.chord for c in tracker.chords], ["F#m"])
+        tracker.note_on("Cb4")
+        self.assertEqual(tracker.notes, ["F#3", "Cb4", "A4", "C#5"])
+        tracker.note_off(59)
+        self.assertEqual(tracker.notes, ["F#3", "A4", "C#5"])
+
+    def test_key(self):
+        tracker = ChordTracker(key="Eb")
+        for note in [63, 67, 70]:
+            tracker.note_on(note)
+        self.assertEqual([c.chord for c in tracker.chords], ["Eb"])
+
+    def test_bass_change(self):
+        tracker = ChordTracker()
+        for note in ["C4", "E4", "G4"]:
+            tracker.note_on(note)
+        self.assertEqual(tracker.note_on("E3"), [Chord("C/E")])
+        self.assertIsNone(tracker.note_on("C5"))
+        self.assertIsNone(tracker.note_off("C4"))
+
+    def test_lookup_only_on_change(self):
+        registry = QualityRegistry()
+        tracker = ChordTracker(registry=registry)
+        with mock.patch.object(
+            registry,
+            "find_qualities_from_mask",
+            wraps=registry.find_qualities_from_mask,
+        ) as find:
+            for note in [48, 52, 55, 60, 64]:
+                tracker.note_on(note)
+            tracker.note_on(60)
+            tracker.note_off(64)
+            tracker.note_off(60)
+        self.assertEqual(find.call_count, 3)
+        self.assertEqual(tracker.chords, [Chord("C")])
+
+    def test_on_change(self):
+        changes = []
+        tracker = ChordTracker(on_change=changes.append)
+        for note in [60, 64, 67]:
+            tracker.note_on(note)
+        tracker.note_off(67)
+        self.assertEqual(changes, [[Chord("Cno5")], [Chord("C")], [Chord("Cno5")]])
+
+    def test_debounce(self):
+        changes = []
+        tracker = ChordTracker(on_change=changes.append, debounce=0.05)
+        self.assertIsNone(tracker.note_on(60, 0.0))
+        self.assertIsNone(tracker.note_on(64, 0.01))
+        self.assertIsNone(tracker.note_on(67, 0.02))
+        self.assertIsNone(tracker.poll(0.06))
+        self.assertEqual(tracker.poll(0.07), [Chord("C")])
+        self.assertIsNone(tracker.poll(0.08))
+        self.assertEqual(changes, [[Chord("C")]])
+
+    def test_debounce_on_next_event(self):
+        tracker = ChordTracker(debounce=0.05)
+        for note in [60, 64, 67]:
+            tracker.note_on(note, 0.0)
+        self.assertEqual(tracker.note_on(72, 1.0), [Chord("C")])
+        self.assertEqual(tracker.chords, [Chord("C")])
+
+    def test_debounce_bounce_back(self):
+        tracker = ChordTracker(debounce=0.05)
+        for note in [60, 64, 67]:
+            tracker.note_on(note, 0.0)
+        tracker.poll(1.0)
+        tracker.note_off(67, 1.01)
+        tracker.note_on(67, 1.02)
+        self.assertIsNone(tracker.poll(2.0))
+        self.assertEqual(tracker.chords, [Chord("C")])
+
+    def test_default_timestamp(self):
+        tracker = ChordTracker(debounce=1000)
+        tracker.note_on(60)
+        tracker.note_on(64)
+        self.assertIsNone(tracker.poll())
+        self.assertEqual(tracker.chords, [])
+
+    def test_ignored_events(self):
+        tracker = ChordTracker()
+        tracker.note_on(60)
+        self.assertIsNone(tracker.note_on("C4"))
+        self.assertIsNone(tracker.note_off(61))
+        self.assertEqual(tracker.notes, ["C4"])
+
+    def test_invalid(self):
+        tracker = ChordTracker()
+        for note in [-1, 128, "H4", "C#x", "C-3", "C99", "Cb-1", "G#9"]:
+            with self.subTest(note=note):
+                with self.assertRaises(ValueError):
+                    tracker.note_on(note)
+        for note in ["C-1", "G9"]:
+            with self.subTest(note=note):
+                tracker.note_on(note)
+        self.assertEqual(tracker.notes, ["C-1", "G9"])
+        with self.assertRaises(ValueError):
+            ChordTracker(debounce=-1)
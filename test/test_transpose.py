@@ -31,7 +31,7 @@ class TestChordTranspose(unittest.TestCase):
         self.assertEqual(c.root, "C")
         self.assertEqual(c.quality.quality, "m7")
         self.assertEqual(c.on, "Bb")
-        self.assertEqual(c._chord, Chord("Cm7/Bb")._chord)
+        self.assertEqual(c.chord, Chord("Cm7/Bb").chord)
         self.assertEqual(c.quality.components, Chord("Cm7/Bb").quality.components)
         self.assertEqual(c, Chord("Cm7/Bb"))
 
@@ -40,6 +40,8 @@ class TestChordTranspose(unittest.TestCase):
         c.transpose(3)
         self.assertEqual(c.root, "C")
         self.assertEqual(c.quality.quality, "m7")
+        self.assertEqual(c.chord, "Cm7/3")
+        self.assertEqual(Chord("Am7/3/G").transposed(3).chord, "Cm7/3/Bb")
 
     def test_invalid_transpose_type(self):
         c = Chord("Am")
@@ -55,3 +57,23 @@ class TestChordTranspose(unittest.TestCase):
         c = Chord("C")
         c.transpose(2)
         self.assertEqual(c, Chord("D"))
+
+    def test_transpose_name(self):
+        c = Chord("Am7/G")
+        c.transpose(3)
+        self.assertEqual(str(c), "Cm7/Bb")
+        self.assertEqual(repr(c), "<Chord: Cm7/Bb>")
+        c.transpose(-1, "A")
+        self.assertEqual(c.chord, "Bm7/A")
+
+    def test_transposed(self):
+        c = Chord("Am7/G")
+        t = c.transposed(3)
+        self.assertEqual(str(c), "Am7/G")
+        self.assertEqual(str(t), "Cm7/Bb")
+        self.assertIs(t.quality, c.quality)
+        self.assertEqual(str(Chord("C").transposed(6, "G")), "F#")
+        self.assertEqual(str(Chord("C").transposed(-6)), "Gb")
+
+    def test_invalid_transposed_type(self):
+        self.assertRaises(TypeError, Chord("Am").transposed, "A")
@@ -1,6 +1,18 @@
 import unittest
 
-from pychord.utils import augment, diminish, note_to_val
+from pychord.utils import (
+    alter_code,
+    augment,
+    code_accidental,
+    code_letter,
+    code_to_note,
+    code_to_val,
+    diminish,
+    note_to_code,
+    note_to_val,
+    transpose_code,
+    transpose_note,
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -16,7 +28,54 @@ class TestUtils(unittest.TestCase):
 
     def test_note_to_val(self):
         self.assertEqual(note_to_val("C"), 0)
+        self.assertEqual(note_to_val("Cb"), 11)
+        self.assertEqual(note_to_val("C###"), 3)
+        self.assertEqual(note_to_val("Cbbb"), 9)
 
     def test_note_to_val_invalid(self):
         with self.assertRaises(ValueError):
             note_to_val("X")
+
+    def test_transpose_note(self):
+        self.assertEqual(transpose_note("C", 1), "Db")
+        self.assertEqual(transpose_note("D", 4, "A"), "F#")
+
+
+class TestNoteCode(unittest.TestCase):
+    def test_round_trip(self):
+        for note, val, letter, accidental in [
+            ("C", 0, 0, 0),
+            ("Cb", 11, 0, -1),
+            ("F#", 6, 3, 1),
+            ("Ebb", 2, 2, -2),
+            ("B##", 1, 6, 2),
+        ]:
+            with self.subTest(note=note):
+                code = note_to_code(note)
+                self.assertEqual(code_to_note(code), note)
+                self.assertEqual(code_to_val(code), val)
+                self.assertEqual(code_letter(code), letter)
+                self.assertEqual(code_accidental(code), accidental)
+
+    def test_invalid(self):
+        for note in ["", "H", "Cbbb", "C#b", "c"]:
+            with self.subTest(note=note):
+                with self.assertRaises(ValueError):
+                    note_to_code(note)
+
+    def test_alter_code(self):
+        self.assertEqual(code_to_note(alter_code(note_to_code("Ebb"), -1)), "Ebbb")
+        self.assertEqual(code_to_note(alter_code(note_to_code("Cb"), 2)), "C#")
+
+    def test_transpose_code(self):
+        for note, trans, scale, expected in [
+            ("C", 1, "C", "Db"),
+            ("D", 4, "A", "F#"),
+            ("A", -4, "C", "F"),
+            ("B#", 0, "G", "C"),
+        ]:
+            with self.subTest(note=note, trans=trans, scale=scale):
+                code = note_to_code(note)
+                self.assertEqual(
+                    code_to_note(transpose_code(code, trans, scale)), expected
+                )
@@ -0,0 +1,91 @@
+"""
+Generate pychord/constants/quality_table.py from DEFAULT_QUALITIES, and
+append new default qualities to pychord/constants/quality_ids.py.
+
+Run from the repository root after changing the default qualities::
+
+    python tools/generate_quality_table.py          # rewrite the tables
+    python tools/generate_quality_table.py --check  # fail if one is outdated
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from pychord.constants.qualities import DEFAULT_QUALITIES  # noqa: E402
+from pychord.constants.quality_ids import SERIALIZED_QUALITIES  # noqa: E402
+from pychord.quality import _get_interval_entry  # noqa: E402
+
+PATH = os.path.join(ROOT, "pychord", "constants", "quality_table.py")
+IDS_PATH = os.path.join(ROOT, "pychord", "constants", "quality_ids.py")
+
+HEADER = """\
+# Generated by tools/generate_quality_table.py from DEFAULT_QUALITIES.
+# Do not edit by hand.
+# fmt: off
+
+# (name, intervals, (alteration, degree offset, pitch) of each interval)
+DEFAULT_QUALITY_TABLE: tuple[
+    tuple[str, tuple[str, ...], tuple[tuple[int, int, int], ...]], ...
+] = (
+"""
+
+
+IDS_HEADER = """\
+# Ids of the qualities in the binary format of pychord.serialize, which
+# are their positions in SERIALIZED_QUALITIES. Encoded chords refer to
+# them, so entries must never be moved, changed or removed: new default
+# qualities are appended by tools/generate_quality_table.py.
+# fmt: off
+
+# (name, intervals)
+SERIALIZED_QUALITIES: tuple[tuple[str, tuple[str, ...]], ...] = (
+"""
+
+
+def generate() -> str:
+    lines = [HEADER]
+    for name, intervals in DEFAULT_QUALITIES:
+        table = tuple(_get_interval_entry(i) for i in intervals)
+        lines.append(f"    ({name!r}, {tuple(intervals)!r}, {table!r}),\n")
+    lines.append(")\n")
+    return "".join(lines)
+
+
+def generate_ids() -> str:
+    qualities = list(SERIALIZED_QUALITIES)
+    for name, intervals in DEFAULT_QUALITIES:
+        if (name, tuple(intervals)) not in qualities:
+            qualities.append((name, tuple(intervals)))
+    lines = [IDS_HEADER]
+    for name, intervals in qualities:
+        lines.append(f"    ({name!r}, {intervals!r}),\n")
+    lines.append(")\n")
+    return "".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--check", action="store_true", help="only check the table")
+    args = parser.parse_args()
+
+    sources = {PATH: generate(), IDS_PATH: generate_ids()}
+    if args.check:
+        outdated = False
+        for path, source in sources.items():
+            with open(path) as f:
+                if f.read() != source:
+                    print(f"{path} is outdated, run {sys.argv[0]}")
+                    outdated = True
+        return 1 if outdated else 0
+    for path, source in sources.items():
+        with open(path, "w") as f:
+            f.write(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())